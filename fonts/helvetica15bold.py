@@ -1,3 +1,4 @@
+from array import array
 version = '0.33'
 name = '-adobe-helvetica-bold-r-normal--14-100-100-100-p-82-iso10646-1'
 family = 'helvetica'
@@ -28,106 +29,122 @@ def min_ch():
 def max_ch():
     return 126
 
-_g = {
-  32:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04',
-  33:b'\x00``````@@\x00``\x00\x00\x00\x04',
-  34:b'\x00llH\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07',
-  35:b'\x00\x00\x00\x00\x1b\x00\x1b\x00\x1b\x00\x7f\x806\x006\x00\xff\x00l\x00l\x00l\x00\x00\x00\x00\x00\x00\x00\t',
-  36:b'\x10|\xd6\xd6\xd0\xf0x\x1c\x16\xd6\xd6|\x10\x10\x00\x08',
-  37:b'\x00\x00x@\xcc\xc0\xcd\x80y\x00\x03\x00\x06\x00\x04\x00\r\xe0\x0b0\x1b0\x11\xe0\x00\x00\x00\x00\x00\x00\r',
-  38:b'\x00\x00\x00\x00\x1c\x006\x006\x00\x1c\x009\x80}\x80g\x00c\x00g\x80>\xc0\x00\x00\x00\x00\x00\x00\x0b',
-  39:b'\x00``@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04',
-  40:b'\x00\x1800````````00\x18\x05',
-  41:b'\x00\xc0``00000000``\xc0\x05',
-  42:b'\x00 \xf8p\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06',
-  43:b'\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x00\xff\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\t',
-  44:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``\xc0\x00\x00\x04',
-  45:b'\x00\x00\x00\x00\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x00\x00\x04',
-  46:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``\x00\x00\x00\x04',
-  47:b'\x00\x10\x100  `@@\xc0\x80\x80\x00\x00\x00\x04',
-  48:b'\x008l\xc6\xc6\xc6\xc6\xc6\xc6\xc6l8\x00\x00\x00\x08',
-  49:b'\x00\x18x\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00\x08',
-  50:b'\x00|\xc6\xc6\x06\x0e\x0c\x180`\xc0\xfe\x00\x00\x00\x08',
-  51:b'\x00|\xc6\xc6\x06\x06<\x06\x06\xc6\xc6|\x00\x00\x00\x08',
-  52:b'\x00\x06\x0e\x1e6f\xc6\xc6\xff\x06\x06\x06\x00\x00\x00\x08',
-  53:b'\x00~``\xc0\xfc\x0e\x06\x06\xc6\xccx\x00\x00\x00\x08',
-  54:b'\x00<ff\xc0\xdc\xe6\xc6\xc6\xc6\xc6|\x00\x00\x00\x08',
-  55:b'\x00\xfe\x06\x0c\x0c\x18\x1800```\x00\x00\x00\x08',
-  56:b'\x00|\xc6\xc6\xc6\xc6|\xc6\xc6\xc6\xc6|\x00\x00\x00\x08',
-  57:b'\x00|\xc6\xc6\xc6\xc6\xc6~\x06\xc6\xccx\x00\x00\x00\x08',
-  58:b'\x00\x00\x00\x0000\x00\x00\x00\x0000\x00\x00\x00\x05',
-  59:b'\x00\x00\x00\x0000\x00\x00\x00\x0000`\x00\x00\x05',
-  60:b'\x00\x00\x00\x00\x00\x0e8`8\x0e\x00\x00\x00\x00\x00\x08',
-  61:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t',
-  62:b'\x00\x00\x00\x00\x00p\x1c\x06\x1cp\x00\x00\x00\x00\x00\x08',
-  63:b'\x00\x00>\x00c\x00c\x00\x03\x00\x06\x00\x0c\x00\x18\x00\x18\x00\x00\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\t',
-  64:b'\x00\x00\x0f\x808\xe0ppf\xb0\xcd\x98\xd9\x98\xdb\x18\xdb0\xce\xe0`\x001\x80\x1f\x00\x00\x00\x00\x00\x0e',
-  65:b'\x00\x00\x0c\x00\x0c\x00\x1e\x00\x12\x003\x003\x00a\x80\x7f\x80a\x80\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x00\x00\n',
-  66:b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x00~\x00c\x00a\x80a\x80c\x80\x7f\x00\x00\x00\x00\x00\x00\x00\n',
-  67:b'\x00\x00\x0f\x80=\xc00@`\x00`\x00`\x00`\x00`\x000@=\xc0\x0f\x80\x00\x00\x00\x00\x00\x00\x0b',
-  68:b'\x00\x00~\x00c\x80a\x80`\xc0`\xc0`\xc0`\xc0`\xc0a\x80c\x80~\x00\x00\x00\x00\x00\x00\x00\x0b',
-  69:b'\x00\x00\x7f\x00`\x00`\x00`\x00`\x00\x7f\x00`\x00`\x00`\x00`\x00\x7f\x00\x00\x00\x00\x00\x00\x00\t',
-  70:b'\x00\x00\x7f\x00`\x00`\x00`\x00`\x00~\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\t',
-  71:b'\x00\x00\x0f\x80=\xc00@`\x00`\x00c\xc0`\xc0`\xc00\xc0=\xc0\x0f@\x00\x00\x00\x00\x00\x00\x0b',
-  72:b'\x00\x00a\x80a\x80a\x80a\x80a\x80\x7f\x80a\x80a\x80a\x80a\x80a\x80\x00\x00\x00\x00\x00\x00\n',
-  73:b'\x00```````````\x00\x00\x00\x04',
-  74:b'\x00\x06\x06\x06\x06\x06\x06\x06\xc6\xc6\xee|\x00\x00\x00\x08',
-  75:b'\x00\x00a\x80c\x00f\x00l\x00x\x00x\x00l\x00f\x00c\x00a\x80`\xc0\x00\x00\x00\x00\x00\x00\n',
-  76:b'\x00``````````\x7f\x00\x00\x00\x08',
-  77:b'\x00\x00`0`0ppppx\xf0h\xb0h\xb0m\xb0e0g0b0\x00\x00\x00\x00\x00\x00\r',
-  78:b'\x00\x00`\xc0p\xc0p\xc0h\xc0l\xc0d\xc0f\xc0b\xc0a\xc0a\xc0`\xc0\x00\x00\x00\x00\x00\x00\x0b',
-  79:b'\x00\x00\x0f\x009\xc00\xc0``````````0\xc09\xc0\x0f\x00\x00\x00\x00\x00\x00\x00\x0c',
-  80:b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x80\x7f\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\n',
-  81:b'\x00\x00\x0f\x009\xc00\xc0````````c`1\xc09\xc0\x0f`\x00\x00\x00\x00\x00\x00\x0c',
-  82:b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x00\x7f\x00c\x80a\x80a\x80a\x80`\xc0\x00\x00\x00\x00\x00\x00\x0b',
-  83:b'\x00\x00?\x00s\x80a\x80p\x00<\x00\x0f\x00\x03\x80\x01\x80a\x80w\x00>\x00\x00\x00\x00\x00\x00\x00\n',
-  84:b'\x00\xff\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00\x08',
-  85:b'\x00\x00`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc01\x80\x1f\x00\x00\x00\x00\x00\x00\x00\x0b',
-  86:b'\x00\x00\xc0\xc0\xc0\xc0a\x80a\x80s\x803\x003\x00\x1e\x00\x1e\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\n',
-  87:b'\x00\x00\xc3\x0c\xc3\x0c\xc3\x0cg\x98d\x98d\x98l\xd8,\xd08p\x18`\x18`\x00\x00\x00\x00\x00\x00\x0e',
-  88:b'\x00\x00\xc1\x80\xc1\x80c\x006\x00\x1c\x00\x1c\x006\x00c\x00c\x00\xc1\x80\xc1\x80\x00\x00\x00\x00\x00\x00\t',
-  89:b'\x00\x00\xc0\xc0a\x80a\x803\x003\x00\x1e\x00\x1e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\n',
-  90:b'\x00\x00\xff\x00\x03\x00\x06\x00\x0c\x00\x1c\x00\x18\x000\x00p\x00`\x00\xc0\x00\xff\x00\x00\x00\x00\x00\x00\x00\t',
-  91:b'\x00x````````````x\x05',
-  92:b'\x00\x80\x80\xc0@@`  0\x10\x10\x00\x00\x00\x04',
-  93:b'\x00\xf0000000000000\xf0\x05',
-  94:b'\x00\x18<$ff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08',
-  95:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x08',
-  96:b'\x00`0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05',
-  97:b'\x00\x00\x00\x00<f\x06>ffn;\x00\x00\x00\x08',
-  98:b'\x00\x00`\x00`\x00`\x00l\x00v\x00c\x00c\x00c\x00c\x00v\x00l\x00\x00\x00\x00\x00\x00\x00\t',
-  99:b'\x00\x00\x00\x00\x1c6f``f6\x1c\x00\x00\x00\x08',
-  100:b'\x00\x00\x03\x00\x03\x00\x03\x00\x1b\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x00\x00\x00\x00\x00\x00\t',
-  101:b'\x00\x00\x00\x00<ff~``v<\x00\x00\x00\x08',
-  102:b'\x008``\xf0```````\x00\x00\x00\x05',
-  103:b'\x00\x00\x00\x00\x00\x00\x00\x00\x1d\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x03\x00g\x00>\x00\t',
-  104:b'\x00\x00`\x00`\x00`\x00n\x00w\x00c\x00c\x00c\x00c\x00c\x00c\x00\x00\x00\x00\x00\x00\x00\t',
-  105:b'\x00``\x00````````\x00\x00\x00\x04',
-  106:b'\x00``\x00`````````\xe0\xc0\x04',
-  107:b'\x00```flxxllff\x00\x00\x00\x08',
-  108:b'\x00```````````\x00\x00\x00\x04',
-  109:b'\x00\x00\x00\x00\x00\x00\x00\x00m\xc0w`f`f`f`f`f`f`\x00\x00\x00\x00\x00\x00\x0c',
-  110:b'\x00\x00\x00\x00\x00\x00\x00\x00n\x00w\x00c\x00c\x00c\x00c\x00c\x00c\x00\x00\x00\x00\x00\x00\x00\t',
-  111:b'\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x006\x00c\x00c\x00c\x00c\x006\x00\x1c\x00\x00\x00\x00\x00\x00\x00\t',
-  112:b'\x00\x00\x00\x00\x00\x00\x00\x00l\x00v\x00c\x00c\x00c\x00c\x00v\x00l\x00`\x00`\x00`\x00\t',
-  113:b'\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x03\x00\x03\x00\x03\x00\t',
-  114:b'\x00\x00\x00\x00l|``````\x00\x00\x00\x06',
-  115:b'\x00\x00\x00\x00<fp<\x0e\x06v<\x00\x00\x00\x08',
-  116:b'\x00\x00``\xf8`````h0\x00\x00\x00\x05',
-  117:b'\x00\x00\x00\x00\x00\x00\x00\x00c\x00c\x00c\x00c\x00c\x00c\x00w\x00;\x00\x00\x00\x00\x00\x00\x00\t',
-  118:b'\x00\x00\x00\x00\xc3\xc3ff$<\x18\x18\x00\x00\x00\x08',
-  119:b'\x00\x00\x00\x00\x00\x00\x00\x00\xcc\xc0\xcc\xc0\xcc\xc0m\x80m\x803\x003\x003\x00\x00\x00\x00\x00\x00\x00\n',
-  120:b'\x00\x00\x00\x00\xc6\xc6l88l\xc6\xc6\x00\x00\x00\x07',
-  121:b'\x00\x00\x00\x00\xc3\xc3ff$<\x18\x18\x180p\x08',
-  122:b'\x00\x00\x00\x00\xfc\x0c\x1800`\xc0\xfc\x00\x00\x00\x06',
-  123:b'\x00\x180000`\xc0`00000\x18\x06',
-  124:b'\x00              \x04',
-  125:b'\x00`0000\x18\x0c\x1800000`\x06',
-  126:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x009\x00o\x00F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\t',
-}
+# Glyph table generated by tools/compact_fonts.py: the MONO_HLSB rows of every
+# glyph back to back in _data; glyph c spans _data[_index[c - 32]:_index[c - 31]],
+# an empty span means no glyph.
+_data = (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 32
+  b'\x00``````@@\x00``\x00\x00\x00'  # 33 !
+  b'\x00llH\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 34 "
+  b'\x00\x00\x00\x00\x1b\x00\x1b\x00\x1b\x00\x7f\x806\x006\x00\xff\x00l\x00l\x00l\x00\x00\x00\x00\x00\x00\x00'  # 35 #
+  b'\x10|\xd6\xd6\xd0\xf0x\x1c\x16\xd6\xd6|\x10\x10\x00'  # 36 $
+  b'\x00\x00x@\xcc\xc0\xcd\x80y\x00\x03\x00\x06\x00\x04\x00\r\xe0\x0b0\x1b0\x11\xe0\x00\x00\x00\x00\x00\x00'  # 37 %
+  b'\x00\x00\x00\x00\x1c\x006\x006\x00\x1c\x009\x80}\x80g\x00c\x00g\x80>\xc0\x00\x00\x00\x00\x00\x00'  # 38 &
+  b'\x00``@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 39 '
+  b'\x00\x1800````````00\x18'  # 40 (
+  b'\x00\xc0``00000000``\xc0'  # 41 )
+  b'\x00 \xf8p\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 42 *
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x00\xff\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 43 +
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``\xc0\x00\x00'  # 44 ,
+  b'\x00\x00\x00\x00\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x00\x00'  # 45 -
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``\x00\x00\x00'  # 46 .
+  b'\x00\x10\x100  `@@\xc0\x80\x80\x00\x00\x00'  # 47 /
+  b'\x008l\xc6\xc6\xc6\xc6\xc6\xc6\xc6l8\x00\x00\x00'  # 48 0
+  b'\x00\x18x\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00'  # 49 1
+  b'\x00|\xc6\xc6\x06\x0e\x0c\x180`\xc0\xfe\x00\x00\x00'  # 50 2
+  b'\x00|\xc6\xc6\x06\x06<\x06\x06\xc6\xc6|\x00\x00\x00'  # 51 3
+  b'\x00\x06\x0e\x1e6f\xc6\xc6\xff\x06\x06\x06\x00\x00\x00'  # 52 4
+  b'\x00~``\xc0\xfc\x0e\x06\x06\xc6\xccx\x00\x00\x00'  # 53 5
+  b'\x00<ff\xc0\xdc\xe6\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 54 6
+  b'\x00\xfe\x06\x0c\x0c\x18\x1800```\x00\x00\x00'  # 55 7
+  b'\x00|\xc6\xc6\xc6\xc6|\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 56 8
+  b'\x00|\xc6\xc6\xc6\xc6\xc6~\x06\xc6\xccx\x00\x00\x00'  # 57 9
+  b'\x00\x00\x00\x0000\x00\x00\x00\x0000\x00\x00\x00'  # 58 :
+  b'\x00\x00\x00\x0000\x00\x00\x00\x0000`\x00\x00'  # 59 ;
+  b'\x00\x00\x00\x00\x00\x0e8`8\x0e\x00\x00\x00\x00\x00'  # 60 <
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 61 =
+  b'\x00\x00\x00\x00\x00p\x1c\x06\x1cp\x00\x00\x00\x00\x00'  # 62 >
+  b'\x00\x00>\x00c\x00c\x00\x03\x00\x06\x00\x0c\x00\x18\x00\x18\x00\x00\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00'  # 63 ?
+  b'\x00\x00\x0f\x808\xe0ppf\xb0\xcd\x98\xd9\x98\xdb\x18\xdb0\xce\xe0`\x001\x80\x1f\x00\x00\x00\x00\x00'  # 64 @
+  b'\x00\x00\x0c\x00\x0c\x00\x1e\x00\x12\x003\x003\x00a\x80\x7f\x80a\x80\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x00\x00'  # 65 A
+  b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x00~\x00c\x00a\x80a\x80c\x80\x7f\x00\x00\x00\x00\x00\x00\x00'  # 66 B
+  b'\x00\x00\x0f\x80=\xc00@`\x00`\x00`\x00`\x00`\x000@=\xc0\x0f\x80\x00\x00\x00\x00\x00\x00'  # 67 C
+  b'\x00\x00~\x00c\x80a\x80`\xc0`\xc0`\xc0`\xc0`\xc0a\x80c\x80~\x00\x00\x00\x00\x00\x00\x00'  # 68 D
+  b'\x00\x00\x7f\x00`\x00`\x00`\x00`\x00\x7f\x00`\x00`\x00`\x00`\x00\x7f\x00\x00\x00\x00\x00\x00\x00'  # 69 E
+  b'\x00\x00\x7f\x00`\x00`\x00`\x00`\x00~\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00'  # 70 F
+  b'\x00\x00\x0f\x80=\xc00@`\x00`\x00c\xc0`\xc0`\xc00\xc0=\xc0\x0f@\x00\x00\x00\x00\x00\x00'  # 71 G
+  b'\x00\x00a\x80a\x80a\x80a\x80a\x80\x7f\x80a\x80a\x80a\x80a\x80a\x80\x00\x00\x00\x00\x00\x00'  # 72 H
+  b'\x00```````````\x00\x00\x00'  # 73 I
+  b'\x00\x06\x06\x06\x06\x06\x06\x06\xc6\xc6\xee|\x00\x00\x00'  # 74 J
+  b'\x00\x00a\x80c\x00f\x00l\x00x\x00x\x00l\x00f\x00c\x00a\x80`\xc0\x00\x00\x00\x00\x00\x00'  # 75 K
+  b'\x00``````````\x7f\x00\x00\x00'  # 76 L
+  b'\x00\x00`0`0ppppx\xf0h\xb0h\xb0m\xb0e0g0b0\x00\x00\x00\x00\x00\x00'  # 77 M
+  b'\x00\x00`\xc0p\xc0p\xc0h\xc0l\xc0d\xc0f\xc0b\xc0a\xc0a\xc0`\xc0\x00\x00\x00\x00\x00\x00'  # 78 N
+  b'\x00\x00\x0f\x009\xc00\xc0``````````0\xc09\xc0\x0f\x00\x00\x00\x00\x00\x00\x00'  # 79 O
+  b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x80\x7f\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00'  # 80 P
+  b'\x00\x00\x0f\x009\xc00\xc0````````c`1\xc09\xc0\x0f`\x00\x00\x00\x00\x00\x00'  # 81 Q
+  b'\x00\x00\x7f\x00c\x80a\x80a\x80c\x00\x7f\x00c\x80a\x80a\x80a\x80`\xc0\x00\x00\x00\x00\x00\x00'  # 82 R
+  b'\x00\x00?\x00s\x80a\x80p\x00<\x00\x0f\x00\x03\x80\x01\x80a\x80w\x00>\x00\x00\x00\x00\x00\x00\x00'  # 83 S
+  b'\x00\xff\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00'  # 84 T
+  b'\x00\x00`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc0`\xc01\x80\x1f\x00\x00\x00\x00\x00\x00\x00'  # 85 U
+  b'\x00\x00\xc0\xc0\xc0\xc0a\x80a\x80s\x803\x003\x00\x1e\x00\x1e\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00'  # 86 V
+  b'\x00\x00\xc3\x0c\xc3\x0c\xc3\x0cg\x98d\x98d\x98l\xd8,\xd08p\x18`\x18`\x00\x00\x00\x00\x00\x00'  # 87 W
+  b'\x00\x00\xc1\x80\xc1\x80c\x006\x00\x1c\x00\x1c\x006\x00c\x00c\x00\xc1\x80\xc1\x80\x00\x00\x00\x00\x00\x00'  # 88 X
+  b'\x00\x00\xc0\xc0a\x80a\x803\x003\x00\x1e\x00\x1e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00'  # 89 Y
+  b'\x00\x00\xff\x00\x03\x00\x06\x00\x0c\x00\x1c\x00\x18\x000\x00p\x00`\x00\xc0\x00\xff\x00\x00\x00\x00\x00\x00\x00'  # 90 Z
+  b'\x00x````````````x'  # 91 [
+  b'\x00\x80\x80\xc0@@`  0\x10\x10\x00\x00\x00'  # 92 \
+  b'\x00\xf0000000000000\xf0'  # 93 ]
+  b'\x00\x18<$ff\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 94 ^
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff'  # 95 _
+  b'\x00`0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 96 `
+  b'\x00\x00\x00\x00<f\x06>ffn;\x00\x00\x00'  # 97 a
+  b'\x00\x00`\x00`\x00`\x00l\x00v\x00c\x00c\x00c\x00c\x00v\x00l\x00\x00\x00\x00\x00\x00\x00'  # 98 b
+  b'\x00\x00\x00\x00\x1c6f``f6\x1c\x00\x00\x00'  # 99 c
+  b'\x00\x00\x03\x00\x03\x00\x03\x00\x1b\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x00\x00\x00\x00\x00\x00'  # 100 d
+  b'\x00\x00\x00\x00<ff~``v<\x00\x00\x00'  # 101 e
+  b'\x008``\xf0```````\x00\x00\x00'  # 102 f
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x1d\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x03\x00g\x00>\x00'  # 103 g
+  b'\x00\x00`\x00`\x00`\x00n\x00w\x00c\x00c\x00c\x00c\x00c\x00c\x00\x00\x00\x00\x00\x00\x00'  # 104 h
+  b'\x00``\x00````````\x00\x00\x00'  # 105 i
+  b'\x00``\x00`````````\xe0\xc0'  # 106 j
+  b'\x00```flxxllff\x00\x00\x00'  # 107 k
+  b'\x00```````````\x00\x00\x00'  # 108 l
+  b'\x00\x00\x00\x00\x00\x00\x00\x00m\xc0w`f`f`f`f`f`f`\x00\x00\x00\x00\x00\x00'  # 109 m
+  b'\x00\x00\x00\x00\x00\x00\x00\x00n\x00w\x00c\x00c\x00c\x00c\x00c\x00c\x00\x00\x00\x00\x00\x00\x00'  # 110 n
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x1c\x006\x00c\x00c\x00c\x00c\x006\x00\x1c\x00\x00\x00\x00\x00\x00\x00'  # 111 o
+  b'\x00\x00\x00\x00\x00\x00\x00\x00l\x00v\x00c\x00c\x00c\x00c\x00v\x00l\x00`\x00`\x00`\x00'  # 112 p
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x1b\x007\x00c\x00c\x00c\x00c\x007\x00\x1b\x00\x03\x00\x03\x00\x03\x00'  # 113 q
+  b'\x00\x00\x00\x00l|``````\x00\x00\x00'  # 114 r
+  b'\x00\x00\x00\x00<fp<\x0e\x06v<\x00\x00\x00'  # 115 s
+  b'\x00\x00``\xf8`````h0\x00\x00\x00'  # 116 t
+  b'\x00\x00\x00\x00\x00\x00\x00\x00c\x00c\x00c\x00c\x00c\x00c\x00w\x00;\x00\x00\x00\x00\x00\x00\x00'  # 117 u
+  b'\x00\x00\x00\x00\xc3\xc3ff$<\x18\x18\x00\x00\x00'  # 118 v
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\xcc\xc0\xcc\xc0\xcc\xc0m\x80m\x803\x003\x003\x00\x00\x00\x00\x00\x00\x00'  # 119 w
+  b'\x00\x00\x00\x00\xc6\xc6l88l\xc6\xc6\x00\x00\x00'  # 120 x
+  b'\x00\x00\x00\x00\xc3\xc3ff$<\x18\x18\x180p'  # 121 y
+  b'\x00\x00\x00\x00\xfc\x0c\x1800`\xc0\xfc\x00\x00\x00'  # 122 z
+  b'\x00\x180000`\xc0`00000\x18'  # 123 {
+  b'\x00              '  # 124 |
+  b'\x00`0000\x18\x0c\x1800000`'  # 125 }
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x009\x00o\x00F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 126 ~
+)
+_index = array('H', (
+  0, 15, 30, 45, 75, 90, 120, 150, 165, 180, 195, 210, 240, 255, 270, 285,
+  300, 315, 330, 345, 360, 375, 390, 405, 420, 435, 450, 465, 480, 495, 525, 540,
+  570, 600, 630, 660, 690, 720, 750, 780, 810, 840, 855, 870, 900, 915, 945, 975,
+  1005, 1035, 1065, 1095, 1125, 1140, 1170, 1200, 1230, 1260, 1290, 1320, 1335, 1350, 1365, 1380,
+  1395, 1410, 1425, 1455, 1470, 1500, 1515, 1530, 1560, 1590, 1605, 1620, 1635, 1650, 1680, 1710,
+  1740, 1770, 1800, 1815, 1830, 1845, 1875, 1890, 1920, 1935, 1950, 1965, 1980, 1995, 2010, 2040,
+))
+_widths = b'\x04\x04\x07\t\x08\r\x0b\x04\x05\x05\x06\t\x04\x04\x04\x04\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x05\x05\x08\t\x08\t\x0e\n\n\x0b\x0b\t\t\x0b\n\x04\x08\n\x08\r\x0b\x0c\n\x0c\x0b\n\x08\x0b\n\x0e\t\n\t\x05\x04\x05\x08\x08\x05\x08\t\x08\t\x08\x05\t\t\x04\x04\x08\x04\x0c\t\t\t\t\x06\x08\x05\t\x08\n\x07\x08\x06\x06\x04\x06\t'
+_mv = memoryview(_data)
 
 def get_ch(ch):
-    c = ord(ch)
-    if c not in _g.keys():
-        return None, 0, 0
-    return memoryview(_g[c]), 15, int(_g[c][-1])
\ No newline at end of file
+    i = ord(ch) - 32
+    if 0 <= i < 95:
+        start = _index[i]
+        end = _index[i + 1]
+        if end > start:
+            return _mv[start:end], 15, _widths[i]
+    return None, 0, 0
@@ -33,6 +33,7 @@
 
     COMMENT "Copyright (c) 2018-2022, Frederic Cambus"
 '''
+from array import array
 version = '0.33'
 name = '-misc-spleen-medium-r-normal--12-120-72-72-c-60-iso10646-1'
 family = 'spleen'
@@ -63,107 +64,126 @@ def min_ch():
 def max_ch():
     return 176
 
-_g = {
-  32:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  33:b'\x00      \x00 \x00\x00\x00',
-  34:b'\x00PPP\x00\x00\x00\x00\x00\x00\x00\x00',
-  35:b'\x00\x00P\xf8PPP\xf8P\x00\x00\x00',
-  36:b' x\xa0\xa0p(((\xf0 \x00\x00',
-  37:b'\x00\x08HP\x10 (H@\x00\x00\x00',
-  38:b'\x000HH0`\x94\x88t\x00\x00\x00',
-  39:b'\x00   \x00\x00\x00\x00\x00\x00\x00\x00',
-  40:b'\x18 @@@@@@ \x18\x00\x00',
-  41:b'`\x10\x08\x08\x08\x08\x08\x08\x10`\x00\x00',
-  42:b'\x00\x00\x00H0\xfc0H\x00\x00\x00\x00',
-  43:b'\x00\x00\x00  \xf8  \x00\x00\x00\x00',
-  44:b'\x00\x00\x00\x00\x00\x00\x00  @\x00\x00',
-  45:b'\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x00',
-  46:b'\x00\x00\x00\x00\x00\x00\x00\x00 \x00\x00\x00',
-  47:b'\x08\x08\x10\x10  @@\x80\x80\x00\x00',
-  48:b'\x00p\x88\x98\xa8\xc8\x88\x88p\x00\x00\x00',
-  49:b'\x00 `     p\x00\x00\x00',
-  50:b'\x00p\x88\x08\x08p\x80\x80\xf8\x00\x00\x00',
-  51:b'\x00p\x88\x080\x08\x08\x88p\x00\x00\x00',
-  52:b'\x00\x80\x80\x90\x90\x90\xf8\x10\x10\x00\x00\x00',
-  53:b'\x00\xf8\x80\x80\xf0\x08\x08\x08\xf0\x00\x00\x00',
-  54:b'\x00p\x80\x80\xf0\x88\x88\x88p\x00\x00\x00',
-  55:b'\x00\xf8\x88\x08\x10    \x00\x00\x00',
-  56:b'\x00p\x88\x88p\x88\x88\x88p\x00\x00\x00',
-  57:b'\x00p\x88\x88\x88x\x08\x08p\x00\x00\x00',
-  58:b'\x00\x00\x00\x00 \x00\x00\x00 \x00\x00\x00',
-  59:b'\x00\x00\x00\x00 \x00\x00  @\x00\x00',
-  60:b'\x00\x08\x10 @@ \x10\x08\x00\x00\x00',
-  61:b'\x00\x00\x00\x00\xf8\x00\xf8\x00\x00\x00\x00\x00',
-  62:b'\x00@ \x10\x08\x08\x10 @\x00\x00\x00',
-  63:b'\x00p\x88\x08\x10  \x00 \x00\x00\x00',
-  64:b'\x00p\x88\x88\xb8\xb8\xb8\x80x\x00\x00\x00',
-  65:b'\x00p\x88\x88\x88\xf8\x88\x88\x88\x00\x00\x00',
-  66:b'\x00\xf0\x88\x88\xf0\x88\x88\x88\xf0\x00\x00\x00',
-  67:b'\x00x\x80\x80\x80\x80\x80\x80x\x00\x00\x00',
-  68:b'\x00\xf0\x88\x88\x88\x88\x88\x88\xf0\x00\x00\x00',
-  69:b'\x00x\x80\x80\xf0\x80\x80\x80x\x00\x00\x00',
-  70:b'\x00x\x80\x80\xf0\x80\x80\x80\x80\x00\x00\x00',
-  71:b'\x00x\x80\x80\xb8\x88\x88\x88x\x00\x00\x00',
-  72:b'\x00\x88\x88\x88\xf8\x88\x88\x88\x88\x00\x00\x00',
-  73:b'\x00p      p\x00\x00\x00',
-  74:b'\x00p      \xc0\x00\x00\x00',
-  75:b'\x00\x88\x88\x90\xe0\x90\x88\x88\x88\x00\x00\x00',
-  76:b'\x00\x80\x80\x80\x80\x80\x80\x80x\x00\x00\x00',
-  77:b'\x00\x88\xd8\xf8\xa8\x88\x88\x88\x88\x00\x00\x00',
-  78:b'\x00\x88\xc8\xc8\xa8\xa8\x98\x98\x88\x00\x00\x00',
-  79:b'\x00p\x88\x88\x88\x88\x88\x88p\x00\x00\x00',
-  80:b'\x00\xf0\x88\x88\x88\xf0\x80\x80\x80\x00\x00\x00',
-  81:b'\x00p\x88\x88\x88\x88\x88\x88p\x18\x00\x00',
-  82:b'\x00\xf0\x88\x88\x88\xf0\x88\x88\x88\x00\x00\x00',
-  83:b'\x00x\x80\x80p\x08\x08\x08\xf0\x00\x00\x00',
-  84:b'\x00\xf8       \x00\x00\x00',
-  85:b'\x00\x88\x88\x88\x88\x88\x88\x88x\x00\x00\x00',
-  86:b'\x00\x88\x88\x88\x88\x88\x88pp\x00\x00\x00',
-  87:b'\x00\x88\x88\x88\x88\xa8\xf8\xd8\x88\x00\x00\x00',
-  88:b'\x00\x88\x88P P\x88\x88\x88\x00\x00\x00',
-  89:b'\x00\x88\x88\x88\x88x\x08\x08\xf0\x00\x00\x00',
-  90:b'\x00\xf8\x08\x10 @\x80\x80\xf8\x00\x00\x00',
-  91:b'x@@@@@@@@x\x00\x00',
-  92:b'\x80\x80@@  \x10\x10\x08\x08\x00\x00',
-  93:b'x\x08\x08\x08\x08\x08\x08\x08\x08x\x00\x00',
-  94:b'\x00 P\x88\x00\x00\x00\x00\x00\x00\x00\x00',
-  95:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00',
-  96:b'\x00@ \x10\x00\x00\x00\x00\x00\x00\x00\x00',
-  97:b'\x00\x00\x00p\x08x\x88\x88x\x00\x00\x00',
-  98:b'\x00\x80\x80\xf0\x88\x88\x88\x88\xf0\x00\x00\x00',
-  99:b'\x00\x00\x00x\x80\x80\x80\x80x\x00\x00\x00',
-  100:b'\x00\x08\x08x\x88\x88\x88\x88x\x00\x00\x00',
-  101:b'\x00\x00\x00x\x88\x88\xf8\x80x\x00\x00\x00',
-  102:b'\x008@@\xf0@@@@\x00\x00\x00',
-  103:b'\x00\x00\x00x\x88\x88\x88\x88p\x08\xf0\x00',
-  104:b'\x00\x80\x80\xf0\x88\x88\x88\x88\x88\x00\x00\x00',
-  105:b'\x00 \x00`    0\x00\x00\x00',
-  106:b'\x00\x10\x00\x10\x10\x10\x10\x10\x10`\x00\x00',
-  107:b'\x00\x80\x80\x90\xa0\xc0\xa0\x90\x88\x00\x00\x00',
-  108:b'\x00@@@@@@@0\x00\x00\x00',
-  109:b'\x00\x00\x00\xf0\xa8\xa8\xa8\x88\x88\x00\x00\x00',
-  110:b'\x00\x00\x00\xf0\x88\x88\x88\x88\x88\x00\x00\x00',
-  111:b'\x00\x00\x00p\x88\x88\x88\x88p\x00\x00\x00',
-  112:b'\x00\x00\x00\xf0\x88\x88\x88\x88\xf0\x80\x80\x80',
-  113:b'\x00\x00\x00x\x88\x88\x88\x88x\x08\x08\x08',
-  114:b'\x00\x00\x00x\x88\x80\x80\x80\x80\x00\x00\x00',
-  115:b'\x00\x00\x00x\x80p\x08\x08\xf0\x00\x00\x00',
-  116:b'\x00@@\xe0@@@@0\x00\x00\x00',
-  117:b'\x00\x00\x00\x88\x88\x88\x88\x88x\x00\x00\x00',
-  118:b'\x00\x00\x00\x88\x88\x88\x88P \x00\x00\x00',
-  119:b'\x00\x00\x00\x88\x88\xa8\xf8\xd8\x88\x00\x00\x00',
-  120:b'\x00\x00\x00\x88\x88pp\x88\x88\x00\x00\x00',
-  121:b'\x00\x00\x00\x88\x88\x88\x88\x88x\x08\x08\xf0',
-  122:b'\x00\x00\x00\xf8\x08\x10 @\xf8\x00\x00\x00',
-  123:b'\x18   \xc0\xc0   \x18\x00\x00',
-  124:b'          \x00\x00',
-  125:b'`\x10\x10\x10\x0c\x0c\x10\x10\x10`\x00\x00',
-  126:b'\x00\x00\x00\x00\x00H\xb0\x00\x00\x00\x00\x00',
-  176:b'\x000HH0\x00\x00\x00\x00\x00',  
-}
+# Glyph table generated by tools/compact_fonts.py: the MONO_HLSB rows of every
+# glyph back to back in _data; glyph c spans _data[_index[c - 32]:_index[c - 31]],
+# an empty span means no glyph.
+_data = (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 32
+  b'\x00      \x00 \x00\x00\x00'  # 33 !
+  b'\x00PPP\x00\x00\x00\x00\x00\x00\x00\x00'  # 34 "
+  b'\x00\x00P\xf8PPP\xf8P\x00\x00\x00'  # 35 #
+  b' x\xa0\xa0p(((\xf0 \x00\x00'  # 36 $
+  b'\x00\x08HP\x10 (H@\x00\x00\x00'  # 37 %
+  b'\x000HH0`\x94\x88t\x00\x00\x00'  # 38 &
+  b'\x00   \x00\x00\x00\x00\x00\x00\x00\x00'  # 39 '
+  b'\x18 @@@@@@ \x18\x00\x00'  # 40 (
+  b'`\x10\x08\x08\x08\x08\x08\x08\x10`\x00\x00'  # 41 )
+  b'\x00\x00\x00H0\xfc0H\x00\x00\x00\x00'  # 42 *
+  b'\x00\x00\x00  \xf8  \x00\x00\x00\x00'  # 43 +
+  b'\x00\x00\x00\x00\x00\x00\x00  @\x00\x00'  # 44 ,
+  b'\x00\x00\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x00'  # 45 -
+  b'\x00\x00\x00\x00\x00\x00\x00\x00 \x00\x00\x00'  # 46 .
+  b'\x08\x08\x10\x10  @@\x80\x80\x00\x00'  # 47 /
+  b'\x00p\x88\x98\xa8\xc8\x88\x88p\x00\x00\x00'  # 48 0
+  b'\x00 `     p\x00\x00\x00'  # 49 1
+  b'\x00p\x88\x08\x08p\x80\x80\xf8\x00\x00\x00'  # 50 2
+  b'\x00p\x88\x080\x08\x08\x88p\x00\x00\x00'  # 51 3
+  b'\x00\x80\x80\x90\x90\x90\xf8\x10\x10\x00\x00\x00'  # 52 4
+  b'\x00\xf8\x80\x80\xf0\x08\x08\x08\xf0\x00\x00\x00'  # 53 5
+  b'\x00p\x80\x80\xf0\x88\x88\x88p\x00\x00\x00'  # 54 6
+  b'\x00\xf8\x88\x08\x10    \x00\x00\x00'  # 55 7
+  b'\x00p\x88\x88p\x88\x88\x88p\x00\x00\x00'  # 56 8
+  b'\x00p\x88\x88\x88x\x08\x08p\x00\x00\x00'  # 57 9
+  b'\x00\x00\x00\x00 \x00\x00\x00 \x00\x00\x00'  # 58 :
+  b'\x00\x00\x00\x00 \x00\x00  @\x00\x00'  # 59 ;
+  b'\x00\x08\x10 @@ \x10\x08\x00\x00\x00'  # 60 <
+  b'\x00\x00\x00\x00\xf8\x00\xf8\x00\x00\x00\x00\x00'  # 61 =
+  b'\x00@ \x10\x08\x08\x10 @\x00\x00\x00'  # 62 >
+  b'\x00p\x88\x08\x10  \x00 \x00\x00\x00'  # 63 ?
+  b'\x00p\x88\x88\xb8\xb8\xb8\x80x\x00\x00\x00'  # 64 @
+  b'\x00p\x88\x88\x88\xf8\x88\x88\x88\x00\x00\x00'  # 65 A
+  b'\x00\xf0\x88\x88\xf0\x88\x88\x88\xf0\x00\x00\x00'  # 66 B
+  b'\x00x\x80\x80\x80\x80\x80\x80x\x00\x00\x00'  # 67 C
+  b'\x00\xf0\x88\x88\x88\x88\x88\x88\xf0\x00\x00\x00'  # 68 D
+  b'\x00x\x80\x80\xf0\x80\x80\x80x\x00\x00\x00'  # 69 E
+  b'\x00x\x80\x80\xf0\x80\x80\x80\x80\x00\x00\x00'  # 70 F
+  b'\x00x\x80\x80\xb8\x88\x88\x88x\x00\x00\x00'  # 71 G
+  b'\x00\x88\x88\x88\xf8\x88\x88\x88\x88\x00\x00\x00'  # 72 H
+  b'\x00p      p\x00\x00\x00'  # 73 I
+  b'\x00p      \xc0\x00\x00\x00'  # 74 J
+  b'\x00\x88\x88\x90\xe0\x90\x88\x88\x88\x00\x00\x00'  # 75 K
+  b'\x00\x80\x80\x80\x80\x80\x80\x80x\x00\x00\x00'  # 76 L
+  b'\x00\x88\xd8\xf8\xa8\x88\x88\x88\x88\x00\x00\x00'  # 77 M
+  b'\x00\x88\xc8\xc8\xa8\xa8\x98\x98\x88\x00\x00\x00'  # 78 N
+  b'\x00p\x88\x88\x88\x88\x88\x88p\x00\x00\x00'  # 79 O
+  b'\x00\xf0\x88\x88\x88\xf0\x80\x80\x80\x00\x00\x00'  # 80 P
+  b'\x00p\x88\x88\x88\x88\x88\x88p\x18\x00\x00'  # 81 Q
+  b'\x00\xf0\x88\x88\x88\xf0\x88\x88\x88\x00\x00\x00'  # 82 R
+  b'\x00x\x80\x80p\x08\x08\x08\xf0\x00\x00\x00'  # 83 S
+  b'\x00\xf8       \x00\x00\x00'  # 84 T
+  b'\x00\x88\x88\x88\x88\x88\x88\x88x\x00\x00\x00'  # 85 U
+  b'\x00\x88\x88\x88\x88\x88\x88pp\x00\x00\x00'  # 86 V
+  b'\x00\x88\x88\x88\x88\xa8\xf8\xd8\x88\x00\x00\x00'  # 87 W
+  b'\x00\x88\x88P P\x88\x88\x88\x00\x00\x00'  # 88 X
+  b'\x00\x88\x88\x88\x88x\x08\x08\xf0\x00\x00\x00'  # 89 Y
+  b'\x00\xf8\x08\x10 @\x80\x80\xf8\x00\x00\x00'  # 90 Z
+  b'x@@@@@@@@x\x00\x00'  # 91 [
+  b'\x80\x80@@  \x10\x10\x08\x08\x00\x00'  # 92 \
+  b'x\x08\x08\x08\x08\x08\x08\x08\x08x\x00\x00'  # 93 ]
+  b'\x00 P\x88\x00\x00\x00\x00\x00\x00\x00\x00'  # 94 ^
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x00\x00'  # 95 _
+  b'\x00@ \x10\x00\x00\x00\x00\x00\x00\x00\x00'  # 96 `
+  b'\x00\x00\x00p\x08x\x88\x88x\x00\x00\x00'  # 97 a
+  b'\x00\x80\x80\xf0\x88\x88\x88\x88\xf0\x00\x00\x00'  # 98 b
+  b'\x00\x00\x00x\x80\x80\x80\x80x\x00\x00\x00'  # 99 c
+  b'\x00\x08\x08x\x88\x88\x88\x88x\x00\x00\x00'  # 100 d
+  b'\x00\x00\x00x\x88\x88\xf8\x80x\x00\x00\x00'  # 101 e
+  b'\x008@@\xf0@@@@\x00\x00\x00'  # 102 f
+  b'\x00\x00\x00x\x88\x88\x88\x88p\x08\xf0\x00'  # 103 g
+  b'\x00\x80\x80\xf0\x88\x88\x88\x88\x88\x00\x00\x00'  # 104 h
+  b'\x00 \x00`    0\x00\x00\x00'  # 105 i
+  b'\x00\x10\x00\x10\x10\x10\x10\x10\x10`\x00\x00'  # 106 j
+  b'\x00\x80\x80\x90\xa0\xc0\xa0\x90\x88\x00\x00\x00'  # 107 k
+  b'\x00@@@@@@@0\x00\x00\x00'  # 108 l
+  b'\x00\x00\x00\xf0\xa8\xa8\xa8\x88\x88\x00\x00\x00'  # 109 m
+  b'\x00\x00\x00\xf0\x88\x88\x88\x88\x88\x00\x00\x00'  # 110 n
+  b'\x00\x00\x00p\x88\x88\x88\x88p\x00\x00\x00'  # 111 o
+  b'\x00\x00\x00\xf0\x88\x88\x88\x88\xf0\x80\x80\x80'  # 112 p
+  b'\x00\x00\x00x\x88\x88\x88\x88x\x08\x08\x08'  # 113 q
+  b'\x00\x00\x00x\x88\x80\x80\x80\x80\x00\x00\x00'  # 114 r
+  b'\x00\x00\x00x\x80p\x08\x08\xf0\x00\x00\x00'  # 115 s
+  b'\x00@@\xe0@@@@0\x00\x00\x00'  # 116 t
+  b'\x00\x00\x00\x88\x88\x88\x88\x88x\x00\x00\x00'  # 117 u
+  b'\x00\x00\x00\x88\x88\x88\x88P \x00\x00\x00'  # 118 v
+  b'\x00\x00\x00\x88\x88\xa8\xf8\xd8\x88\x00\x00\x00'  # 119 w
+  b'\x00\x00\x00\x88\x88pp\x88\x88\x00\x00\x00'  # 120 x
+  b'\x00\x00\x00\x88\x88\x88\x88\x88x\x08\x08\xf0'  # 121 y
+  b'\x00\x00\x00\xf8\x08\x10 @\xf8\x00\x00\x00'  # 122 z
+  b'\x18   \xc0\xc0   \x18\x00\x00'  # 123 {
+  b'          \x00\x00'  # 124 |
+  b'`\x10\x10\x10\x0c\x0c\x10\x10\x10`\x00\x00'  # 125 }
+  b'\x00\x00\x00\x00\x00H\xb0\x00\x00\x00\x00\x00'  # 126 ~
+  b'\x000HH0\x00\x00\x00\x00\x00\x00\x00'  # 176
+)
+_index = array('H', (
+  0, 12, 24, 36, 48, 60, 72, 84, 96, 108, 120, 132, 144, 156, 168, 180,
+  192, 204, 216, 228, 240, 252, 264, 276, 288, 300, 312, 324, 336, 348, 360, 372,
+  384, 396, 408, 420, 432, 444, 456, 468, 480, 492, 504, 516, 528, 540, 552, 564,
+  576, 588, 600, 612, 624, 636, 648, 660, 672, 684, 696, 708, 720, 732, 744, 756,
+  768, 780, 792, 804, 816, 828, 840, 852, 864, 876, 888, 900, 912, 924, 936, 948,
+  960, 972, 984, 996, 1008, 1020, 1032, 1044, 1056, 1068, 1080, 1092, 1104, 1116, 1128, 1140,
+  1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140,
+  1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140,
+  1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140, 1140,
+  1140, 1152,
+))
+_mv = memoryview(_data)
 
 def get_ch(ch):
-    c = ord(ch)
-    if c not in _g.keys():
-        return None, 0, 0
-    return memoryview(_g[c]), 12, 6
\ No newline at end of file
+    i = ord(ch) - 32
+    if 0 <= i < 145:
+        start = _index[i]
+        end = _index[i + 1]
+        if end > start:
+            return _mv[start:end], 12, 6
+    return None, 0, 0
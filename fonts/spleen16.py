@@ -33,6 +33,7 @@
 
     COMMENT "Copyright (c) 2018-2022, Frederic Cambus"
 '''
+from array import array
 version = '0.33'
 name = '-misc-spleen-medium-r-normal--16-160-72-72-c-80-iso10646-1'
 family = 'spleen'
@@ -63,107 +64,126 @@ def min_ch():
 def max_ch():
     return 176
 
-_g = {
-  32:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  33:b'\x00\x18\x18\x18\x18\x18\x18\x18\x00\x18\x18\x00\x00\x00',
-  34:b'ffff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  35:b'\x00ll\xfellll\xfell\x00\x00\x00',
-  36:b'\x10~\xd0\xd0\xd0|\x16\x16\x16\x16\xfc\x10\x00\x00',
-  37:b'\x00\x06fl\x0c\x18\x1806f`\x00\x00\x00',
-  38:b'\x008lll8p\xda\xcc\xccz\x00\x00\x00',
-  39:b'\x18\x18\x18\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  40:b'\x0e\x1800````00\x18\x0e\x00\x00',
-  41:b'p\x18\x0c\x0c\x06\x06\x06\x06\x0c\x0c\x18p\x00\x00',
-  42:b'\x00\x00\x00f<\x18\xff\x18<f\x00\x00\x00\x00',
-  43:b'\x00\x00\x00\x00\x18\x18~\x18\x18\x00\x00\x00\x00\x00',
-  44:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x180\x00\x00',
-  45:b'\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x00\x00',
-  46:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x18\x00\x00\x00',
-  47:b'\x06\x06\x0c\x0c\x18\x1800``\xc0\xc0\x00\x00',
-  48:b'\x00|\xc6\xc6\xce\xde\xf6\xe6\xc6\xc6|\x00\x00\x00',
-  49:b'\x00\x188xX\x18\x18\x18\x18\x18~\x00\x00\x00',
-  50:b'\x00|\xc6\x06\x06\x0c\x180`\xc6\xfe\x00\x00\x00',
-  51:b'\x00|\xc6\x06\x06<\x06\x06\x06\xc6|\x00\x00\x00',
-  52:b'\x00\xc0\xc0\xcc\xcc\xcc\xcc\xfe\x0c\x0c\x0c\x00\x00\x00',
-  53:b'\x00\xfe\xc6\xc0\xc0\xfc\x06\x06\x06\xc6|\x00\x00\x00',
-  54:b'\x00|\xc6\xc0\xc0\xfc\xc6\xc6\xc6\xc6|\x00\x00\x00',
-  55:b'\x00\xfe\xc6\x06\x06\x0c\x180000\x00\x00\x00',
-  56:b'\x00|\xc6\xc6\xc6|\xc6\xc6\xc6\xc6|\x00\x00\x00',
-  57:b'\x00|\xc6\xc6\xc6\xc6~\x06\x06\xc6|\x00\x00\x00',
-  58:b'\x00\x00\x00\x00\x18\x18\x00\x00\x00\x18\x18\x00\x00\x00',
-  59:b'\x00\x00\x00\x00\x18\x18\x00\x00\x00\x18\x180\x00\x00',
-  60:b'\x00\x06\x0c\x180``0\x18\x0c\x06\x00\x00\x00',
-  61:b'\x00\x00\x00\x00~\x00\x00~\x00\x00\x00\x00\x00\x00',
-  62:b'\x00`0\x18\x0c\x06\x06\x0c\x180`\x00\x00\x00',
-  63:b'\x00|\xc6\x06\x0c\x1800\x0000\x00\x00\x00',
-  64:b'\x00\x00|\xc2\xda\xda\xda\xda\xde\xc0|\x00\x00\x00',
-  65:b'\x00|\xc6\xc6\xc6\xfe\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  66:b'\x00\xfc\xc6\xc6\xc6\xfc\xc6\xc6\xc6\xc6\xfc\x00\x00\x00',
-  67:b'\x00~\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00',
-  68:b'\x00\xfc\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xfc\x00\x00\x00',
-  69:b'\x00~\xc0\xc0\xc0\xf8\xc0\xc0\xc0\xc0~\x00\x00\x00',
-  70:b'\x00~\xc0\xc0\xc0\xf8\xc0\xc0\xc0\xc0\xc0\x00\x00\x00',
-  71:b'\x00~\xc0\xc0\xc0\xde\xc6\xc6\xc6\xc6~\x00\x00\x00',
-  72:b'\x00\xc6\xc6\xc6\xc6\xfe\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  73:b'\x00~\x18\x18\x18\x18\x18\x18\x18\x18~\x00\x00\x00',
-  74:b'\x00~\x18\x18\x18\x18\x18\x18\x18\x18\xf0\x00\x00\x00',
-  75:b'\x00\xc6\xc6\xc6\xcc\xf8\xcc\xc6\xc6\xc6\xc6\x00\x00\x00',
-  76:b'\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00',
-  77:b'\x00\xc6\xee\xfe\xd6\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  78:b'\x00\xc6\xc6\xe6\xe6\xd6\xd6\xce\xce\xc6\xc6\x00\x00\x00',
-  79:b'\x00|\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6|\x00\x00\x00',
-  80:b'\x00\xfc\xc6\xc6\xc6\xfc\xc0\xc0\xc0\xc0\xc0\x00\x00\x00',
-  81:b'\x00|\xc6\xc6\xc6\xc6\xc6\xc6\xd6\xd6|\x18\x0c\x00',
-  82:b'\x00\xfc\xc6\xc6\xc6\xfc\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  83:b'\x00~\xc0\xc0\xc0|\x06\x06\x06\x06\xfc\x00\x00\x00',
-  84:b'\x00\xff\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00',
-  85:b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00',
-  86:b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6l8\x10\x00\x00\x00',
-  87:b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xd6\xfe\xee\xc6\x00\x00\x00',
-  88:b'\x00\xc6\xc6\xc6l8l\xc6\xc6\xc6\xc6\x00\x00\x00',
-  89:b'\x00\xc6\xc6\xc6\xc6~\x06\x06\x06\x06\xfc\x00\x00\x00',
-  90:b'\x00\xfe\x06\x06\x0c\x180`\xc0\xc0\xfe\x00\x00\x00',
-  91:b'>0000000000>\x00\x00',
-  92:b'\xc0\xc0``00\x18\x18\x0c\x0c\x06\x06\x00\x00',
-  93:b'|\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c|\x00\x00',
-  94:b'\x108l\xc6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  95:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe',
-  96:b'0\x18\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  97:b'\x00\x00\x00\x00|\x06~\xc6\xc6\xc6~\x00\x00\x00',
-  98:b'\x00\xc0\xc0\xc0\xfc\xc6\xc6\xc6\xc6\xc6\xfc\x00\x00\x00',
-  99:b'\x00\x00\x00\x00~\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00',
-  100:b'\x00\x06\x06\x06~\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00',
-  101:b'\x00\x00\x00\x00~\xc6\xc6\xfe\xc0\xc0~\x00\x00\x00',
-  102:b'\x00\x1e000|00000\x00\x00\x00',
-  103:b'\x00\x00\x00\x00~\xc6\xc6\xc6\xc6\xc6|\x06\x06\xfc',
-  104:b'\x00\xc0\xc0\xc0\xfc\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  105:b'\x00\x18\x18\x008\x18\x18\x18\x18\x18\x1c\x00\x00\x00',
-  106:b'\x00\x18\x18\x00\x18\x18\x18\x18\x18\x18\x18\x18\x18p',
-  107:b'\x00\xc0\xc0\xc0\xcc\xd8\xf0\xf0\xd8\xcc\xc6\x00\x00\x00',
-  108:b'\x00000000000\x1c\x00\x00\x00',
-  109:b'\x00\x00\x00\x00\xec\xd6\xd6\xd6\xd6\xc6\xc6\x00\x00\x00',
-  110:b'\x00\x00\x00\x00\xfc\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00',
-  111:b'\x00\x00\x00\x00|\xc6\xc6\xc6\xc6\xc6|\x00\x00\x00',
-  112:b'\x00\x00\x00\x00\xfc\xc6\xc6\xc6\xc6\xc6\xfc\xc0\xc0\xc0',
-  113:b'\x00\x00\x00\x00~\xc6\xc6\xc6\xc6\xc6~\x06\x06\x06',
-  114:b'\x00\x00\x00\x00~\xc6\xc0\xc0\xc0\xc0\xc0\x00\x00\x00',
-  115:b'\x00\x00\x00\x00~\xc0\xc0|\x06\x06\xfc\x00\x00\x00',
-  116:b'\x00000|00000\x1e\x00\x00\x00',
-  117:b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00',
-  118:b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6l8\x10\x00\x00\x00',
-  119:b'\x00\x00\x00\x00\xc6\xc6\xd6\xd6\xd6\xd6n\x00\x00\x00',
-  120:b'\x00\x00\x00\x00\xc6l88l\xc6\xc6\x00\x00\x00',
-  121:b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6~\x06\x06\xfc',
-  122:b'\x00\x00\x00\x00\xfe\x06\x0c\x180`\xfe\x00\x00\x00',
-  123:b'\x0e\x18\x18\x18\x18pp\x18\x18\x18\x18\x0e\x00\x00',
-  124:b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00',
-  125:b'p\x18\x18\x18\x18\x0e\x0e\x18\x18\x18\x18p\x00\x00',
-  126:b'\x00\x00\x00\x00\x002~L\x00\x00\x00\x00\x00\x00',
-  176:b'8ll8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-}
+# Glyph table generated by tools/compact_fonts.py: the MONO_HLSB rows of every
+# glyph back to back in _data; glyph c spans _data[_index[c - 32]:_index[c - 31]],
+# an empty span means no glyph.
+_data = (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 32
+  b'\x00\x18\x18\x18\x18\x18\x18\x18\x00\x18\x18\x00\x00\x00'  # 33 !
+  b'ffff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 34 "
+  b'\x00ll\xfellll\xfell\x00\x00\x00'  # 35 #
+  b'\x10~\xd0\xd0\xd0|\x16\x16\x16\x16\xfc\x10\x00\x00'  # 36 $
+  b'\x00\x06fl\x0c\x18\x1806f`\x00\x00\x00'  # 37 %
+  b'\x008lll8p\xda\xcc\xccz\x00\x00\x00'  # 38 &
+  b'\x18\x18\x18\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 39 '
+  b'\x0e\x1800````00\x18\x0e\x00\x00'  # 40 (
+  b'p\x18\x0c\x0c\x06\x06\x06\x06\x0c\x0c\x18p\x00\x00'  # 41 )
+  b'\x00\x00\x00f<\x18\xff\x18<f\x00\x00\x00\x00'  # 42 *
+  b'\x00\x00\x00\x00\x18\x18~\x18\x18\x00\x00\x00\x00\x00'  # 43 +
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x180\x00\x00'  # 44 ,
+  b'\x00\x00\x00\x00\x00\x00~\x00\x00\x00\x00\x00\x00\x00'  # 45 -
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x18\x00\x00\x00'  # 46 .
+  b'\x06\x06\x0c\x0c\x18\x1800``\xc0\xc0\x00\x00'  # 47 /
+  b'\x00|\xc6\xc6\xce\xde\xf6\xe6\xc6\xc6|\x00\x00\x00'  # 48 0
+  b'\x00\x188xX\x18\x18\x18\x18\x18~\x00\x00\x00'  # 49 1
+  b'\x00|\xc6\x06\x06\x0c\x180`\xc6\xfe\x00\x00\x00'  # 50 2
+  b'\x00|\xc6\x06\x06<\x06\x06\x06\xc6|\x00\x00\x00'  # 51 3
+  b'\x00\xc0\xc0\xcc\xcc\xcc\xcc\xfe\x0c\x0c\x0c\x00\x00\x00'  # 52 4
+  b'\x00\xfe\xc6\xc0\xc0\xfc\x06\x06\x06\xc6|\x00\x00\x00'  # 53 5
+  b'\x00|\xc6\xc0\xc0\xfc\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 54 6
+  b'\x00\xfe\xc6\x06\x06\x0c\x180000\x00\x00\x00'  # 55 7
+  b'\x00|\xc6\xc6\xc6|\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 56 8
+  b'\x00|\xc6\xc6\xc6\xc6~\x06\x06\xc6|\x00\x00\x00'  # 57 9
+  b'\x00\x00\x00\x00\x18\x18\x00\x00\x00\x18\x18\x00\x00\x00'  # 58 :
+  b'\x00\x00\x00\x00\x18\x18\x00\x00\x00\x18\x180\x00\x00'  # 59 ;
+  b'\x00\x06\x0c\x180``0\x18\x0c\x06\x00\x00\x00'  # 60 <
+  b'\x00\x00\x00\x00~\x00\x00~\x00\x00\x00\x00\x00\x00'  # 61 =
+  b'\x00`0\x18\x0c\x06\x06\x0c\x180`\x00\x00\x00'  # 62 >
+  b'\x00|\xc6\x06\x0c\x1800\x0000\x00\x00\x00'  # 63 ?
+  b'\x00\x00|\xc2\xda\xda\xda\xda\xde\xc0|\x00\x00\x00'  # 64 @
+  b'\x00|\xc6\xc6\xc6\xfe\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 65 A
+  b'\x00\xfc\xc6\xc6\xc6\xfc\xc6\xc6\xc6\xc6\xfc\x00\x00\x00'  # 66 B
+  b'\x00~\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00'  # 67 C
+  b'\x00\xfc\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xfc\x00\x00\x00'  # 68 D
+  b'\x00~\xc0\xc0\xc0\xf8\xc0\xc0\xc0\xc0~\x00\x00\x00'  # 69 E
+  b'\x00~\xc0\xc0\xc0\xf8\xc0\xc0\xc0\xc0\xc0\x00\x00\x00'  # 70 F
+  b'\x00~\xc0\xc0\xc0\xde\xc6\xc6\xc6\xc6~\x00\x00\x00'  # 71 G
+  b'\x00\xc6\xc6\xc6\xc6\xfe\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 72 H
+  b'\x00~\x18\x18\x18\x18\x18\x18\x18\x18~\x00\x00\x00'  # 73 I
+  b'\x00~\x18\x18\x18\x18\x18\x18\x18\x18\xf0\x00\x00\x00'  # 74 J
+  b'\x00\xc6\xc6\xc6\xcc\xf8\xcc\xc6\xc6\xc6\xc6\x00\x00\x00'  # 75 K
+  b'\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00'  # 76 L
+  b'\x00\xc6\xee\xfe\xd6\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 77 M
+  b'\x00\xc6\xc6\xe6\xe6\xd6\xd6\xce\xce\xc6\xc6\x00\x00\x00'  # 78 N
+  b'\x00|\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 79 O
+  b'\x00\xfc\xc6\xc6\xc6\xfc\xc0\xc0\xc0\xc0\xc0\x00\x00\x00'  # 80 P
+  b'\x00|\xc6\xc6\xc6\xc6\xc6\xc6\xd6\xd6|\x18\x0c\x00'  # 81 Q
+  b'\x00\xfc\xc6\xc6\xc6\xfc\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 82 R
+  b'\x00~\xc0\xc0\xc0|\x06\x06\x06\x06\xfc\x00\x00\x00'  # 83 S
+  b'\x00\xff\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00'  # 84 T
+  b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00'  # 85 U
+  b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6l8\x10\x00\x00\x00'  # 86 V
+  b'\x00\xc6\xc6\xc6\xc6\xc6\xc6\xd6\xfe\xee\xc6\x00\x00\x00'  # 87 W
+  b'\x00\xc6\xc6\xc6l8l\xc6\xc6\xc6\xc6\x00\x00\x00'  # 88 X
+  b'\x00\xc6\xc6\xc6\xc6~\x06\x06\x06\x06\xfc\x00\x00\x00'  # 89 Y
+  b'\x00\xfe\x06\x06\x0c\x180`\xc0\xc0\xfe\x00\x00\x00'  # 90 Z
+  b'>0000000000>\x00\x00'  # 91 [
+  b'\xc0\xc0``00\x18\x18\x0c\x0c\x06\x06\x00\x00'  # 92 \
+  b'|\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c|\x00\x00'  # 93 ]
+  b'\x108l\xc6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 94 ^
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe'  # 95 _
+  b'0\x18\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 96 `
+  b'\x00\x00\x00\x00|\x06~\xc6\xc6\xc6~\x00\x00\x00'  # 97 a
+  b'\x00\xc0\xc0\xc0\xfc\xc6\xc6\xc6\xc6\xc6\xfc\x00\x00\x00'  # 98 b
+  b'\x00\x00\x00\x00~\xc0\xc0\xc0\xc0\xc0~\x00\x00\x00'  # 99 c
+  b'\x00\x06\x06\x06~\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00'  # 100 d
+  b'\x00\x00\x00\x00~\xc6\xc6\xfe\xc0\xc0~\x00\x00\x00'  # 101 e
+  b'\x00\x1e000|00000\x00\x00\x00'  # 102 f
+  b'\x00\x00\x00\x00~\xc6\xc6\xc6\xc6\xc6|\x06\x06\xfc'  # 103 g
+  b'\x00\xc0\xc0\xc0\xfc\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 104 h
+  b'\x00\x18\x18\x008\x18\x18\x18\x18\x18\x1c\x00\x00\x00'  # 105 i
+  b'\x00\x18\x18\x00\x18\x18\x18\x18\x18\x18\x18\x18\x18p'  # 106 j
+  b'\x00\xc0\xc0\xc0\xcc\xd8\xf0\xf0\xd8\xcc\xc6\x00\x00\x00'  # 107 k
+  b'\x00000000000\x1c\x00\x00\x00'  # 108 l
+  b'\x00\x00\x00\x00\xec\xd6\xd6\xd6\xd6\xc6\xc6\x00\x00\x00'  # 109 m
+  b'\x00\x00\x00\x00\xfc\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00'  # 110 n
+  b'\x00\x00\x00\x00|\xc6\xc6\xc6\xc6\xc6|\x00\x00\x00'  # 111 o
+  b'\x00\x00\x00\x00\xfc\xc6\xc6\xc6\xc6\xc6\xfc\xc0\xc0\xc0'  # 112 p
+  b'\x00\x00\x00\x00~\xc6\xc6\xc6\xc6\xc6~\x06\x06\x06'  # 113 q
+  b'\x00\x00\x00\x00~\xc6\xc0\xc0\xc0\xc0\xc0\x00\x00\x00'  # 114 r
+  b'\x00\x00\x00\x00~\xc0\xc0|\x06\x06\xfc\x00\x00\x00'  # 115 s
+  b'\x00000|00000\x1e\x00\x00\x00'  # 116 t
+  b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6~\x00\x00\x00'  # 117 u
+  b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6l8\x10\x00\x00\x00'  # 118 v
+  b'\x00\x00\x00\x00\xc6\xc6\xd6\xd6\xd6\xd6n\x00\x00\x00'  # 119 w
+  b'\x00\x00\x00\x00\xc6l88l\xc6\xc6\x00\x00\x00'  # 120 x
+  b'\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6~\x06\x06\xfc'  # 121 y
+  b'\x00\x00\x00\x00\xfe\x06\x0c\x180`\xfe\x00\x00\x00'  # 122 z
+  b'\x0e\x18\x18\x18\x18pp\x18\x18\x18\x18\x0e\x00\x00'  # 123 {
+  b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x00\x00'  # 124 |
+  b'p\x18\x18\x18\x18\x0e\x0e\x18\x18\x18\x18p\x00\x00'  # 125 }
+  b'\x00\x00\x00\x00\x002~L\x00\x00\x00\x00\x00\x00'  # 126 ~
+  b'8ll8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 176
+)
+_index = array('H', (
+  0, 14, 28, 42, 56, 70, 84, 98, 112, 126, 140, 154, 168, 182, 196, 210,
+  224, 238, 252, 266, 280, 294, 308, 322, 336, 350, 364, 378, 392, 406, 420, 434,
+  448, 462, 476, 490, 504, 518, 532, 546, 560, 574, 588, 602, 616, 630, 644, 658,
+  672, 686, 700, 714, 728, 742, 756, 770, 784, 798, 812, 826, 840, 854, 868, 882,
+  896, 910, 924, 938, 952, 966, 980, 994, 1008, 1022, 1036, 1050, 1064, 1078, 1092, 1106,
+  1120, 1134, 1148, 1162, 1176, 1190, 1204, 1218, 1232, 1246, 1260, 1274, 1288, 1302, 1316, 1330,
+  1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330,
+  1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330,
+  1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330, 1330,
+  1330, 1344,
+))
+_mv = memoryview(_data)
 
 def get_ch(ch):
-    c = ord(ch)
-    if c not in _g.keys():
-        return None, 0, 0
-    return memoryview(_g[c]), 14, 8
\ No newline at end of file
+    i = ord(ch) - 32
+    if 0 <= i < 145:
+        start = _index[i]
+        end = _index[i + 1]
+        if end > start:
+            return _mv[start:end], 14, 8
+    return None, 0, 0
@@ -1,3 +1,4 @@
+from array import array
 version = '0.33'
 name = '-misc-spleen-medium-r-normal--24-240-72-72-c-120-iso10646-1'
 family = 'spleen'
@@ -28,107 +29,126 @@ def min_ch():
 def max_ch():
     return 176
 
-_g = {
-  32:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  33:b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  34:b'\x00\x000\xc00\xc00\xc00\xc00\xc00\xc00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  35:b'\x00\x00\x00\x00\x00\x000\xc00\xc00\xc0\x7f\xe00\xc00\xc00\xc00\xc00\xc00\xc00\xc0\x7f\xe00\xc00\xc00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  36:b'\x00\x00\x06\x00\x06\x00\x1f\xe06\x00f\x00f\x00f\x00f\x006\x00\x1f\x80\x06\xc0\x06`\x06`\x06`\x06`\x06\xc0\x7f\x80\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00',
-  37:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc08\xc0m\x80m\x80;\x00\x03\x00\x06\x00\x06\x00\x0c\x00\r\xc0\x1b`\x1b`1\xc00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  38:b'\x00\x00\x00\x00\x00\x00\x0f\x00\x19\x800\xc00\xc00\xc00\xc0\x19\x80\x0f\x003\x00a\xa0`\xe0`\xc0`\xc01\xe0\x1f0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  39:b'\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  40:b'\x00\x00\x00\xe0\x01\x80\x03\x00\x06\x00\x0c\x00\x0c\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x0c\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xe0\x00\x00\x00\x00',
-  41:b'\x00\x00p\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x03\x00\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x03\x00\x03\x00\x06\x00\x0c\x00\x18\x00p\x00\x00\x00\x00\x00',
-  42:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\xc0\x19\x80\x0f\x00\x06\x00\x7f\xe0\x06\x00\x0f\x00\x19\x800\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  43:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00?\xc0\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  44:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x0c\x00\x18\x00\x00\x00\x00\x00\x00\x00',
-  45:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  46:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  47:b'\x00\x00\x000\x000\x00`\x00`\x00\xc0\x00\xc0\x01\x80\x01\x80\x03\x00\x03\x00\x06\x00\x06\x00\x0c\x00\x0c\x00\x18\x00\x18\x000\x000\x00`\x00`\x00\x00\x00\x00\x00',
-  48:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0`````\xe0a\xe0c`f`l`x`p`````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  49:b'\x00\x00\x00\x00\x00\x00\x0e\x00\x1e\x006\x00&\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  50:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00``\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  51:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00\xc0\x0f\x80\x00\xc0\x00`\x00`\x00`\x00```0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  52:b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00a\x80a\x80a\x80a\x80a\x80a\x80a\x80\x7f\xe0\x01\x80\x01\x80\x01\x80\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  53:b'\x00\x00\x00\x00\x00\x00\x7f\xe0```\x00`\x00`\x00`\x00\x7f\x80\x00\xc0\x00`\x00`\x00`\x00```0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  54:b'\x00\x00\x00\x00\x00\x00\x1f\xc00``\x00`\x00`\x00`\x00\x7f\x80`\xc0``````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  55:b'\x00\x00\x00\x00\x00\x00\x7f\xe0``\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  56:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````0\xc0\x1f\x800\xc0``````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  57:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````0`\x1f\xe0\x00`\x00`\x00`\x00``\xc0?\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  58:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  59:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x0c\x00\x18\x00\x00\x00\x00\x00\x00\x00',
-  60:b'\x00\x00\x00\x00\x00\x00\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xc0\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  61:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  62:b'\x00\x00\x00\x00\x00\x000\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xc0\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  63:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  64:b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x800\xc0````g`g`g`g`g`g`g\xe0`\x000\x00\x1f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  65:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````\x7f\xe0``````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  66:b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\xc0`````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  67:b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  68:b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0```````````````````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  69:b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00\x7f\x80`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  70:b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00\x7f\x80`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  71:b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00c\xe0``````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  72:b'\x00\x00\x00\x00\x00\x00``````````````\x7f\xe0``````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  73:b'\x00\x00\x00\x00\x00\x00?\xc0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  74:b'\x00\x00\x00\x00\x00\x00?\xc0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0e\x00|\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  75:b'\x00\x00\x00\x00\x00\x00```````````\xc0a\x80\x7f\x00a\x80`\xc0``````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  76:b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  77:b'\x00\x00\x00\x00\x00\x00``p\xe0y\xe0o`f`````````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  78:b'\x00\x00\x00\x00\x00\x00``p`p`x`x`l`l`f`f`c`c`a\xe0a\xe0`\xe0`\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  79:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````````````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  80:b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  81:b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0````````````````f`f`c`3\xc0\x1f\x80\x01\x80\x00\xc0\x00\xc0\x00\x00\x00\x00',
-  82:b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\xc0````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  83:b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x000\x00\x1f\x80\x00\xc0\x00`\x00`\x00`\x00`\x00\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  84:b'\x00\x00\x00\x00\x00\x00\x7f\xe0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  85:b'\x00\x00\x00\x00\x00\x00``````````````````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  86:b'\x00\x00\x00\x00\x00\x00````````````````````0\xc00\xc0\x19\x80\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  87:b'\x00\x00\x00\x00\x00\x00````````````````````f`o`y\xe0p\xe0``\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  88:b'\x00\x00\x00\x00\x00\x00````````````0\xc0\x1f\x800\xc0````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  89:b'\x00\x00\x00\x00\x00\x00````````````0`\x1f\xe0\x00`\x00`\x00`\x00`\x00`\x00\xe0\x7f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  90:b'\x00\x00\x00\x00\x00\x00\x7f\xe0\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00`\x00`\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  91:b'\x1f\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x1f\xe0\x00\x00',
-  92:b'\x00\x00\xc0\x00\xc0\x00`\x00`\x000\x000\x00\x18\x00\x18\x00\x0c\x00\x0c\x00\x06\x00\x06\x00\x03\x00\x03\x00\x01\x80\x01\x80\x00\xc0\x00\xc0\x00`\x00`\x00\x00\x00\x00',
-  93:b'\x7f\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x7f\x80\x00\x00',
-  94:b'\x00\x00\x04\x00\x0e\x00\x1b\x001\x80`\xc0\xc0`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  95:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00',
-  96:b'\x00\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  97:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x80\x00\xc0\x00`\x00`\x1f\xe00```````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  98:b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00\x7f\x80`\xc0```````````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  99:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  100:b'\x00\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x1f\xe00```````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  101:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````\x7f\xe0`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  102:b'\x00\x00\x00\x00\x00\x00\x07\xc0\x0e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00?\x80\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  103:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````````````0`\x1f\xc0\x00\xc0\x00`\x00`\x00\xc0?\x80',
-  104:b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00\x7f\x80`\xc0``````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  105:b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x1e\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  106:b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0c\x00x\x00',
-  107:b'\x00\x00\x00\x00\x00\x000\x000\x000\x000\x000\xc00\xc01\x803\x00>\x006\x003\x001\x800\xc00`0`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  108:b'\x00\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0e\x00\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  109:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00y\x80f\xc0f`f`f`f`f`f```````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  110:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0``````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  111:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  112:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0```````````````\xc0\x7f\x80`\x00`\x00`\x00`\x00`\x00',
-  113:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````````````0`\x1f\xe0\x00`\x00`\x00`\x00`\x00`',
-  114:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00``\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  115:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xe0`\x00`\x00`\x00`\x00?\xc0\x00`\x00`\x00`\x00`\x7f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  116:b'\x00\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00?\x80\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0e\x00\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  117:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  118:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00````````````0\xc00\xc0\x19\x80\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  119:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````f`f`f`f`f`f`6`\x19\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  120:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00````0\xc0\x19\x80\x0f\x00\x0f\x00\x19\x800\xc00\xc0````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  121:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````````````````0`\x1f\xe0\x00`\x00`\x00`\x00\xc0\x7f\x80',
-  122:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  123:b'\x01\xe0\x03\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0c\x008\x008\x00\x0c\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x03\x00\x01\xe0\x00\x00',
-  124:b'\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00',
-  125:b'<\x00\x06\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x01\x80\x00\xe0\x00\xe0\x01\x80\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x06\x00<\x00\x00\x00',
-  126:b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008`l`\xc6\xc0\xc3\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-  176:b'\x00\x00\x0f\x00\x19\x80\x19\x80\x19\x80\x19\x80\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00',
-}
+# Glyph table generated by tools/compact_fonts.py: the MONO_HLSB rows of every
+# glyph back to back in _data; glyph c spans _data[_index[c - 32]:_index[c - 31]],
+# an empty span means no glyph.
+_data = (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 32
+  b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 33 !
+  b'\x00\x000\xc00\xc00\xc00\xc00\xc00\xc00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 34 "
+  b'\x00\x00\x00\x00\x00\x000\xc00\xc00\xc0\x7f\xe00\xc00\xc00\xc00\xc00\xc00\xc00\xc0\x7f\xe00\xc00\xc00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 35 #
+  b'\x00\x00\x06\x00\x06\x00\x1f\xe06\x00f\x00f\x00f\x00f\x006\x00\x1f\x80\x06\xc0\x06`\x06`\x06`\x06`\x06\xc0\x7f\x80\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00'  # 36 $
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc08\xc0m\x80m\x80;\x00\x03\x00\x06\x00\x06\x00\x0c\x00\r\xc0\x1b`\x1b`1\xc00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 37 %
+  b'\x00\x00\x00\x00\x00\x00\x0f\x00\x19\x800\xc00\xc00\xc00\xc0\x19\x80\x0f\x003\x00a\xa0`\xe0`\xc0`\xc01\xe0\x1f0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 38 &
+  b'\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 39 '
+  b'\x00\x00\x00\xe0\x01\x80\x03\x00\x06\x00\x0c\x00\x0c\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x0c\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xe0\x00\x00\x00\x00'  # 40 (
+  b'\x00\x00p\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x03\x00\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x03\x00\x03\x00\x06\x00\x0c\x00\x18\x00p\x00\x00\x00\x00\x00'  # 41 )
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x000\xc0\x19\x80\x0f\x00\x06\x00\x7f\xe0\x06\x00\x0f\x00\x19\x800\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 42 *
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00?\xc0\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 43 +
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x0c\x00\x18\x00\x00\x00\x00\x00\x00\x00'  # 44 ,
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 45 -
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 46 .
+  b'\x00\x00\x000\x000\x00`\x00`\x00\xc0\x00\xc0\x01\x80\x01\x80\x03\x00\x03\x00\x06\x00\x06\x00\x0c\x00\x0c\x00\x18\x00\x18\x000\x000\x00`\x00`\x00\x00\x00\x00\x00'  # 47 /
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0`````\xe0a\xe0c`f`l`x`p`````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 48 0
+  b'\x00\x00\x00\x00\x00\x00\x0e\x00\x1e\x006\x00&\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 49 1
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00``\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 50 2
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00\xc0\x0f\x80\x00\xc0\x00`\x00`\x00`\x00```0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 51 3
+  b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00a\x80a\x80a\x80a\x80a\x80a\x80a\x80\x7f\xe0\x01\x80\x01\x80\x01\x80\x01\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 52 4
+  b'\x00\x00\x00\x00\x00\x00\x7f\xe0```\x00`\x00`\x00`\x00\x7f\x80\x00\xc0\x00`\x00`\x00`\x00```0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 53 5
+  b'\x00\x00\x00\x00\x00\x00\x1f\xc00``\x00`\x00`\x00`\x00\x7f\x80`\xc0``````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 54 6
+  b'\x00\x00\x00\x00\x00\x00\x7f\xe0``\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 55 7
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````0\xc0\x1f\x800\xc0``````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 56 8
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````0`\x1f\xe0\x00`\x00`\x00`\x00``\xc0?\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 57 9
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 58 :
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x0c\x00\x18\x00\x00\x00\x00\x00\x00\x00'  # 59 ;
+  b'\x00\x00\x00\x00\x00\x00\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xc0\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 60 <
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 61 =
+  b'\x00\x00\x00\x00\x00\x000\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x01\x80\x00\xc0\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 62 >
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 63 ?
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x800\xc0````g`g`g`g`g`g`g\xe0`\x000\x00\x1f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 64 @
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````\x7f\xe0``````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 65 A
+  b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\xc0`````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 66 B
+  b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 67 C
+  b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0```````````````````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 68 D
+  b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00\x7f\x80`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 69 E
+  b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00\x7f\x80`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 70 F
+  b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00c\xe0``````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 71 G
+  b'\x00\x00\x00\x00\x00\x00``````````````\x7f\xe0``````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 72 H
+  b'\x00\x00\x00\x00\x00\x00?\xc0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00?\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 73 I
+  b'\x00\x00\x00\x00\x00\x00?\xc0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0e\x00|\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 74 J
+  b'\x00\x00\x00\x00\x00\x00```````````\xc0a\x80\x7f\x00a\x80`\xc0``````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 75 K
+  b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 76 L
+  b'\x00\x00\x00\x00\x00\x00``p\xe0y\xe0o`f`````````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 77 M
+  b'\x00\x00\x00\x00\x00\x00``p`p`x`x`l`l`f`f`c`c`a\xe0a\xe0`\xe0`\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 78 N
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````````````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 79 O
+  b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 80 P
+  b'\x00\x00\x00\x00\x00\x00\x1f\x800\xc0````````````````f`f`c`3\xc0\x1f\x80\x01\x80\x00\xc0\x00\xc0\x00\x00\x00\x00'  # 81 Q
+  b'\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0`````````\xc0\x7f\x80`\xc0````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 82 R
+  b'\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x000\x00\x1f\x80\x00\xc0\x00`\x00`\x00`\x00`\x00\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 83 S
+  b'\x00\x00\x00\x00\x00\x00\x7f\xe0\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 84 T
+  b'\x00\x00\x00\x00\x00\x00``````````````````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 85 U
+  b'\x00\x00\x00\x00\x00\x00````````````````````0\xc00\xc0\x19\x80\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 86 V
+  b'\x00\x00\x00\x00\x00\x00````````````````````f`o`y\xe0p\xe0``\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 87 W
+  b'\x00\x00\x00\x00\x00\x00````````````0\xc0\x1f\x800\xc0````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 88 X
+  b'\x00\x00\x00\x00\x00\x00````````````0`\x1f\xe0\x00`\x00`\x00`\x00`\x00`\x00\xe0\x7f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 89 Y
+  b'\x00\x00\x00\x00\x00\x00\x7f\xe0\x00`\x00`\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00`\x00`\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 90 Z
+  b'\x1f\xe0\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x1f\xe0\x00\x00'  # 91 [
+  b'\x00\x00\xc0\x00\xc0\x00`\x00`\x000\x000\x00\x18\x00\x18\x00\x0c\x00\x0c\x00\x06\x00\x06\x00\x03\x00\x03\x00\x01\x80\x01\x80\x00\xc0\x00\xc0\x00`\x00`\x00\x00\x00\x00'  # 92 \
+  b'\x7f\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x01\x80\x7f\x80\x00\x00'  # 93 ]
+  b'\x00\x00\x04\x00\x0e\x00\x1b\x001\x80`\xc0\xc0`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 94 ^
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00\x00'  # 95 _
+  b'\x00\x00\x18\x00\x0c\x00\x06\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 96 `
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\x80\x00\xc0\x00`\x00`\x1f\xe00```````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 97 a
+  b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00\x7f\x80`\xc0```````````````\xc0\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 98 b
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 99 c
+  b'\x00\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x1f\xe00```````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 100 d
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````\x7f\xe0`\x00`\x00`\x000\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 101 e
+  b'\x00\x00\x00\x00\x00\x00\x07\xc0\x0e\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00?\x80\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 102 f
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````````````0`\x1f\xc0\x00\xc0\x00`\x00`\x00\xc0?\x80'  # 103 g
+  b'\x00\x00\x00\x00\x00\x00`\x00`\x00`\x00`\x00\x7f\x80`\xc0``````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 104 h
+  b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x1e\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 105 i
+  b'\x00\x00\x00\x00\x00\x00\x06\x00\x06\x00\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0c\x00x\x00'  # 106 j
+  b'\x00\x00\x00\x00\x00\x000\x000\x000\x000\x000\xc00\xc01\x803\x00>\x006\x003\x001\x800\xc00`0`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 107 k
+  b'\x00\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0e\x00\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 108 l
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00y\x80f\xc0f`f`f`f`f`f```````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 109 m
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0``````````````````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 110 n
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x800\xc0``````````````0\xc0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 111 o
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x80`\xc0```````````````\xc0\x7f\x80`\x00`\x00`\x00`\x00`\x00'  # 112 p
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00```````````````0`\x1f\xe0\x00`\x00`\x00`\x00`\x00`'  # 113 q
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe00``\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00`\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 114 r
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xe0`\x00`\x00`\x00`\x00?\xc0\x00`\x00`\x00`\x00`\x7f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 115 s
+  b'\x00\x00\x00\x00\x00\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00?\x80\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0e\x00\x07\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 116 t
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````````````````0`\x1f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 117 u
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00````````````0\xc00\xc0\x19\x80\x0f\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 118 v
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````f`f`f`f`f`f`6`\x19\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 119 w
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00````0\xc0\x19\x80\x0f\x00\x0f\x00\x19\x800\xc00\xc0````\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 120 x
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00``````````````````0`\x1f\xe0\x00`\x00`\x00`\x00\xc0\x7f\x80'  # 121 y
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xe0\x00`\x00\xc0\x01\x80\x03\x00\x06\x00\x0c\x00\x18\x000\x00`\x00\x7f\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 122 z
+  b'\x01\xe0\x03\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x0c\x008\x008\x00\x0c\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x03\x00\x01\xe0\x00\x00'  # 123 {
+  b'\x00\x00\x00\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00\x00\x00'  # 124 |
+  b'<\x00\x06\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x01\x80\x00\xe0\x00\xe0\x01\x80\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x06\x00<\x00\x00\x00'  # 125 }
+  b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008`l`\xc6\xc0\xc3\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 126 ~
+  b'\x00\x00\x0f\x00\x19\x80\x19\x80\x19\x80\x19\x80\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 176
+)
+_index = array('H', (
+  0, 46, 92, 138, 184, 230, 276, 322, 368, 414, 460, 506, 552, 598, 644, 690,
+  736, 782, 828, 874, 920, 966, 1012, 1058, 1104, 1150, 1196, 1242, 1288, 1334, 1380, 1426,
+  1472, 1518, 1564, 1610, 1656, 1702, 1748, 1794, 1840, 1886, 1932, 1978, 2024, 2070, 2116, 2162,
+  2208, 2254, 2300, 2346, 2392, 2438, 2484, 2530, 2576, 2622, 2668, 2714, 2760, 2806, 2852, 2898,
+  2944, 2990, 3036, 3082, 3128, 3174, 3220, 3266, 3312, 3358, 3404, 3450, 3496, 3542, 3588, 3634,
+  3680, 3726, 3772, 3818, 3864, 3910, 3956, 4002, 4048, 4094, 4140, 4186, 4232, 4278, 4324, 4370,
+  4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370,
+  4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370,
+  4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370, 4370,
+  4370, 4416,
+))
+_mv = memoryview(_data)
 
 def get_ch(ch):
-    c = ord(ch)
-    if c not in _g.keys():
-        return None, 0, 0
-    return memoryview(_g[c]), 23, 12
\ No newline at end of file
+    i = ord(ch) - 32
+    if 0 <= i < 145:
+        start = _index[i]
+        end = _index[i + 1]
+        if end > start:
+            return _mv[start:end], 23, 12
+    return None, 0, 0
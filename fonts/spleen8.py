@@ -33,6 +33,7 @@
 
     COMMENT "Copyright (c) 2018-2022, Frederic Cambus"
 '''
+from array import array
 version = '0.33'
 name = '-misc-spleen-medium-r-normal--8-80-72-72-c-50-iso10646-1'
 family = 'spleen'
@@ -63,107 +64,126 @@ def min_ch():
 def max_ch():
     return 176
 
-_g = {
-  32:b'\x00\x00\x00\x00\x00\x00\x00\x00',
-  33:b'     \x00 \x00',
-  34:b'PPP\x00\x00\x00\x00\x00',
-  35:b'\x00P\xf8PP\xf8P\x00',
-  36:b' p\xa0`00\xe0 ',
-  37:b'\x10\x90\xa0 @P\x90\x80',
-  38:b' PP`\xa8\x90h\x00',
-  39:b'   \x00\x00\x00\x00\x00',
-  40:b'\x10 @@@@ \x10',
-  41:b'@ \x10\x10\x10\x10 @',
-  42:b'\x00\x00\x90`\xf0`\x90\x00',
-  43:b'\x00\x00  \xf8  \x00',
-  44:b'\x00\x00\x00\x00\x00  @',
-  45:b'\x00\x00\x00\x00\xf0\x00\x00\x00',
-  46:b'\x00\x00\x00\x00\x00\x00 \x00',
-  47:b'\x10\x10  @@\x80\x80',
-  48:b'\x00`\x90\xb0\xd0\x90`\x00',
-  49:b'\x00 `   p\x00',
-  50:b'\x00`\x90\x10`\x80\xf0\x00',
-  51:b'\x00`\x90 \x10\x90`\x00',
-  52:b'\x00\x80\xa0\xa0\xf0  \x00',
-  53:b'\x00\xf0\x80\xe0\x10\x10\xe0\x00',
-  54:b'\x00`\x80\xe0\x90\x90`\x00',
-  55:b'\x00\xf0\x90\x10 @@\x00',
-  56:b'\x00`\x90`\x90\x90`\x00',
-  57:b'\x00`\x90\x90p\x10`\x00',
-  58:b'\x00\x00\x00 \x00\x00 \x00',
-  59:b'\x00\x00\x00 \x00  @',
-  60:b'\x00\x10 @@ \x10\x00',
-  61:b'\x00\x00\x00\xf0\x00\xf0\x00\x00',
-  62:b'\x00@ \x10\x10 @\x00',
-  63:b'`\x90\x10 @\x00@\x00',
-  64:b'\x00`\x90\xb0\xb0\x80p\x00',
-  65:b'\x00`\x90\x90\xf0\x90\x90\x00',
-  66:b'\x00\xe0\x90\xe0\x90\x90\xe0\x00',
-  67:b'\x00p\x80\x80\x80\x80p\x00',
-  68:b'\x00\xe0\x90\x90\x90\x90\xe0\x00',
-  69:b'\x00p\x80\xe0\x80\x80p\x00',
-  70:b'\x00p\x80\x80\xe0\x80\x80\x00',
-  71:b'\x00p\x80\xb0\x90\x90p\x00',
-  72:b'\x00\x90\x90\xf0\x90\x90\x90\x00',
-  73:b'\x00p    p\x00',
-  74:b'\x00p    \xc0\x00',
-  75:b'\x00\x90\x90\xe0\x90\x90\x90\x00',
-  76:b'\x00\x80\x80\x80\x80\x80p\x00',
-  77:b'\x00\x90\xf0\xf0\x90\x90\x90\x00',
-  78:b'\x00\x90\xd0\xd0\xb0\xb0\x90\x00',
-  79:b'\x00`\x90\x90\x90\x90`\x00',
-  80:b'\x00\xe0\x90\x90\xe0\x80\x80\x00',
-  81:b'\x00`\x90\x90\x90\x90`0',
-  82:b'\x00\xe0\x90\x90\xe0\x90\x90\x00',
-  83:b'\x00p\x80`\x10\x10\xe0\x00',
-  84:b'\x00\xf8     \x00',
-  85:b'\x00\x90\x90\x90\x90\x90p\x00',
-  86:b'\x00\x90\x90\x90\x90``\x00',
-  87:b'\x00\x90\x90\x90\xf0\xf0\x90\x00',
-  88:b'\x00\x90\x90``\x90\x90\x00',
-  89:b'\x00\x90\x90\x90p\x10\xe0\x00',
-  90:b'\x00\xf0\x10 @\x80\xf0\x00',
-  91:b'p@@@@@@p',
-  92:b'\x80\x80@@  \x10\x10',
-  93:b'p\x10\x10\x10\x10\x10\x10p',
-  94:b'\x00 P\x88\x00\x00\x00\x00',
-  95:b'\x00\x00\x00\x00\x00\x00\x00\xf0',
-  96:b'@ \x00\x00\x00\x00\x00\x00',
-  97:b'\x00\x00`\x10p\x90p\x00',
-  98:b'\x80\x80\xe0\x90\x90\x90\xe0\x00',
-  99:b'\x00\x00p\x80\x80\x80p\x00',
-  100:b'\x10\x10p\x90\x90\x90p\x00',
-  101:b'\x00\x00p\x90\xf0\x80p\x00',
-  102:b'0@@\xe0@@@\x00',
-  103:b'\x00\x00p\x90\x90`\x10\xe0',
-  104:b'\x80\x80\xe0\x90\x90\x90\x90\x00',
-  105:b'\x00 \x00`  0\x00',
-  106:b'\x00 \x00    \xc0',
-  107:b'\x80\x80\x90\xa0\xc0\xa0\x90\x00',
-  108:b'@@@@@@0\x00',
-  109:b'\x00\x00\x90\xf0\xf0\x90\x90\x00',
-  110:b'\x00\x00\xe0\x90\x90\x90\x90\x00',
-  111:b'\x00\x00`\x90\x90\x90`\x00',
-  112:b'\x00\x00\xe0\x90\x90\xe0\x80\x80',
-  113:b'\x00\x00p\x90\x90p\x10\x10',
-  114:b'\x00\x00p\x90\x80\x80\x80\x00',
-  115:b'\x00\x00p\x80`\x10\xe0\x00',
-  116:b'@@\xe0@@@0\x00',
-  117:b'\x00\x00\x90\x90\x90\x90p\x00',
-  118:b'\x00\x00\x90\x90\x90``\x00',
-  119:b'\x00\x00\x90\x90\xf0\xf0\x90\x00',
-  120:b'\x00\x00\x90``\x90\x90\x00',
-  121:b'\x00\x00\x90\x90\x90p\x10\xe0',
-  122:b'\x00\x00\xf0\x10 @\xf0\x00',
-  123:b'0@@\xc0\xc0@@0',
-  124:b'        ',
-  125:b'\xc0  00  \xc0',
-  126:b'\x00\x00\x00H\xb0\x00\x00\x00',
-  176:b'\x00\x00\x00\x00\x00\x00\x00\x00',
-}
+# Glyph table generated by tools/compact_fonts.py: the MONO_HLSB rows of every
+# glyph back to back in _data; glyph c spans _data[_index[c - 32]:_index[c - 31]],
+# an empty span means no glyph.
+_data = (
+  b'\x00\x00\x00\x00\x00\x00\x00\x00'  # 32
+  b'     \x00 \x00'  # 33 !
+  b'PPP\x00\x00\x00\x00\x00'  # 34 "
+  b'\x00P\xf8PP\xf8P\x00'  # 35 #
+  b' p\xa0`00\xe0 '  # 36 $
+  b'\x10\x90\xa0 @P\x90\x80'  # 37 %
+  b' PP`\xa8\x90h\x00'  # 38 &
+  b'   \x00\x00\x00\x00\x00'  # 39 '
+  b'\x10 @@@@ \x10'  # 40 (
+  b'@ \x10\x10\x10\x10 @'  # 41 )
+  b'\x00\x00\x90`\xf0`\x90\x00'  # 42 *
+  b'\x00\x00  \xf8  \x00'  # 43 +
+  b'\x00\x00\x00\x00\x00  @'  # 44 ,
+  b'\x00\x00\x00\x00\xf0\x00\x00\x00'  # 45 -
+  b'\x00\x00\x00\x00\x00\x00 \x00'  # 46 .
+  b'\x10\x10  @@\x80\x80'  # 47 /
+  b'\x00`\x90\xb0\xd0\x90`\x00'  # 48 0
+  b'\x00 `   p\x00'  # 49 1
+  b'\x00`\x90\x10`\x80\xf0\x00'  # 50 2
+  b'\x00`\x90 \x10\x90`\x00'  # 51 3
+  b'\x00\x80\xa0\xa0\xf0  \x00'  # 52 4
+  b'\x00\xf0\x80\xe0\x10\x10\xe0\x00'  # 53 5
+  b'\x00`\x80\xe0\x90\x90`\x00'  # 54 6
+  b'\x00\xf0\x90\x10 @@\x00'  # 55 7
+  b'\x00`\x90`\x90\x90`\x00'  # 56 8
+  b'\x00`\x90\x90p\x10`\x00'  # 57 9
+  b'\x00\x00\x00 \x00\x00 \x00'  # 58 :
+  b'\x00\x00\x00 \x00  @'  # 59 ;
+  b'\x00\x10 @@ \x10\x00'  # 60 <
+  b'\x00\x00\x00\xf0\x00\xf0\x00\x00'  # 61 =
+  b'\x00@ \x10\x10 @\x00'  # 62 >
+  b'`\x90\x10 @\x00@\x00'  # 63 ?
+  b'\x00`\x90\xb0\xb0\x80p\x00'  # 64 @
+  b'\x00`\x90\x90\xf0\x90\x90\x00'  # 65 A
+  b'\x00\xe0\x90\xe0\x90\x90\xe0\x00'  # 66 B
+  b'\x00p\x80\x80\x80\x80p\x00'  # 67 C
+  b'\x00\xe0\x90\x90\x90\x90\xe0\x00'  # 68 D
+  b'\x00p\x80\xe0\x80\x80p\x00'  # 69 E
+  b'\x00p\x80\x80\xe0\x80\x80\x00'  # 70 F
+  b'\x00p\x80\xb0\x90\x90p\x00'  # 71 G
+  b'\x00\x90\x90\xf0\x90\x90\x90\x00'  # 72 H
+  b'\x00p    p\x00'  # 73 I
+  b'\x00p    \xc0\x00'  # 74 J
+  b'\x00\x90\x90\xe0\x90\x90\x90\x00'  # 75 K
+  b'\x00\x80\x80\x80\x80\x80p\x00'  # 76 L
+  b'\x00\x90\xf0\xf0\x90\x90\x90\x00'  # 77 M
+  b'\x00\x90\xd0\xd0\xb0\xb0\x90\x00'  # 78 N
+  b'\x00`\x90\x90\x90\x90`\x00'  # 79 O
+  b'\x00\xe0\x90\x90\xe0\x80\x80\x00'  # 80 P
+  b'\x00`\x90\x90\x90\x90`0'  # 81 Q
+  b'\x00\xe0\x90\x90\xe0\x90\x90\x00'  # 82 R
+  b'\x00p\x80`\x10\x10\xe0\x00'  # 83 S
+  b'\x00\xf8     \x00'  # 84 T
+  b'\x00\x90\x90\x90\x90\x90p\x00'  # 85 U
+  b'\x00\x90\x90\x90\x90``\x00'  # 86 V
+  b'\x00\x90\x90\x90\xf0\xf0\x90\x00'  # 87 W
+  b'\x00\x90\x90``\x90\x90\x00'  # 88 X
+  b'\x00\x90\x90\x90p\x10\xe0\x00'  # 89 Y
+  b'\x00\xf0\x10 @\x80\xf0\x00'  # 90 Z
+  b'p@@@@@@p'  # 91 [
+  b'\x80\x80@@  \x10\x10'  # 92 \
+  b'p\x10\x10\x10\x10\x10\x10p'  # 93 ]
+  b'\x00 P\x88\x00\x00\x00\x00'  # 94 ^
+  b'\x00\x00\x00\x00\x00\x00\x00\xf0'  # 95 _
+  b'@ \x00\x00\x00\x00\x00\x00'  # 96 `
+  b'\x00\x00`\x10p\x90p\x00'  # 97 a
+  b'\x80\x80\xe0\x90\x90\x90\xe0\x00'  # 98 b
+  b'\x00\x00p\x80\x80\x80p\x00'  # 99 c
+  b'\x10\x10p\x90\x90\x90p\x00'  # 100 d
+  b'\x00\x00p\x90\xf0\x80p\x00'  # 101 e
+  b'0@@\xe0@@@\x00'  # 102 f
+  b'\x00\x00p\x90\x90`\x10\xe0'  # 103 g
+  b'\x80\x80\xe0\x90\x90\x90\x90\x00'  # 104 h
+  b'\x00 \x00`  0\x00'  # 105 i
+  b'\x00 \x00    \xc0'  # 106 j
+  b'\x80\x80\x90\xa0\xc0\xa0\x90\x00'  # 107 k
+  b'@@@@@@0\x00'  # 108 l
+  b'\x00\x00\x90\xf0\xf0\x90\x90\x00'  # 109 m
+  b'\x00\x00\xe0\x90\x90\x90\x90\x00'  # 110 n
+  b'\x00\x00`\x90\x90\x90`\x00'  # 111 o
+  b'\x00\x00\xe0\x90\x90\xe0\x80\x80'  # 112 p
+  b'\x00\x00p\x90\x90p\x10\x10'  # 113 q
+  b'\x00\x00p\x90\x80\x80\x80\x00'  # 114 r
+  b'\x00\x00p\x80`\x10\xe0\x00'  # 115 s
+  b'@@\xe0@@@0\x00'  # 116 t
+  b'\x00\x00\x90\x90\x90\x90p\x00'  # 117 u
+  b'\x00\x00\x90\x90\x90``\x00'  # 118 v
+  b'\x00\x00\x90\x90\xf0\xf0\x90\x00'  # 119 w
+  b'\x00\x00\x90``\x90\x90\x00'  # 120 x
+  b'\x00\x00\x90\x90\x90p\x10\xe0'  # 121 y
+  b'\x00\x00\xf0\x10 @\xf0\x00'  # 122 z
+  b'0@@\xc0\xc0@@0'  # 123 {
+  b'        '  # 124 |
+  b'\xc0  00  \xc0'  # 125 }
+  b'\x00\x00\x00H\xb0\x00\x00\x00'  # 126 ~
+  b'\x00\x00\x00\x00\x00\x00\x00\x00'  # 176
+)
+_index = array('H', (
+  0, 8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 112, 120,
+  128, 136, 144, 152, 160, 168, 176, 184, 192, 200, 208, 216, 224, 232, 240, 248,
+  256, 264, 272, 280, 288, 296, 304, 312, 320, 328, 336, 344, 352, 360, 368, 376,
+  384, 392, 400, 408, 416, 424, 432, 440, 448, 456, 464, 472, 480, 488, 496, 504,
+  512, 520, 528, 536, 544, 552, 560, 568, 576, 584, 592, 600, 608, 616, 624, 632,
+  640, 648, 656, 664, 672, 680, 688, 696, 704, 712, 720, 728, 736, 744, 752, 760,
+  760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+  760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+  760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760, 760,
+  760, 768,
+))
+_mv = memoryview(_data)
 
 def get_ch(ch):
-    c = ord(ch)
-    if c not in _g.keys():
-        return None, 0, 0
-    return memoryview(_g[c]), 8, 5
\ No newline at end of file
+    i = ord(ch) - 32
+    if 0 <= i < 145:
+        start = _index[i]
+        end = _index[i + 1]
+        if end > start:
+            return _mv[start:end], 8, 5
+    return None, 0, 0
@@ -0,0 +1,107 @@
+# A coalescing event bus for asyncio tasks. post() records an event type and wakes the
+# consumer through an asyncio.Event; repeats of a type still waiting are folded into the first.
+# get() hands out everything pending as one batch, highest priority first, no sooner than
+# min_interval after the previous batch unless an urgent event is waiting.
+
+import asyncio
+import time
+
+class EventBus:
+    def __init__(self, priorities=None, min_interval_ms=0, urgent=None):
+        self.priorities = priorities or {}
+        self.min_interval_ms = min_interval_ms
+        self.urgent = urgent                # events at or above this priority skip the interval
+        self._pending = {}                  # event -> ticks_ms it was first posted
+        self._flag = asyncio.Event()
+        self._last = None                   # ticks_ms the last batch went out
+        self._batch = ()                    # post times of the batch being handled
+        self.posted = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.max_depth = 0
+        self.handled = 0
+        self.latency_total_ms = 0
+        self.latency_max_ms = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def post(self, event):
+        self.posted += 1
+        if event in self._pending:
+            self.coalesced += 1
+        else:
+            self._pending[event] = time.ticks_ms()
+            self.max_depth = max(self.max_depth, len(self._pending))
+        self._flag.set()
+
+    def _holdoff(self):
+        # ms until the next batch may go out
+        if self._last is None or self.min_interval_ms <= 0:
+            return 0
+        if self.urgent is not None:
+            for event in self._pending:
+                if self.priorities.get(event, 0) >= self.urgent:
+                    return 0
+        return self.min_interval_ms - time.ticks_diff(time.ticks_ms(), self._last)
+
+    async def _wait(self, timeout_ms):
+        # True when woken by post(), False when timeout_ms (None: forever) passed first
+        self._flag.clear()
+        if timeout_ms is None:
+            await self._flag.wait()
+            return True
+        try:
+            await asyncio.wait_for(self._flag.wait(), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def get(self, timeout_ms=None):
+        """
+        Wait for the next batch of events, highest priority first. Returns () if timeout_ms
+        passes first, even while a batch is held back by the interval (it stays pending);
+        otherwise a held batch is sent as soon as the interval ends.
+        """
+        deadline = None if timeout_ms is None else time.ticks_add(time.ticks_ms(), timeout_ms)
+        while True:
+            left = None if deadline is None else time.ticks_diff(deadline, time.ticks_ms())
+            if left is not None and left <= 0:
+                return ()
+            if not self._pending:
+                if not await self._wait(left):
+                    return ()
+                continue
+            holdoff = self._holdoff()
+            if holdoff <= 0:
+                break
+            await self._wait(holdoff if left is None else min(holdoff, left))     # an urgent post() cuts the wait short
+        now = time.ticks_ms()
+        pending = self._pending
+        events = sorted(pending, key=lambda event: -self.priorities.get(event, 0))
+        self._batch = tuple(pending.values())
+        self._pending = {}
+        self._last = now
+        self.batches += 1
+        return events
+
+    def done(self):
+        # the consumer has acted on the last batch: account the latency from each post
+        now = time.ticks_ms()
+        for posted in self._batch:
+            latency = time.ticks_diff(now, posted)
+            self.latency_total_ms += latency
+            self.latency_max_ms = max(self.latency_max_ms, latency)
+        self.handled += len(self._batch)
+        self._batch = ()
+
+    def stats(self):
+        return {
+            "depth": len(self._pending),
+            "max_depth": self.max_depth,
+            "posted": self.posted,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "latency_avg_ms": self.latency_total_ms // self.handled if self.handled else 0,
+            "latency_max_ms": self.latency_max_ms,
+        }
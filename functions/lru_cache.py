@@ -0,0 +1,62 @@
+# A small least-recently-used cache, bounded by entry count and optionally by bytes.
+# MicroPython dicts don't keep insertion order, so recency is tracked in a list;
+# caches here hold tens of entries, which keeps the list operations cheap.
+
+class LRUCache:
+    def __init__(self, max_items=16, max_bytes=None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._data = {}
+        self._sizes = {}
+        self._order = []
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        order = self._order
+        if order[-1] != key:
+            order.remove(key)
+            order.append(key)
+        return value
+
+    def put(self, key, value, size=0):
+        if key in self._data:
+            self._order.remove(key)
+            self.bytes -= self._sizes[key]
+        self._data[key] = value
+        self._sizes[key] = size
+        self._order.append(key)
+        self.bytes += size
+        while self._order and (len(self._data) > self.max_items or
+                               (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            self._evict()
+        return value
+
+    def _evict(self):
+        key = self._order.pop(0)
+        del self._data[key]
+        self.bytes -= self._sizes.pop(key)
+        self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self._sizes.clear()
+        self._order.clear()
+        self.bytes = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
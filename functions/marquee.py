@@ -0,0 +1,50 @@
+# Marquee: scrolls a string that's too long for its box across one line of a display.
+# The text is rendered once into an offscreen strip; each step() only blits a window of
+# that strip into the box, so nothing is re-rendered and only the box is marked for sending.
+
+import framebuf
+from functions.string_writer import ezFBfont
+
+# maps strip ink (1) to 0 and background (0) to 1, for dark text on a lit box
+_INVERT_PALETTE = framebuf.FrameBuffer(bytearray(b"\x01"), 2, 1, framebuf.MONO_HMSB)
+
+class Marquee:
+    def __init__(self, device, font, text, x, y, width, fg=1, bg=0, gap=24, step=2, hgap=0):
+        self._device = device
+        self.x = x
+        self.y = y
+        self.width = width
+        self.step_px = step
+        self._palette = None if fg else _INVERT_PALETTE
+        writer = ezFBfont(device, font, hgap=hgap)
+        text_w, self.height = writer.size(text)
+        # short text just sits centred in the box; long text wraps round with a gap
+        self.scrolling = text_w > width
+        self._strip_w = text_w + gap if self.scrolling else width
+        pages = (self.height + 7) >> 3
+        # one spare page row, so a view starting at any column still spans pages * stride bytes
+        self._buf = bytearray((pages + 1) * self._strip_w)
+        self._mv = memoryview(self._buf)
+        strip = framebuf.FrameBuffer(self._buf, self._strip_w, self.height, framebuf.MONO_VLSB)
+        x_text = 0 if self.scrolling else (width - text_w) // 2
+        ezFBfont(strip, font, fg=1, bg=0, hgap=hgap).write(text, x_text, 0, halign='left', valign='top')
+        self.offset = 0
+
+    def _blit(self, col, x, w):
+        # a window of the strip: same buffer, offset by col, with the strip's full width as stride
+        self._device.blit((self._mv[col:], w, self.height, framebuf.MONO_VLSB, self._strip_w),
+                          x, self.y, -1, self._palette)
+
+    def draw(self):
+        first = min(self.width, self._strip_w - self.offset)
+        self._blit(self.offset, self.x, first)
+        if first < self.width:
+            self._blit(0, self.x + first, self.width - first)
+
+    def step(self):
+        # advances and redraws; False when the text fits and there's nothing to scroll
+        if not self.scrolling:
+            return False
+        self.offset = (self.offset + self.step_px) % self._strip_w
+        self.draw()
+        return True
@@ -0,0 +1,69 @@
+# Render profiler, off until enable(). Each place worth timing gets a named Span once, at
+# construction, and wraps the work in start()/stop(); spans with the same name share one set of
+# Timings. Disabled, start() and stop() are a flag test each; enabled, they allocate nothing.
+#
+#   Profiler.enable()
+#   ...
+#   Profiler.dump()                 # table of every span that has run
+
+from time import ticks_us, ticks_diff
+from functions.timings import Timings
+
+HIST_EDGES = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)    # us; one more bucket past the last edge
+
+SPANS = {}                      # name -> Span, for dump()
+_enabled = False
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+def enabled():
+    return _enabled
+
+class Span(Timings):
+    # a span doesn't nest with itself: a second start() before stop() restarts it
+    def __init__(self, name):
+        super().__init__(HIST_EDGES)
+        self.name = name
+        self._t0 = None
+
+    def start(self):
+        self._t0 = ticks_us() if _enabled else None
+
+    def stop(self):
+        if self._t0 is not None:
+            self.add(ticks_diff(ticks_us(), self._t0))
+            self._t0 = None
+
+    def add(self, us):
+        if _enabled:
+            super().add(us)
+
+def span(name):
+    # the span called name, shared by everything timing under that name
+    s = SPANS.get(name)
+    if s is None:
+        s = SPANS[name] = Span(name)
+    return s
+
+def summary():
+    """
+    The table of every span that has run, as a list of lines.
+    """
+    lines = ["span                    calls  total ms  avg us  max us  <100us .. >100ms"]
+    for name in sorted(SPANS):
+        s = SPANS[name]
+        if not s.count:
+            continue
+        lines.append("%-22s %6d %9d %7d %7d  %s" % (
+            name[:22], s.count, s.total_us() // 1000, s.avg_us(), s.max_us, s.hist_row()))
+    return lines
+
+def dump():
+    for line in summary():
+        print(line)
+
+def reset():
+    for s in SPANS.values():
+        s.reset()
@@ -2,9 +2,56 @@
 # https://github.com/easytarget/microPyEZfonts/blob/main/ezFBfont.py
 
 import framebuf
+from array import array
+from functions.lru_cache import LRUCache
+import functions.profiler as Profiler
+
+GLYPH_CACHE_SIZE = 64   # glyphs kept per font, shared by every writer using that font
+STRING_CACHE_SIZE = 32  # rendered lines kept for write(..., cache=True), shared by every writer
+STRING_CACHE_BYTES = 4096
+LAYOUT_CACHE_SIZE = 16  # wrapped text layouts kept for layout()/write_box(), shared by every writer
+ELLIPSIS = '...'        # ends the last line when wrapped text doesn't fit its box
+
+# Per-font metrics, built once when the first writer loads a font and shared by every writer on it
+class FontTable():
+
+    def __init__(self, font):
+        self.height = font.height()
+        self.baseline = font.baseline()
+        self.lo = font.min_ch()
+        # advance width per char code from min_ch to max_ch, 0 where the font has no glyph
+        self.widths = array('B', bytes(font.max_ch() - self.lo + 1))
+        for i in range(len(self.widths)):
+            glyph, _, char_width = font.get_ch(chr(self.lo + i))
+            if glyph is not None:
+                self.widths[i] = char_width
+        # subset fonts (tools/subset_fonts.py) name a char to draw in place of the ones they dropped
+        self.fallback = font.fallback() if hasattr(font, 'fallback') else None
+        self.missing = 0 if self.fallback is None else font.get_ch(self.fallback)[2]
+        self.glyphs = LRUCache(GLYPH_CACHE_SIZE)    # char -> (glyph memoryview, width, height, format, stride)
+
+    def line_width(self, string, hgap):
+        widths = self.widths
+        lo = self.lo
+        n = len(widths)
+        missing = self.missing
+        x = 0
+        for char in string:
+            c = ord(char) - lo
+            w = widths[c] if 0 <= c < n else 0
+            if not w:
+                w = missing
+            if w:
+                x += w + hgap
+        return x - hgap if x != 0 else x   # remove any trailing hgap
 
 # Basic string writing class
 class ezFBfont():
+    _palettes = {}      # (fg << 16 | bg) -> palette FrameBuffer, colors already byte-swapped
+    _tables = {}        # font name -> FontTable
+    _strings = LRUCache(STRING_CACHE_SIZE, STRING_CACHE_BYTES)     # (font name, hgap, line) -> bitmap tuple
+    _line_palettes = {} # (fg, bg, tkey) -> (palette, key) for blitting a cached line
+    _layouts = LRUCache(LAYOUT_CACHE_SIZE)     # (font name, hgap, vgap, text, w, h, halign, valign) -> lines
 
     def __init__(self, device,
                  font,
@@ -29,6 +76,14 @@ class ezFBfont():
         self._palette_format = framebuf.RGB565  # support up to 65536 colors when blitting
         # byte order for 16bit colors
         self._cswap = cswap
+        # width table and glyph cache shared by every writer on this font
+        table = ezFBfont._tables.get(self.name)
+        if table is None:
+            table = ezFBfont._tables[self.name] = FontTable(font)
+        self._table = table
+        self._glyph_cache = table.glyphs
+        # write() timings, one span per font (fonts.spleen12 -> 'write spleen12')
+        self._span = Profiler.span('write ' + self.name.rpartition('.')[2])
         # inform
         if verbose:
             fstr = '{} : initialised: height: {}, {} width: {}, baseline: {}'
@@ -49,33 +104,110 @@ class ezFBfont():
         return v
 
     def _line_size(self, string):
-        x = 0
-        for char in string:
-            _, _, char_width = self._font.get_ch(char)
-            x += char_width + self.hgap if char_width > 0 else 0
-        x = x - self.hgap if x != 0 else x   # remove any trailing hgap
-        return x, self._font.height()
+        return self._table.line_width(string, self.hgap), self._table.height
 
     def _swap_bytes(self, color):
         # flip the left and right bytes in a 16 bit color word if required
         return ((color & 255) << 8) + (color >> 8) if self._cswap else color
 
-    def _put_char(self, char, x, y, fg, bg, tkey):
-        # fetch the glyph
-        glyph, char_height, char_width = self._font.get_ch(char)
+    def _palette(self, fg, bg):
+        # one 2-color palette per (fg, bg) pair, built on first use
+        fg = self._swap_bytes(fg)
+        bg = self._swap_bytes(bg)
+        key = fg << 16 | bg
+        palette = ezFBfont._palettes.get(key)
+        if palette is None:
+            palette = framebuf.FrameBuffer(bytearray(self._font_colors * 2), self._font_colors, 1, self._palette_format)
+            palette.pixel(0, 0, bg)
+            palette.pixel(self._font_colors - 1, 0, fg)
+            ezFBfont._palettes[key] = palette
+        return palette
+
+    def _glyph(self, char):
+        # (buffer, width, height, format, stride) for blit(); wraps the font's own bytes, no copy.
+        # A tuple's stride isn't rounded up to whole bytes the way FrameBuffer() rounds it, so pass it
+        glyph = self._glyph_cache.get(char)
+        if glyph is None:
+            buf, char_height, char_width = self._font.get_ch(char)
+            if buf is None:
+                if self._table.fallback is None:
+                    return None
+                buf, char_height, char_width = self._font.get_ch(self._table.fallback)
+            glyph = self._glyph_cache.put(char, (buf, char_width, char_height, self._font_format, (char_width + 7) & ~7))
+        return glyph
+
+    def _line_bitmap(self, line):
+        # the line rendered once into a 2-bit offscreen: 0 = glyph bg, 1 = glyph fg, 2 = untouched
+        # (hgap columns), so a single blit leaves the same pixels alone as drawing char by char.
+        # None if the line has missing chars; those go through _put_char, which reports them
+        key = (self.name, self.hgap, line)
+        bitmap = ezFBfont._strings.get(key)
+        if bitmap is None:
+            for char in line:
+                if self._glyph(char) is None:
+                    return None
+            wide, high = self._line_size(line)
+            if wide == 0:
+                return None
+            stride = (wide + 3) & ~3
+            buf = bytearray(stride // 4 * high)
+            fb = framebuf.FrameBuffer(buf, wide, high, framebuf.GS2_HMSB)
+            fb.fill(2)
+            x = 0
+            for char in line:
+                glyph = self._glyph(char)
+                fb.blit(glyph, x, 0)
+                x += glyph[1] + self.hgap
+            bitmap = ezFBfont._strings.put(key, (buf, wide, high, framebuf.GS2_HMSB, stride), len(buf))
+        return bitmap
+
+    def _line_palette(self, fg, bg, tkey):
+        # maps a cached line's 0/1/2 to bg/fg/key; untouched pixels take the key color so blit skips
+        # them, and glyph pixels are keyed exactly as _put_char's palette would key them
+        entry = ezFBfont._line_palettes.get((fg, bg, tkey))
+        if entry is None:
+            sfg = self._swap_bytes(fg)
+            sbg = self._swap_bytes(bg)
+            key = tkey
+            if key == -1:
+                key = 2
+                while key in (sfg, sbg):
+                    key += 1
+            palette = framebuf.FrameBuffer(bytearray(8), 4, 1, self._palette_format)
+            palette.pixel(0, 0, sbg)
+            palette.pixel(1, 0, sfg)
+            palette.pixel(2, 0, key)
+            palette.pixel(3, 0, key)
+            entry = ezFBfont._line_palettes[(fg, bg, tkey)] = (palette, key)
+        return entry
+
+    @staticmethod
+    def set_string_cache(max_bytes=None, max_items=None):
+        # resize the shared rendered-line cache; evicts down to the new limits on the next put
+        if max_bytes is not None:
+            ezFBfont._strings.max_bytes = max_bytes
+        if max_items is not None:
+            ezFBfont._strings.max_items = max_items
+
+    @staticmethod
+    def string_cache_stats():
+        c = ezFBfont._strings
+        return {
+            "entries": len(c),
+            "bytes": c.bytes,
+            "max_bytes": c.max_bytes,
+            "hits": c.hits,
+            "misses": c.misses,
+            "hit_rate": c.hit_rate(),
+            "evictions": c.evictions,
+        }
+
+    def _put_char(self, char, x, y, palette, tkey):
+        glyph = self._glyph(char)
         if glyph is None:
             return None, None  # Nothing to write
-        # buffers
-        palette_buf = bytearray(self._font_colors * 2)
-        buf = bytearray(glyph)
-        # assemble color map
-        palette = framebuf.FrameBuffer(palette_buf, self._font_colors, 1, self._palette_format)
-        palette.pixel(0, 0, self._swap_bytes(bg))
-        palette.pixel(self._font_colors -1, 0, self._swap_bytes(fg))
-        # fetch and blit the glyph
-        charbuf = framebuf.FrameBuffer(buf, char_width, char_height, self._font_format)
-        self._device.blit(charbuf, x, y, tkey, palette)
-        return char_width, char_height
+        self._device.blit(glyph, x, y, tkey, palette)
+        return glyph[1], glyph[2]
 
     def set_default(self, fg=None, bg=None, tkey=None,
                     halign=None, valign=None, hgap=None, vgap=None, split=None, verbose=None):
@@ -102,7 +234,7 @@ class ezFBfont():
         for line in lines:
             x, _ = self._line_size(line)
             w = max(w, x)  # record the widest line
-        h = (len(lines) * (self._font.height() + self.vgap)) - self.vgap
+        h = (len(lines) * (self._table.height + self.vgap)) - self.vgap
         return w, h
 
     def rect(self, string, x, y, halign=None, valign=None):
@@ -121,7 +253,7 @@ class ezFBfont():
             xmin = x - wide
         ymin = y
         if valign == 'baseline':
-            ymin = y - self._font.baseline()
+            ymin = y - self._table.baseline
         elif valign == 'center':
             ymin = int(y - (high / 2))
         elif valign == 'bottom':
@@ -130,7 +262,9 @@ class ezFBfont():
         return xmin,ymin,wide,high
 
     def write(self, string, x, y, fg=None, bg=None, tkey=None,
-              halign=None, valign=None):
+              halign=None, valign=None, cache=False):
+        # cache=True renders each line once into a shared bitmap cache and blits it whole
+        # afterwards; meant for labels that are redrawn unchanged every refresh
         if len(string) == 0:
             return True
         all_chars = True
@@ -140,19 +274,32 @@ class ezFBfont():
         tkey = self.tkey if tkey is None else tkey
         halign = self.halign if halign is None else self._check_halign(halign)
         valign = self.valign if valign is None else self._check_valign(valign)
+        self._span.start()
+        palette = self._palette(fg, bg)
+        table = self._table
+        hgap = self.hgap
+        vgap = self.vgap
+        line_high = table.height
         # Break the string into lines
         lines = string.split(self.split)
         # vertical alignment
-        high = (len(lines) * (self._font.height() + self.vgap)) - self.vgap
+        high = (len(lines) * (line_high + vgap)) - vgap
         ypos = y
         if valign == 'baseline':
-            ypos = y - self._font.baseline() + 1
+            ypos = y - table.baseline + 1
         elif valign == 'center':
             ypos = int(y - (high / 2))
         elif valign == 'bottom':
             ypos = y - high
+        if cache:
+            line_palette, line_key = self._line_palette(fg, bg, tkey)
         for line in lines:
-            wide, high = self._line_size(line)
+            # line width from the cached bitmap or the width table; left-aligned lines need neither
+            bitmap = self._line_bitmap(line) if cache and line else None
+            if bitmap is not None:
+                wide = bitmap[1]
+            elif halign != 'left':
+                wide = table.line_width(line, hgap)
             # horizontal alignment
             if halign == 'left':
                 xpos = x
@@ -161,41 +308,109 @@ class ezFBfont():
             else:
                 xpos = int(x - (wide / 2))
             # write the line
-            for char in line:
-                cx, _ = self._put_char(char, xpos, ypos, fg, bg, tkey)
-                if cx is None:
-                    if self._verbose:
-                        print('{}: missing char: {} (0x{:02X})'.format(self.name, repr(char), ord(char)))
-                    all_chars = False
-                else:
-                    xpos += cx + self.hgap
-            ypos += high + self.vgap
+            if bitmap is not None:
+                self._device.blit(bitmap, xpos, ypos, line_key, line_palette)
+            else:
+                for char in line:
+                    cx, _ = self._put_char(char, xpos, ypos, palette, tkey)
+                    if cx is None:
+                        if self._verbose:
+                            print('{}: missing char: {} (0x{:02X})'.format(self.name, repr(char), ord(char)))
+                        all_chars = False
+                    else:
+                        xpos += cx + hgap
+            ypos += line_high + vgap
+        self._span.stop()
         return all_chars
     
-    def split_text(text): 
-        words = text.split()
+    def _wrap(self, text, w):
+        # greedy word wrap against the real glyph widths; words wider than the box are broken
+        table = self._table
+        hgap = self.hgap
+        space = table.line_width(' ', hgap)
+        join = space + 2 * hgap if space else hgap
         lines = []
-        current = ""
-
-        for word in words:
-            # if adding this word exceeds line length, start new line
-            if len(current) + len(word) + (1 if current else 0) > 10:
-                lines.append(current)
-                current = word
+        current = ''
+        current_w = 0
+        for word in text.split():
+            word_w = table.line_width(word, hgap)
+            while word_w > w and len(word) > 1:
+                # hard-break an over-long word at the last char that still fits
+                if current:
+                    lines.append(current)
+                    current = ''
+                    current_w = 0
+                cut = len(word) - 1
+                while cut > 1 and table.line_width(word[:cut], hgap) > w:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+                word_w = table.line_width(word, hgap)
+            if current and current_w + join + word_w <= w:
+                current += ' ' + word
+                current_w += join + word_w
             else:
-                current += (" " if current else "") + word
-
+                if current:
+                    lines.append(current)
+                current = word
+                current_w = word_w
         if current:
             lines.append(current)
+        return lines
 
-        # if too many lines, try to rebalance to <= 3
-        while len(lines) > 3:
-            # merge the shortest two consecutive lines
-            shortest_i = min(range(len(lines)-1), key=lambda i: len(lines[i]) + len(lines[i+1]))
-            merged = lines[shortest_i] + " " + lines[shortest_i+1]
-            lines[shortest_i:shortest_i+2] = [merged]
+    def layout(self, text, w, h, halign=None, valign=None):
+        """
+        Wrap text into a w x h pixel box: returns ((line, dx, dy), ...) with each line's offset
+        from the box's top left. Lines that don't fit the height are dropped and the last one
+        ends in ELLIPSIS. Memoized, so redrawing the same text costs a cache lookup.
+        """
+        halign = self.halign if halign is None else self._check_halign(halign)
+        valign = self.valign if valign is None else self._check_valign(valign)
+        key = (self.name, self.hgap, self.vgap, text, w, h, halign, valign)
+        placed = ezFBfont._layouts.get(key)
+        if placed is not None:
+            return placed
+        table = self._table
+        hgap = self.hgap
+        line_high = table.height + self.vgap
+        lines = self._wrap(text, w)
+        max_lines = max(1, (h + self.vgap) // line_high)
+        if len(lines) > max_lines:
+            lines = lines[:max_lines]
+            last = lines[-1]
+            while last and table.line_width(last + ELLIPSIS, hgap) > w:
+                last = last[:-1]
+            lines[-1] = last.rstrip() + ELLIPSIS
+        high = len(lines) * line_high - self.vgap
+        if valign == 'center':
+            dy = (h - high) // 2
+        elif valign == 'bottom':
+            dy = h - high
+        else:
+            dy = 0
+        placed = []
+        for line in lines:
+            wide = table.line_width(line, hgap)
+            if halign == 'center':
+                dx = (w - wide) // 2
+            elif halign == 'right':
+                dx = w - wide
+            else:
+                dx = 0
+            placed.append((line, dx, dy))
+            dy += line_high
+        return ezFBfont._layouts.put(key, tuple(placed))
 
-        # center each line within 10 characters
-        lines = [line.strip().center(10) for line in lines]
+    def fits(self, text, w, h):
+        # True when layout() places all of text in a w x h box, without cutting it short
+        line_high = self._table.height + self.vgap
+        return len(self._wrap(text, w)) <= max(1, (h + self.vgap) // line_high)
 
-        return "\n".join(lines)
\ No newline at end of file
+    def write_box(self, text, x, y, w, h, fg=None, bg=None, tkey=None,
+                  halign=None, valign=None, cache=False):
+        # wrap and draw text inside the box at x, y; see layout()
+        all_chars = True
+        for line, dx, dy in self.layout(text, w, h, halign, valign):
+            if not self.write(line, x + dx, y + dy, fg, bg, tkey, 'left', 'top', cache):
+                all_chars = False
+        return all_chars
@@ -0,0 +1,56 @@
+# Running ticks_us timings: call count, total and worst time, and a fixed-bucket histogram.
+# Shared by the I2C tracer (per address) and the render profiler (per span); each passes its
+# own bucket edges. Adding a time allocates nothing.
+
+class Timings:
+    def __init__(self, edges, window=0):
+        """
+        edges: ascending bucket edges in us; bucket i counts edges[i-1] <= us < edges[i],
+            and one more bucket counts everything past the last edge
+        window: if set, the histogram covers only the last window times (the totals still
+            cover every one since reset)
+        """
+        self.edges = edges
+        self.hist = [0] * (len(edges) + 1)
+        self._ring = bytearray(window) if window else None     # bucket of each time in the window
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.ms = 0
+        self.us = 0                 # carried into ms, so the total stays a small int
+        self.max_us = 0
+        self._pos = 0
+        for i in range(len(self.hist)):
+            self.hist[i] = 0
+
+    def add(self, us):
+        self.count += 1
+        self.us += us
+        if self.us >= 1000000:
+            self.ms += self.us // 1000
+            self.us %= 1000
+        if us > self.max_us:
+            self.max_us = us
+        bucket = 0
+        for edge in self.edges:
+            if us < edge:
+                break
+            bucket += 1
+        ring = self._ring
+        if ring is not None:
+            pos = self._pos
+            if self.count > len(ring):          # the window is full: drop the oldest time
+                self.hist[ring[pos]] -= 1
+            ring[pos] = bucket
+            self._pos = (pos + 1) % len(ring)
+        self.hist[bucket] += 1
+
+    def total_us(self):
+        return self.ms * 1000 + self.us
+
+    def avg_us(self):
+        return self.total_us() // self.count if self.count else 0
+
+    def hist_row(self):
+        return " ".join(str(n) for n in self.hist)
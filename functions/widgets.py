@@ -0,0 +1,193 @@
+# Retained-mode widgets for the OLED panels. A widget owns a box on one display and is bound
+# to a source: a callable returning the value it shows. It keeps its box rendered in an
+# offscreen MONO_VLSB bitmap and only re-renders when the value changes; Panel.refresh() blits
+# just the changed boxes, so the display's dirty tracking sends just those regions on show().
+# A Router narrows a batch of events down to the panels whose state they change.
+
+import framebuf
+from functions.string_writer import ezFBfont
+from functions.marquee import Marquee
+import functions.profiler as Profiler
+
+class Widget:
+    def __init__(self, device, x, y, w, h, source, bg=0):
+        self._device = device
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.source = source
+        self.bg = bg
+        self._buf = bytearray(((h + 7) >> 3) * w)
+        self._fb = framebuf.FrameBuffer(self._buf, w, h, framebuf.MONO_VLSB)
+        self._value = None
+        self._rendered = False
+        self._span = Profiler.span(type(self).__name__)     # repaint timings, one span per widget type
+
+    def render(self, fb, value):
+        # draws value into fb, which is already filled with bg
+        pass
+
+    def update(self, force=False):
+        """
+        Re-render and blit the box if the bound value changed (or force). True if it was drawn.
+        """
+        value = self.source()
+        changed = not self._rendered or value != self._value
+        if not changed and not force:
+            return False
+        self._span.start()
+        if changed:
+            self._fb.fill(self.bg)
+            self.render(self._fb, value)
+            self._value = value
+            self._rendered = True
+        self._device.blit((self._buf, self.w, self.h, framebuf.MONO_VLSB), self.x, self.y)
+        self._span.stop()
+        return True
+
+class Text(Widget):
+    # a string aligned in the box, dy pixels down from its top. cache=True for sources that cycle
+    # through a few fixed strings (day names...): each is rendered once into ezFBfont's line cache
+    def __init__(self, device, x, y, w, h, source, font, halign='left', fg=1, bg=0, hgap=0, dy=0, cache=False):
+        super().__init__(device, x, y, w, h, source, bg)
+        self._writer = ezFBfont(self._fb, font, fg=fg, bg=bg, hgap=hgap, halign=halign, valign='top')
+        self._anchor = 0 if halign == 'left' else w if halign == 'right' else w // 2
+        self._dy = dy
+        self._cache = cache
+
+    def render(self, fb, value):
+        if value:
+            self._writer.write(value, self._anchor, self._dy, cache=self._cache)
+
+class Band(Text):
+    # the lit header strip across the top of a panel, with dark centred text
+    def __init__(self, device, source, font, w=128, h=16, hgap=2):
+        super().__init__(device, 0, 0, w, h, source, font, halign='center', fg=0, bg=1, hgap=hgap, dy=1)
+
+class WrappedText(Widget):
+    # text word-wrapped to the box by ezFBfont.layout(). With overflow='scroll', text too long for
+    # the box runs through it as a one-line Marquee instead, advanced by scroll()
+    def __init__(self, device, x, y, w, h, source, font, halign='center', valign='center', fg=1, bg=0,
+                 overflow='ellipsis', step=2):
+        super().__init__(device, x, y, w, h, source, bg)
+        self._writer = ezFBfont(self._fb, font, fg=fg, bg=bg, halign=halign, valign=valign)
+        self._font = font
+        self.fg = fg
+        self.overflow = overflow
+        self.step = step
+        self._marquee = None
+
+    def render(self, fb, value):
+        self._marquee = None
+        if not value:
+            return
+        if self.overflow == 'scroll' and not self._writer.fits(value, self.w, self.h):
+            high = self._font.height()
+            self._marquee = Marquee(fb, self._font, value, 0, (self.h - high) // 2, self.w,
+                                    fg=self.fg, bg=self.bg, step=self.step)
+            self._marquee.draw()
+        else:
+            self._writer.write_box(value, 0, 0, self.w, self.h)
+
+    def scroll(self):
+        """
+        Move scrolling text on a step and blit the box. False when the text fits and stays put.
+        """
+        if self._marquee is None or not self._marquee.step():
+            return False
+        self._device.blit((self._buf, self.w, self.h, framebuf.MONO_VLSB), self.x, self.y)
+        return True
+
+class Icon(Widget):
+    # source returns an icon name for the display's load_icon(); its set bits are drawn lit
+    def __init__(self, device, x, y, w, h, source, bg=0):
+        super().__init__(device, x, y, w, h, source, bg)
+
+    def render(self, fb, value):
+        if not value:
+            return
+        try:
+            buf, width, height = self._device.load_icon(value)
+        except OSError:
+            print("PBM file not found:", f"graphics/{value}.pbm")
+            return
+        fb.blit((buf, width, height, framebuf.MONO_VLSB), 0, 0, 0)
+
+class Value(Widget):
+    # a label at the left and the value with its unit right-aligned. source returns the value,
+    # or (label, value) when the label changes too; a value of None leaves just the label.
+    # Labels are fixed strings, so they are drawn from ezFBfont's line cache
+    def __init__(self, device, x, y, w, h, source, font, unit='', label='', label_font=None,
+                 label_dy=0, dy=0, fg=1, bg=0):
+        super().__init__(device, x, y, w, h, source, bg)
+        self.unit = unit
+        self.label = label
+        self._writer = ezFBfont(self._fb, font, fg=fg, bg=bg, halign='right', valign='top')
+        self._label_writer = ezFBfont(self._fb, label_font or font, fg=fg, bg=bg, halign='left', valign='top')
+        self._label_dy = label_dy
+        self._dy = dy
+
+    def render(self, fb, value):
+        label = self.label
+        if isinstance(value, tuple):
+            label, value = value
+        if label:
+            self._label_writer.write(label, 0, self._label_dy, cache=True)
+        if value is not None:
+            self._writer.write(f"{value}{self.unit}", self.w, self._dy)
+
+class Panel:
+    # the widgets on one display
+    def __init__(self, device, widgets):
+        self.device = device
+        self.widgets = widgets
+        self._drawn = False
+
+    def refresh(self, force=False):
+        """
+        Repaint the widgets whose values changed; the first refresh (or force) clears the
+        display and draws them all. Returns how many widgets were drawn.
+        """
+        if force or not self._drawn:
+            self.device.fill(0)
+            self._drawn = True
+            force = True
+        drawn = 0
+        for widget in self.widgets:
+            if widget.update(force):
+                drawn += 1
+        return drawn
+
+class Router:
+    # which panels an event can change. fields maps each state field to the panels showing it;
+    # routes maps each event to the fields it updates, or None for all of them
+    def __init__(self, panels, fields, routes):
+        self.panels = tuple(panels)
+        self._routes = {}
+        for event, names in routes.items():
+            if names is None:
+                self._routes[event] = self.panels
+            else:
+                hit = set()
+                for name in names:
+                    hit.update(fields[name])
+                self._routes[event] = tuple(p for p in self.panels if p in hit)
+        self.skipped = {}
+
+    def route(self, events):
+        """
+        The panels to redraw for a batch of events, in panel order. Events without a route
+        redraw every panel. Counts, per event type, the panels that event didn't need.
+        """
+        hit = set()
+        for event in events:
+            panels = self._routes.get(event, self.panels)
+            hit.update(panels)
+            self.skipped[event] = self.skipped.get(event, 0) + len(self.panels) - len(panels)
+        return tuple(p for p in self.panels if p in hit)
+
+    def summary(self, names=None):
+        # one line per event type seen, named through names when given
+        return [f"{(names or {}).get(event, event)}: {count} panels skipped"
+                for event, count in sorted(self.skipped.items())]
@@ -0,0 +1,235 @@
+# Code generated by tools/compile_assets.py from the graphics/ folder - do not edit.
+# Bitmaps are MONO_VLSB: one byte per column per 8-pixel page, pages top to bottom.
+
+# font-pet-me-128.dat: 8 column bytes per glyph, from chr(32)
+FONT_PET_ME = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00OO\x00\x00\x00\x00\x07\x07\x00\x00\x07\x07\x00\x14\x7f\x7f\x14\x14\x7f\x7f\x14'
+    b'\x00$.kk:\x12\x00\x00c3\x18\x0cfc\x00\x002\x7fMMwrP\x00\x00\x00\x04\x06\x03\x01\x00'
+    b'\x00\x00\x1c>cA\x00\x00\x00\x00Ac>\x1c\x00\x00\x08*>\x1c\x1c>*\x08\x00\x08\x08>>\x08\x08\x00'
+    b'\x00\x00\x80\xe0`\x00\x00\x00\x00\x08\x08\x08\x08\x08\x08\x00\x00\x00\x00``\x00\x00\x00\x00@`0\x18\x0c\x06\x02'
+    b'\x00>\x7fIE\x7f>\x00\x00@D\x7f\x7f@@\x00\x00bsQIOF\x00\x00"cII\x7f6\x00'
+    b"\x00\x18\x18\x14\x16\x7f\x7f\x10\x00'gEE}9\x00\x00>\x7fII{2\x00\x00\x03\x03y}\x07\x03\x00"
+    b'\x006\x7fII\x7f6\x00\x00&oII\x7f>\x00\x00\x00\x00$$\x00\x00\x00\x00\x00\x80\xe4d\x00\x00\x00'
+    b'\x00\x08\x1c6cAA\x00\x00\x14\x14\x14\x14\x14\x14\x00\x00AAc6\x1c\x08\x00\x00\x02\x03QY\x0f\x06\x00'
+    b'\x00>\x7fAMO.\x00\x00|~\x0b\x0b~|\x00\x00\x7f\x7fII\x7f6\x00\x00>\x7fAAc"\x00'
+    b'\x00\x7f\x7fAc>\x1c\x00\x00\x7f\x7fIIAA\x00\x00\x7f\x7f\t\t\x01\x01\x00\x00>\x7fAI{:\x00'
+    b'\x00\x7f\x7f\x08\x08\x7f\x7f\x00\x00\x00A\x7f\x7fA\x00\x00\x00 `A\x7f?\x01\x00\x00\x7f\x7f\x1c6cA\x00'
+    b'\x00\x7f\x7f@@@@\x00\x00\x7f\x7f\x06\x0c\x06\x7f\x7f\x00\x7f\x7f\x0e\x1c\x7f\x7f\x00\x00>\x7fAA\x7f>\x00'
+    b'\x00\x7f\x7f\t\t\x0f\x06\x00\x00\x1e?!a\x7f^\x00\x00\x7f\x7f\x199oF\x00\x00&oII{2\x00'
+    b'\x00\x01\x01\x7f\x7f\x01\x01\x00\x00?\x7f@@\x7f?\x00\x00\x1f?``?\x1f\x00\x00\x7f\x7f0\x180\x7f\x7f'
+    b'\x00cw\x1c\x1cwc\x00\x00\x07\x0fxx\x0f\x07\x00\x00aqYMGC\x00\x00\x00\x7f\x7fAA\x00\x00'
+    b'\x00\x02\x06\x0c\x180`@\x00\x00AA\x7f\x7f\x00\x00\x00\x08\x0c\x06\x06\x0c\x08\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'
+    b'\x00\x00\x01\x03\x06\x04\x00\x00\x00 tTT|x\x00\x00\x7f\x7fDD|8\x00\x008|DDl(\x00'
+    b'\x008|DD\x7f\x7f\x00\x008|TT\\X\x00\x00\x08~\x7f\t\x03\x02\x00\x00\x98\xbc\xa4\xa4\xfc|\x00'
+    b'\x00\x7f\x7f\x04\x04|x\x00\x00\x00\x00}}\x00\x00\x00\x00@\xc0\x80\x80\xfd}\x00\x00\x7f\x7f08lD\x00'
+    b'\x00\x00A\x7f\x7f@\x00\x00\x00||\x180\x18||\x00||\x04\x04|x\x00\x008|DD|8\x00'
+    b'\x00\xfc\xfc$$<\x18\x00\x00\x18<$$\xfc\xfc\x00\x00||\x04\x04\x0c\x08\x00\x00H\\TTt \x00'
+    b'\x04\x04?\x7fDd \x00\x00<|@@|<\x00\x00\x1c<``<\x1c\x00\x00\x1c|0\x180|\x1c'
+    b'\x00Dl88lD\x00\x00\x9c\xbc\xa0\xa0\xfc|\x00\x00Ddt\\LD\x00\x00\x08\x08>wAA\x00'
+    b'\x00\x00\x00\xff\xff\x00\x00\x00\x00AAw>\x08\x08\x00\x00\x02\x03\x01\x03\x02\x03\x01\xaaU\xaaU\xaaU\xaaU'
+)
+
+# all icons back to back; ICONS maps name -> (offset, width, height) into ICON_DATA
+ICON_DATA = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00|\xfe|\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03\x07\x82\xe0\xf0x8'
+    b'\x18\x1c\x0c\x0c\x0c\x1c\x188p\xf0\xc0\x82\x07\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x0e'
+    b'\x0e\x0e\x0e\x0e\x04\x00\x00\x0e\x7f\xff\xe0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xe0\xff?\x0e\x00\x00\x04\x0e\x0e\x0e'
+    b'\x0e\x0e\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 px<\x08\x00\x01\x03\x07\x07\x0e\x8e\xce\x8e\x0e'
+    b'\x07\x07\x03\x01\x00\x08<xp \x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x1f\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x1c<x\xf8\xf0\xf0\xe0'
+    b'\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0f\xff\xff\xff\xff\xfe\xf8\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xf0\xff\xff\xff\xff\xff\xff?'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x008xp\xf0\xe0\xe0\xe0\xc0\xc0\xc0\xc0\xc0\xe0\xe0\xe0\xf0\xf0'
+    b'\xf8\xfc\xfe\xff\xff\xff\x7f\x7f?\x0f\x07\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x01\x01\x03\x03\x03\x07\x07\x07\x07\x07\x07\x07\x07\x03\x03\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xe0\xf0p8888pp\xe0\xc0\x80'
+    b'\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\xc0\xc0\xc0\xc0\xc0\xf0\xf8<\x1c\x0e\x0e'
+    b'\x0f\x0f\x00\x00\x80\x80\xc0\xc0\xc0\x80\x81\x03\x03\x03\x03\x03\x07\xff\xfe\xf8\xc0\xc0\x80\x80\x00\x00\x00\x00\x00\x00\xfc\xff'
+    b'\xcf\x03\x01\x01\x01\x01\x01\x81\xc1\xe0\xe0\xe0\xf0\xf8\xf8\xfc\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xfe\xfe\xfe\xef\xc7\xc3'
+    b'\x81\x01\x01\x83\xef\xff\xfc\x00\x00\x00\x00\x00\x03\x03\x07\x07\x0e\x0e\x0e\x1f\x7f\x7f\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x7f?\x0e\x06\x07\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xe0`\x00\x00\x00\x0c\x9c\x9c\x9c\xbc\xbc\xfc\xdc\xdc\x988pp'
+    b'\xe0\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf8>\x0f\x03\xc1\xe0\xf8<\x1e\x0e'
+    b'\x07\x03\x03\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x03\x07?\xfc\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x07\x07\x00\x00\x00\xff\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xf8\xff?'
+    b'\x00\x00\xc0\xfe>\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0f\x1f<x\xf0\xe0\xc0\x98\xb8\xb8'
+    b'\xf8\xd8\xd8\x9c\x9c\x8c\x0e\x07\x07\x03A`p<\x0f\x07\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x03\x03\x03\x03\x03\x03\x03\x03\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0x\x1c\x1e'
+    b'\x1e\xff\xff\xff\xfe\xfe\xfc\xfc\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 00p````\xe0\xe0'
+    b'\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf0\xf8\xf8\xf8\xfc\xfc\xff\xff\xff\x7f\x7f?\x1f\x07\x00\x00\x00\x00\x80\x80\x00\x00\x00\x00'
+    b'\x80\x80\x00```\x80\x80 pp\x00\x00 pp \x00`aaA\x01\x81\x9d\x1d\r\x00\x00\x0cLl'
+    b'\xe0D\x06gr0\x02\x03\x03\x00\x00\x00\x01\x03\x01\x01\x00\x00\x01\x01\x01\x01\x00\x03\x03\x03\x02\x00\x86\x86\x0e\x04'
+    b'pp\x00\x00\x01\x03\x03x8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x03\x03\x00\x0c\x1c\x1c\x00\x00\x06\x07\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00||\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03\x07\x06\x04'
+    b'\xc0\xe0\xf0p8\x18\x18\x1c\x1c\x1c\x18\x188p\xe0\xe0\x80\x06\x07\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x18\x18\x18\x18\x18\x18\x18\x18\xff\xff\x99\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x99\xff\xff\x18'
+    b'\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00ccccccccccccccc'
+    b'cccccccccccccccccccc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0\xc0'
+    b'\xc0\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe0\xff\xff\xff\xff\xff\xff\xfe\xf8\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x18\x18\x18\x18\x18\x18\x18\x18\x1f\x1e>\xfe\xfc\xfc\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\x7f?\x1f'
+    b'\x19\x18\x18\x18\x18\x18\x18\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00ccccccccccccccc'
+    b'ccccccccccccccccccccc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x80\x00\x00\x108p`\xe0\xfc\xfe\xfc\xe0'
+    b'`p8\x10\x00\x80\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00B\xc6\xcel|'
+    b'\x7f?xp\xe0\xe0\xc0\x80\x80\xff\xff\xff\x80\xc0\xc0\xe0\xe0p??<|\xee\xceB\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03\x03\xff\xff\xff\x03\x01\x01\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x03\x03cccccc'
+    b'ccccccccccccccc\x03\x03\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x04\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00<~<'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03'
+    b'\x07\x0e\x0c\xc0\xe0\xf0p88\x18\x1c\x1c\x1c\x1888p\xf0\xe0\x80\x0c\x0e\x07\x03\x01\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00000000000\xff\xff300000\x00\x00\x00000003'
+    b'\xff\xff00000000\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\x06\x07\x07\xc7\xc6'
+    b'\xc6\xc6\xc6\x06\x06\x06\x06\xc6\xc6\xc6\xc6\xc6\x07\x07\x07\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00@'
+    b'\xc0\xc0\xc0\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe1\xff\xff\xff\xff\xff\xfe\xfc\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x000000000 \x1e>|\xfc\xfc\xfc\xfc\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff'
+    b'\x7f?\x1f 0000000\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\x06\x06\x06\xc6'
+    b'\xc7\xc7\xc7\xc7\x07\x07\x07\x07\xc7\xc7\xc7\xc7\xc6\x06\x06\x06\xc6\xc6\xc6\xc6\xc6\xc6\xc6\xc6\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\xc0\xc0\xe0\xf8\xfe\x0e\x07\x07'
+    b'\x03\x03\x03\x07\x0f\x1e<800pp\xe0\xe0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe0\xf0p88\x18\x18'
+    b'\x18<?\x07\x03\x01\x01\x00\x01\x80\x80\xe0\xf0\xf8\xf8\xf8\xf8\xf8\xf0\xe0\xe0\xe0\xc0\xc0\xc0\xe0\xff\x7f>88p'
+    b'\xe0\xc0\x80\x00\x00\x1f?y\xf0\xe0\xc0\xc0\xc0\xc0\xf0\xfc\xfc\xfe\xfe\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
+    b"\xff\xff\xff\xff\xff\xff\xfc\xfc\xf8\xf0\xc0\xe0\xf0}?\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00@\xc1\xe3w7'\x07"
+    b"\x07G\xc7\xe7w7\x07\x07\x07G\xc7\xe7w7'\x07\x07G\xc7\xe7w3#\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x1c\x0e\x0e\x00\x00\x00\x00\x18\x1c\x0e\x0e\x04\x00\x00\x00\x18\x1c\x0e\x0e\x04\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xf0x8'
+    b'\x1c\x1c\x1c\x1c<x\xf0\xe0\xc0\xc0\xc0\xc0\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xe0\xe0p'
+    b'ppp\xf8\xfc\x1e\x0f\x07\x07\x07\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x81\xc7\xff\xfep`\xe0\xe0'
+    b'\xc0\x00\x00\x00\x00\x00\x00\x0c?\xff\xf1\xc0\xc0\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'
+    b'\x80\x80\x87\x87\x83\x83\x83\x81\x80\x80\xc0\xc0\xf3\xff?\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x03\x03\x83\xc3\xe3\xf3'
+    b'{;\x13\x03\x83\xc3\xe3\xf3{;\x13\x03\x83\xc3\xe3\xf3{;\x13\x03\x03\x03\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x02\x07\x07\x03\x01\x00\x00\x00\x02\x07\x07\x03\x01\x00\x00\x00\x02\x07\x07\x03\x01\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00 `\xc0\x80\x00\x00\x00\x00\x00\x1e\x1e\x80\x80\x80\x80\x00 0'
+    b'\x18\x0c\x04\x00\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x81\x03'
+    b'\x00\xf0\xfc\xfe\xff\xff\xff\xff\xff\xff\xff\x7f~|\x0e\x07\x03\x03\x03\x03\x03\x0e\x1e\x18\x18\x188p\xf0\xc0\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x02\x03\x01\x00\xf0\xf8\x1c\x0f\x07\x07\x07\x0f\x0f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00 `008\x1f\x0f\x06\x06\x0c<\xf8\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x03\x07\x0e\x0c\x18\x18\x18'
+    b'\x18\x18\x18\x18\x18\x18\x98\x98\x18\x18\x18\x18\x18\x98\x98\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x1c\x0c\x0f\x07\x01\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x07\x03\x01\x00\x00\x0c\x0e\x07\x03\x01\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\xfc\xfc\xfc\xf8\xf0'
+    b'\xe0\xc0\x80\x80\x80\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00p\xf0\xe0'
+    b'\xe0\xe0\xe0\xe0\xf0\xf0\xf8\xfe\xff\x7f????\x07\x03\x01\x01\x01\x01\x03\x07\x0e\x0c\x0c\x0c\x1c8\xf0\xe0\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xff\x0f\x07\x03\x03\x03\x07\x07\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x1000\x18\x1c\x0f\x07\x03\x07\x06\x9e\xfc\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x01\x07\x07\x0e\x0c\x0c\x0c'
+    b'\x0c\x0c\x0c\x0c\x0c\x8c\xcc\xcc\x0c\x0c\x0c\x0c\x8c\xcc\xcc\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x06\x07\x03\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03\x01\x00\x00\x00\x06\x07\x03\x01\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\x08\x08\x08\x08'
+    b'\x08\x08\x08\xf8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00'
+    b'\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\x7f`\x00\xf8\xf8\xf8\x00`\x7f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x0e1@N\x9f\x9f\x9f\x9f\x9fN@1\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xf0\xf0\xe0\x00\x00\x00\x00\x00\x80\xe0\xe0@\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x0e\x1c\x1c\x08\x80\xe0\xf0\xf8\xf8\xfc\xfc\xfc\xfc\xf8\xf8\xf1\xf1\xf1'
+    b'8\x1c\x1c\x1c\x1c\x1c8\xf0\xe0\xc0\xc0\xc0\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x18\x1c\x1c\x1c\x80\xc0\xe7'
+    b'\xff\x7f\x7f\x7f\x7f\x7f\x7f\x0f\x07\x07\x03\x03\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x81\xc1\xe7\xff~pp\xe0'
+    b'\xe0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x1f?y\xe0\xe0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'
+    b'\xc0\xc0\xc0\xc3\xc3\xc3\xc3\xc1\xc0\xc0\xe0\xe0p\x7f?\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10p\xf0\xe0\xe0\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x80\x80\x80\x00\x00\x80\x80\xc0\xe0\xf0\xfc\xff\xff\xff\xff\xff?'
+    b'\x1c\x0c\x06\x06\x0e\x0c\x1cxp```\xe0\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xcf\xff\x7f'
+    b'?\x1f\x1f\x1f??\x1f\x07\x03\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\xc0\xe0{?\x1c\x180p'
+    b'\xe0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x1f800`````````````````'
+    b'```aa`````008\x1f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x80\xe0\xf0\xf8\x1c\x0c\x0e\x0e\x0e\x0c\x1cx\xf0\xe0`\xe0\xe0'
+    b'\xc0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xc0\xe0\xf0p880x~?\x07\x03\x03\x03\x03\x81'
+    b'\xc0\xe0\xf0\xf8\xf8\xf8\xf8\xf0\xe0\xc0\xc0\xc0\xc0\xe1\xff\x7f<0p\xe0\xe0\x80\x00\x00\x00\x00\x00\x00\x1f?\x7f\xe0'
+    b'\xc0\xc0\xc0\xc0\xe0\xf8\xfc\xfc\xfc\xfc\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfd\xf8\xf8\xe0\xc0\xe0'
+    b'\xf0\x7f?\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x81\xc3\xc7\x0f\x0f\x0f\x0f\x0f\x8f\xcf\xcf\x0f\x0f\x0f\x0f\x0f'
+    b'\x8f\xcf\xcf\x0f\x0f\x0f\x0f\x0f\x8f\xc7\xc3\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x0e\x06\x03\x01\x01\x00'
+    b'\x00\x0c\x0e\x06\x03\x01\x01\x00\x00\x0c\x0e\x06\x03\x01\x01\x00\x00\x0c\x0e\x06\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0 \xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80`\x10\x0c\x03\x00\x80\x00\x03\x0c\x10`\x80\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e1@\x80\x18>\x7f\x7f\x7f>\x18\x80@1\x0e\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x04\x04\x04\x02\x01\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00@\xc0\x80\x00\x00\x00\x00\x00\x02\x0e\x1c\x10\x00\x00\x00'
+    b'\x00\x00 8\x1c\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x81\x83\x02\x00`\xf8\xfe\xfe\xff\xff\xff\xff\xff\xff~||\x1e\x07\x03\x03\x03\x03\x07\x0e\x1e\x18\x18\x188p\xe0'
+    b'\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x03\x01\x00\xe0\xf8\x1c\x0f\x0f\x07\x07\x0f\x0f\x0f\x01\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00``p8\x1f\x0f\x06\x0e\x0c\x1c\xf8\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x01\x07\x0e\x0c'
+    b'\x1c\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x1c\x0c\x0e\x07'
+    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x0c\x06\x07\x03\x00\x00\x08\x0c\x0e\x07\x03\x01\x00\x08\x0c\x0e\x07\x03\x01'
+    b'\x00\x00\x08\x0c\x06\x07\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x9c\xfc'
+    b'\xf8\xf8\xf0\xe0\xc0\x80\x80\x80\x80\x80\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'0\xf0\xe0\xe0\xe0\xe0\xe0\xf0\xf0\xf8\xfc\xff\xff\x7f???\x07\x03\x01\x01\x01\x01\x03\x07\x0e\x0c\x0c\x0c\x1c8\xf0'
+    b'\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf1\xff\x0f\x07\x07\x03\x03\x07\x07\x03\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x0000\x18\x1c\x0f\x07\x03\x07\x06\x1e\xfc\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x01\x03\x07\x06'
+    b'\x0e\x0c\x0c\x8c\x8c\x0c\x0c\x0c\x0c\x0c\x8c\x8c\x8c\x0c\x0c\x0c\x0c\x8c\x8c\x8c\x0c\x0c\x0c\x0c\x0c\x8c\x8c\x0c\x0e\x06\x07\x03'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x06\x03\x03\x01\x00\x00\x04\x06\x07\x03\x01\x00\x00\x04\x06\x07\x03\x01'
+    b'\x00\x00\x00\x04\x06\x03\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00 \xf0'
+    b'\xf0\x80\xe0\xf08\x00\x00\x00\x00\x00x\xf0\xe0\xc0\xf00\x10\x80\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x80\xc0\x80\x02\x03\x03\x03\x83\xe3\xf7\x7f~\xfc\xdc\x9c\x1c\x9c\xdc\xfc~\x7f\xf7\xe3\x83\x03\x03\x03'
+    b'\x02\x80\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0cL\xed\x7f?\x1e\x0c\x1e\x7f\xff\xed\x8c\x8c\xcc\xed'
+    b'\x7f?\x7f\xed\xcc\x8c\x8c\xed\xff\x7f\x1e\x0c\x1e?\x7f\xedL\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x100\x100\xf0\xf1\xfb\xff\xef\x8f\x0e\x0e\x0e\x0e\x0e\x8f\xcf\xff{\xf0\xf0\xb000\x10\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x00\x01\x03\x03\x00\x00\x00\x00\x00\x03\x03'
+    b'\x00\x00\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x80\x80\xc0\xe0\xf8\xfc\x1e\x0e\x06\x06\x0e\x0e<xppp`\xe0\xc0\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\xc0\xf0x8\x18\x1c\x1c\x1c>\x1f\x03\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\xe0\xf1'
+    b'\x7f?\x1c\x188\xf0\xe0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x1f<8ppppppp\xf0\xf0\xf0\xf0\xf0'
+    b'\xf0\xf0\xf0\xf0\xf0pppppppppppp8?\x1f\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x06\x87\xc7\xff\x7f?\x1f\x0f\x07\x03\x01\xe0p8\x1c\x0e\xc2\xe0p8\x1c\x0e\x02\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x06\x03\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0 \x10\x08\x04\x82'
+    b'B""""""""""""""""B\x82\x04\x08\x10 \xc0\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x07\x04\x04\x04\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80@ \x10\x08\x84C'
+    b' \x10\x08\x04\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\xf0\x08\x04\x02\xe1\x10\x08\x04\x02\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\x90\x90\x90\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x08\x08\x08\x07'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf08<|\xfc\xfc\xfc\xfc\xf8\xf0\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00  `````\xe0\xe0\xe0\xe0\xe0\xf0\xf0\xf0\xf0\xf0\xf0\xf8\xf8\xfc\xff\xff\x7f'
+    b'\x7f?\x1f\x0f\x00\x00\xc0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00```````\xe0\xe0\xe0\xe0\xe0\xe0'
+    b'\xe0\xe0\xe0\xe0\xc0\xcc\xcc\x9c\x1c\x1c\x1c<<<<<<\x1e\x1f\x0f\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11y\xe1\xe3\xf7\xff\xff\xff\xff\x7f\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01'
+    b'\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+)
+
+ICONS = {
+    'clear-day-37': (0, 45, 37),
+    'clear-night-37': (225, 45, 37),
+    'cloudy-37': (450, 45, 37),
+    'cyclone-37': (675, 45, 37),
+    'dusty-37': (900, 45, 37),
+    'fog-day-37': (1125, 45, 37),
+    'fog-night-37': (1350, 45, 37),
+    'frost-37': (1575, 45, 37),
+    'hazy-day-37': (1800, 45, 37),
+    'hazy-night-37': (2025, 45, 37),
+    'heavy-shower-37': (2250, 45, 37),
+    'light-rain-37': (2475, 45, 37),
+    'light-shower-day-37': (2700, 45, 37),
+    'light-shower-night-37': (2925, 45, 37),
+    'min_temp-35': (3150, 35, 35),
+    'partly-cloudy-day-37': (3325, 45, 37),
+    'partly-cloudy-night-37': (3550, 45, 37),
+    'rain-37': (3775, 45, 37),
+    'rainfall-35': (4000, 35, 35),
+    'shower-day-37': (4175, 45, 37),
+    'shower-night-37': (4400, 45, 37),
+    'snow-37': (4625, 45, 37),
+    'storm-37': (4850, 45, 37),
+    'unknown-37': (5075, 45, 37),
+    'windy-37': (5300, 45, 37),
+}
@@ -0,0 +1,166 @@
+# Optional I2C transaction tracer.
+# TracedI2C wraps a machine.I2C (or anything with the same methods: a MuxChannel, the host
+# FakeI2C) and accounts every transfer per device address: call count, bytes on the wire,
+# elapsed ticks_us, failures, and a rolling histogram of transfer times.
+#
+#   mux.i2c = TracedI2C(mux.i2c, "I2C1")      # mux selects show up under 0x70, OLEDs under 0x3C
+#   disp8 = HT16K33LED(TracedI2C(i2c, "I2C0"))
+#   ...
+#   I2C_TRACER.dump()                         # table of every tracer created so far
+
+from micropython import const
+from time import ticks_us, ticks_diff
+from functions.timings import Timings
+
+HIST_EDGES = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)     # us; one more bucket past the last edge
+HIST_WINDOW = const(128)        # the histograms cover each address's last 128 transfers
+
+TRACERS = []                    # every TracedI2C, in creation order, for dump()
+
+class AddrStats(Timings):
+    def __init__(self):
+        super().__init__(HIST_EDGES, HIST_WINDOW)
+
+    def reset(self):
+        super().reset()
+        self.bytes = 0
+        self.errors = 0
+
+    def add(self, nbytes, us):
+        self.bytes += nbytes
+        super().add(us)
+
+class TracedI2C:
+    def __init__(self, i2c, name="I2C", freq=400000):
+        """
+        i2c: the bus (or bus-like proxy) to wrap
+        name: label for the summary table
+        freq: bus clock, used only for the estimated wire time in the summary
+        """
+        self.i2c = i2c
+        self.name = name
+        self.freq = freq
+        self.stats = {}             # address -> AddrStats
+        TRACERS.append(self)
+
+    def __getattr__(self, attr):
+        # anything not traced (init, deinit, ...) goes straight to the wrapped bus
+        return getattr(self.i2c, attr)
+
+    def _stats(self, addr):
+        s = self.stats.get(addr)
+        if s is None:
+            s = self.stats[addr] = AddrStats()
+        return s
+
+    def _done(self, addr, nbytes, t0):
+        self._stats(addr).add(nbytes, ticks_diff(ticks_us(), t0))
+
+    def _failed(self, addr):
+        self._stats(addr).errors += 1
+
+    # byte counts are on-the-wire figures: address byte + payload, per START
+    def writeto(self, addr, buf, stop=True):
+        t0 = ticks_us()
+        try:
+            return self.i2c.writeto(addr, buf, stop)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, 1 + len(buf), t0)
+
+    def writevto(self, addr, vector, stop=True):
+        n = 1
+        for buf in vector:
+            n += len(buf)
+        t0 = ticks_us()
+        try:
+            return self.i2c.writevto(addr, vector, stop)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, n, t0)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        t0 = ticks_us()
+        try:
+            return self.i2c.readfrom(addr, nbytes, stop)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, 1 + nbytes, t0)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        t0 = ticks_us()
+        try:
+            return self.i2c.readfrom_into(addr, buf, stop)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, 1 + len(buf), t0)
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        t0 = ticks_us()
+        try:
+            return self.i2c.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, 1 + addrsize // 8 + len(buf), t0)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        t0 = ticks_us()
+        try:
+            return self.i2c.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+        except OSError:
+            self._failed(addr)
+            raise
+        finally:
+            self._done(addr, 2 + addrsize // 8 + nbytes, t0)     # register write, then a repeated-START read
+
+    def scan(self):
+        return self.i2c.scan()
+
+    def reset(self):
+        for s in self.stats.values():
+            s.reset()
+
+    def totals(self):
+        """
+        (transfers, bytes, elapsed us) over every address.
+        """
+        count = nbytes = us = 0
+        for s in self.stats.values():
+            count += s.count
+            nbytes += s.bytes
+            us += s.total_us()
+        return count, nbytes, us
+
+    def summary(self):
+        """
+        The stats table as a list of lines.
+        """
+        lines = ["%s  addr  calls   bytes  wire ms  time ms  avg us  max us  err  last %d: <64us .. >16ms"
+                 % (self.name, HIST_WINDOW)]
+        for addr in sorted(self.stats):
+            s = self.stats[addr]
+            wire_ms = s.bytes * 9000 // self.freq       # 9 clocks per byte
+            lines.append("      0x%02X %6d %7d %8d %8d %7d %7d %4d  %s" % (
+                addr, s.count, s.bytes, wire_ms, s.total_us() // 1000, s.avg_us(), s.max_us,
+                s.errors, s.hist_row()))
+        return lines
+
+def dump():
+    # print the summary of every tracer
+    for tracer in TRACERS:
+        for line in tracer.summary():
+            print(line)
+
+def reset():
+    for tracer in TRACERS:
+        tracer.reset()
@@ -9,6 +9,24 @@ class I2CMultiplex:
         """
         self.i2c = I2C(I2Cbus, scl=Pin(scl_pin), sda=Pin(sda_pin), freq=freq)
         self.addr = addr
+        self._active = None         # channel mask currently enabled on the mux, None if unknown
+        self._select_buf = bytearray(1)
+
+    def channel(self, port):
+        """
+        An I2C-like proxy for one channel (0-7); it selects the channel before each transfer.
+        """
+        return MuxChannel(self, 1 << port)
+
+    def broadcast(self, ports):
+        """
+        A proxy with several channels enabled at once: every write reaches the devices
+        at that address on all of them in one transaction. Reads are not meaningful.
+        """
+        mask = 0
+        for port in ports:
+            mask |= 1 << port
+        return MuxChannel(self, mask)
 
     def scan(self, port):
         """
@@ -26,20 +44,27 @@ class I2CMultiplex:
                 pass
         return buf
 
+    def select_mask(self, mask):
+        """
+        Enable the channels set in mask, skipping the write if they are already enabled.
+        """
+        if mask == self._active:
+            return
+        self._select_buf[0] = mask & 0xFF
+        try:
+            self.i2c.writeto(self.addr, self._select_buf)
+        except OSError:
+            self._active = None     # the mux state is unknown now; reselect next time
+            raise
+        self._active = mask
+
     def select_port(self, port):
         """
         Enable a specific channel (0-7) on the I2C multiplexer, or 8 to disable all.
         """
         if port > 8:
             return
-        try:
-            if port == 8:
-                data = 0x00  # disable all channels
-            else:
-                data = (1 << port) & 0xFF
-            self.i2c.writeto(self.addr, bytes([data]))
-        except OSError:
-            print("Internal mux port select error.")
+        self.select_mask(0x00 if port == 8 else 1 << port)
 
     def writeto_mem(self, port, addr, reg, buf):
         """
@@ -58,3 +83,39 @@ class I2CMultiplex:
         """
         self.select_port(port)
         return self.i2c.readfrom_mem(addr, reg, nbytes)
+
+class MuxChannel:
+    """
+    Stands in for machine.I2C for the devices behind one mux channel mask.
+    """
+    def __init__(self, mux, mask):
+        self.mux = mux
+        self.mask = mask
+
+    def writeto(self, addr, buf, stop=True):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.writeto(addr, buf, stop)
+
+    def writevto(self, addr, vector, stop=True):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.writevto(addr, vector, stop)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.readfrom(addr, nbytes, stop)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.readfrom_into(addr, buf, stop)
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.writeto_mem(addr, memaddr, buf, addrsize=addrsize)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        self.mux.select_mask(self.mask)
+        return self.mux.i2c.readfrom_mem(addr, memaddr, nbytes, addrsize=addrsize)
+
+    def scan(self):
+        self.mux.select_mask(self.mask)
+        return [addr for addr in self.mux.i2c.scan() if addr != self.mux.addr]
@@ -5,8 +5,25 @@
 
 from micropython import const
 from struct import pack_into
+import asyncio
 import framebuf
 import os
+from time import ticks_us, ticks_diff
+
+from functions.lru_cache import LRUCache
+import functions.profiler as Profiler
+
+# bitmaps compiled by tools/compile_assets.py; without them the drivers fall back to the files
+try:
+    from graphics import assets
+except ImportError:
+    assets = None
+
+# frame hashing needs binascii.crc32; ports built without it just never skip a flush
+try:
+    from binascii import crc32
+except ImportError:
+    crc32 = None
 
 # register definitions
 SET_CONTRAST = const(0x81)
@@ -30,23 +47,118 @@ SET_CHARGE_PUMP = const(0x8D)
 # constants
 BANNER_HEIGHT = 16
 PAGE_HEIGHT = 48
+# decoded icons kept in memory, shared by every panel
+ICON_CACHE_SIZE = 8
+# pre-scaled text glyphs kept in memory, shared by every panel
+GLYPH_CACHE_SIZE = 64
+GLYPH_CACHE_BYTES = 2048
+# bus bytes spent opening a window: address + control + 6 commands, then address + control for the data
+WINDOW_COST = const(10)
+
+# solid page rows shared by every panel, keyed by (width, colour)
+_ROWS = {}
+
+def _solid_row(width, c):
+    key = (width, 1 if c else 0)
+    row = _ROWS.get(key)
+    if row is None:
+        row = _ROWS[key] = memoryview((b"\xff" if c else b"\x00") * width)
+    return row
+
+# 8x8 column font used by the text methods
+DEFAULT_FONT = "graphics/font-pet-me-128.dat"
+# one read-only copy of each font, shared by every panel
+_FONTS = {}
+
+def get_font(filename=DEFAULT_FONT):
+    font = _FONTS.get(filename)
+    if font is None:
+        if assets is not None and filename == DEFAULT_FONT:
+            font = memoryview(assets.FONT_PET_ME)
+        else:
+            with open(filename, "rb") as f:
+                font = memoryview(f.read())
+        _FONTS[filename] = font
+    return font
+
+# maps ink (1) to 0 and background (0) to 1, for drawing mono bitmaps in colour 0
+_INVERT_PALETTE = framebuf.FrameBuffer(bytearray(b"\x01"), 2, 1, framebuf.MONO_HMSB)
+
+def load_pbm(path):
+    # decode an ASCII (P1) PBM straight into a MONO_VLSB buffer: returns (buffer, width, height)
+    with open(path, "r") as f:
+        if f.readline().strip() != "P1":
+            raise ValueError("Only ASCII PBM (P1) supported")
+        buf = None
+        x = y = 0
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            if buf is None:
+                # first line after the header and comments holds the dimensions
+                width, height = map(int, line.split())
+                buf = bytearray(((height + 7) // 8) * width)
+                continue
+            for ch in line:
+                if ch == "1":
+                    buf[(y >> 3) * width + x] |= 1 << (y & 7)
+                elif ch != "0":
+                    continue
+                x += 1
+                if x == width:
+                    x = 0
+                    y += 1
+    if buf is None:
+        raise ValueError("Could not find PBM dimensions")
+    if y != height or x != 0:
+        raise ValueError(f"PBM pixel data does not match width*height ({y * width + x} != {width*height})")
+    return buf, width, height
 
 # Subclassing FrameBuffer provides support for graphics primitives
 # http://docs.micropython.org/en/latest/pyboard/library/framebuf.html
 
 class SSD1306(framebuf.FrameBuffer):
-    def __init__(self, width, height, external_vcc):
+    _icons = LRUCache(ICON_CACHE_SIZE)
+    _glyphs = LRUCache(GLYPH_CACHE_SIZE, GLYPH_CACHE_BYTES)
+
+    def __init__(self, width, height, external_vcc, font=DEFAULT_FONT, init=True):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self._mv = memoryview(self.buffer)
+        # per-page column span touched since the last show(); lo > hi means clean
+        self._dirty_lo = bytearray(self.pages)
+        self._dirty_hi = bytearray(self.pages)
+        # data bytes actually sent vs. what full-frame refreshes would have sent
+        self.bytes_sent = 0
+        self.bytes_full = 0
+        # frame-diff mode (off by default): shadow of the last frame sent, and what the diff found
+        self._sent = None
+        self._resync = False
+        self.diff_checked = 0
+        self.diff_changed = 0
+        self.diff_windows = 0
+        self._window = bytearray(6)
+        # crc32 of the frame on the panel (None: unknown), and flushes skipped because it matched
+        self._hash = None
+        self.flush_skipped = 0
+        # show() timings; shared by every panel until given a span of its own
+        self.span = Profiler.span("show")
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
-        self.load_font()
-        self.init_display()
+        self.mark_clean()
+        self._font_file = font      # None disables the 8x8 text methods entirely
+        if init:                    # skipped when a broadcast has already initialised the panel
+            self.init_display()
 
     def init_display(self):
-        for cmd in (
+        # a (re)initialised panel's RAM is unknown: forget the last frame's hash and diff shadow,
+        # so the clearing show() below goes out whole
+        self._hash = None
+        self._resync = True
+        self.write_cmds(bytes((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -76,9 +188,8 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )))
         self.fill(0)
         self.show()
 
@@ -96,20 +207,67 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.write_cmds(bytes((SET_CONTRAST, contrast)))
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def pixel(self, x, y, color):
+    def mark_clean(self):
+        for page in range(self.pages):
+            self._dirty_lo[page] = 0xFF
+            self._dirty_hi[page] = 0
+
+    def mark_dirty(self, x=0, y=0, w=None, h=None):
+        # record that the region was drawn so show() sends it; defaults to the whole frame
+        w = self.width - x if w is None else w
+        h = self.height - y if h is None else h
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        lo = self._dirty_lo
+        hi = self._dirty_hi
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < lo[page]:
+                lo[page] = x0
+            if x1 > hi[page]:
+                hi[page] = x1
+
+    def is_dirty(self, page0=0, page1=None):
+        # anything drawn since the last show() on pages page0..page1 (default: all of them)
+        for page in range(page0, self.pages if page1 is None else page1 + 1):
+            if self._dirty_lo[page] <= self._dirty_hi[page]:
+                return True
+        return False
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        # blits bypass pixel(), so mark the destination area from the source size
+        if isinstance(fbuf, (tuple, list)):
+            self.mark_dirty(x, y, fbuf[1], fbuf[2])
+        else:
+            self.mark_dirty()
+        super().blit(fbuf, x, y, key, palette)
+
+    def scroll(self, xstep, ystep):
+        self.mark_dirty()
+        super().scroll(xstep, ystep)
+
+    def pixel(self, x, y, color=None):
         if 0 <= x < self.width and 0 <= y < self.height:
             page, shift_page = divmod(y, 8)
             ind = x + page * self.width
+            if color is None:
+                return (self.buffer[ind] >> shift_page) & 1
             if color:
                 self.buffer[ind] |= (1 << shift_page)
             else:
                 self.buffer[ind] &= ~(1 << shift_page)
+            if x < self._dirty_lo[page]:
+                self._dirty_lo[page] = x
+            if x > self._dirty_hi[page]:
+                self._dirty_hi[page] = x
             
             # x = x & (self.width - 1)
             # y = y & (self.height - 1)
@@ -136,6 +294,14 @@ class SSD1306(framebuf.FrameBuffer):
                        self.pixel(i, j, c)
     
     def line(self, x1, y1, x2, y2, c):
+            # axis-aligned lines are page operations, only diagonals walk pixels
+            if y1 == y2:
+                self.hline(min(x1, x2), y1, abs(x2 - x1) + 1, c)
+                return
+            if x1 == x2:
+                self.vline(x1, min(y1, y2), abs(y2 - y1) + 1, c)
+                return
+
             # bresenham
             steep = abs(y2-y1) > abs(x2-x1)
             
@@ -179,35 +345,77 @@ class SSD1306(framebuf.FrameBuffer):
                     err += dx
                 x1 += 1        
     
-    def hline(self, x, y, l, c):
-        self.line(x, y, x + l, y, c)
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
             
     def vline(self, x, y, h, c):
-        self.line(x, y, x, y + h, c)
+        self.fill_rect(x, y, 1, h, c)
             
-    def rect(self, x, y, w, h, c):
-        self.hline(x, y, w, c)
-        self.hline(x, y+h, w, c)
-        self.vline(x, y, h, c)
-        self.vline(x+w, y, h, c)
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
                     
     def fill(self, c):
-        for i in range(0, self.height):
-            self.hline(0, i, self.width, c)
+        row = _solid_row(self.width, c)
+        for page in range(self.pages):
+            start = page * self.width
+            self._mv[start:start + self.width] = row
+        self.mark_dirty()
     
     def fill_rect(self, x, y, w, h, c):
-        for i in range(y, y + h):
-            self.hline(x, i, w, c)
+        # clip to the panel
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        w = min(w, self.width - x)
+        h = min(h, self.height - y)
+        if w <= 0 or h <= 0:
+            return
+        self.mark_dirty(x, y, w, h)
+        buf = self.buffer
+        y_end = y + h
+        for page in range(y >> 3, ((y_end - 1) >> 3) + 1):
+            # bit mask of the rows of this page inside the rectangle
+            top = max(y - page * 8, 0)
+            bottom = min(y_end - page * 8, 8)
+            mask = (0xFF >> (8 - (bottom - top))) << top
+            start = page * self.width + x
+            if mask == 0xFF:
+                # whole bytes: one slice assignment for the page
+                self._mv[start:start + w] = _solid_row(self.width, c)[:w]
+            elif c:
+                for i in range(start, start + w):
+                    buf[i] |= mask
+            else:
+                mask ^= 0xFF
+                for i in range(start, start + w):
+                    buf[i] &= mask
         
-    def load_font(self, filename="graphics/font-pet-me-128.dat"):
-        with open(filename, "rb") as f:
-            self.font = bytearray(f.read())
+    @property
+    def font(self):
+        # the 8x8 font is only fetched when a text method first needs it
+        if self._font_file is None:
+            raise RuntimeError("SSD1306 font is disabled")
+        return get_font(self._font_file)
+
+    def load_font(self, filename=DEFAULT_FONT):
+        self._font_file = filename
+        return get_font(filename)
 
     def text(self, text, x, y, c=1):
         text = str(text)
+        font = self.font
         for text_index in range(len(text)):
             for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
+                fontDataPixelValues = font[(ord(text[text_index]) - 32) * 8 + col]
                 for i in range(7):
                     if fontDataPixelValues & 1 << i != 0:
                         x_coordinate = x + col + text_index * 8
@@ -217,12 +425,13 @@ class SSD1306(framebuf.FrameBuffer):
     
     def year_text(self, text):
         text = str(text)
+        font = self.font
         x = 48
         y = 56
         c = 1
         for text_index in range(len(text)):
             for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
+                fontDataPixelValues = font[(ord(text[text_index]) - 32) * 8 + col]
                 for i in range(7):
                     if fontDataPixelValues & 1 << i != 0:
                         x_coordinate = x + col + text_index * 8
@@ -232,9 +441,10 @@ class SSD1306(framebuf.FrameBuffer):
 
     def text_inverted(self, text, x, y, c=1):
         text = str(text)
+        font = self.font
         for text_index in range(len(text)):
             for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
+                fontDataPixelValues = font[(ord(text[text_index]) - 32) * 8 + col]
                 for i in range(7):
                     pixel_on = (fontDataPixelValues & (1 << i)) != 0
                     x_coordinate = x + col + text_index * 8
@@ -242,43 +452,53 @@ class SSD1306(framebuf.FrameBuffer):
                     if 0 <= x_coordinate < self.width and 0 <= y_coordinate < self.height:
                         self.pixel(x_coordinate, y_coordinate, 0 if pixel_on else c)
     
+    def scaled_glyph(self, char, x_scale=1, y_scale=1, inverted=False, dotted=False):
+        # returns (buffer, width, height) of an 8x8 font glyph blown up to MONO_VLSB at scale;
+        # every font pixel becomes an x_scale by y_scale block (or one dot at its corner if dotted),
+        # and inverted glyphs have ink and background swapped. Glyphs are shared by all panels
+        # on the same font.
+        key = (self._font_file, char, x_scale, y_scale, inverted, dotted)
+        glyph = SSD1306._glyphs.get(key)
+        if glyph is None:
+            width = 8 * x_scale
+            height = 8 * y_scale
+            buf = bytearray(((height + 7) >> 3) * width)
+            font = self.font
+            base = (ord(char) - 32) * 8
+            for col in range(8):
+                font_byte = font[base + col]
+                if inverted:
+                    font_byte ^= 0xFF
+                for row in range(8):
+                    if (font_byte >> row) & 1:
+                        for dx in range(1 if dotted else x_scale):
+                            x = col * x_scale + dx
+                            for dy in range(1 if dotted else y_scale):
+                                y = row * y_scale + dy
+                                buf[(y >> 3) * width + x] |= 1 << (y & 7)
+            glyph = SSD1306._glyphs.put(key, (buf, width, height), len(buf))
+        return glyph
+
     def banner_text(self, text, c=1):
         text = str(text)
         total_width = len(text) * 14  # 14 pixels per char horizontally
         x_start = (self.width - total_width) // 2  # center
-        y = 1
 
-        for text_index in range(len(text)):
-            for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
-                for i in range(8):
-                    if fontDataPixelValues & 1 << i != 0:
-                        x_coord = x_start + (col * 2) + (text_index * 14)
-                        y_coordinate = y + (i * 2)
-                        if x_coord < self.width and y_coordinate < self.height:
-                            for iY in range(2):
-                                self.pixel(x_coord, y_coordinate - iY, c)
-                                self.pixel(x_coord - 1, y_coordinate - iY, c)
+        # 2x2 blocks, drawn one pixel up and left of the font grid
+        for text_index, char in enumerate(text):
+            buf, width, height = self.scaled_glyph(char, 2, 2)
+            self.draw_bitmap(buf, width, height, x_start - 1 + text_index * 14, 0, c)
     
     def banner_text_inverted(self, text, c=0, scale=14):
         text = str(text)
         total_width = len(text) * scale  # 14 pixels per char horizontally
         x_start = (self.width - total_width) // 2  # center
-        y = 2
 
         self.fill_rect(0,0,self.width,BANNER_HEIGHT,1)
 
-        for text_index in range(len(text)):
-            for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
-                for i in range(8):
-                    if fontDataPixelValues & 1 << i != 0:
-                        x_coord = x_start + (col * 2) + (text_index * scale)
-                        y_coordinate = y + (i * 2)
-                        if x_coord < self.width and y_coordinate < self.height:
-                            for iY in range(2):
-                                self.pixel(x_coord, y_coordinate - iY, c)
-                                self.pixel(x_coord - 1, y_coordinate - iY, c)
+        for text_index, char in enumerate(text):
+            buf, width, height = self.scaled_glyph(char, 2, 2)
+            self.draw_bitmap(buf, width, height, x_start - 1 + text_index * scale, 1, c)
                 
     def subbanner_text(self, text, x=None, y=None, char_width=8, c=1):
         text = str(text)
@@ -291,22 +511,15 @@ class SSD1306(framebuf.FrameBuffer):
         if y is None:
             y = (BANNER_HEIGHT)
 
-        for text_index in range(len(text)):
-            for col in range(8):
-                fontDataPixelValues = self.font[(ord(text[text_index]) - 32) * 8 + col]
-                for i in range(8):
-                    if fontDataPixelValues & 1 << i != 0:
-                        x_coord = x + (col * 2) + (text_index * char_width)
-                        y_coordinate = y + (i * 2)
-                        if x_coord < self.width and y_coordinate < self.height:
-                            self.pixel(x_coord, y_coordinate, c)
+        # font pixels spread out to every other pixel
+        for text_index, char in enumerate(text):
+            buf, width, height = self.scaled_glyph(char, 2, 2, dotted=True)
+            self.draw_bitmap(buf, width, height, x + text_index * char_width, y, c)
 
     def input_text(self, text, x_start=None, y_start=0, x_scale=2, y_scale=3, spacer=0, c=1, banner=False):
         text = str(text)
         font_width = 8
-        font_height = 8
         char_width = font_width * x_scale + spacer
-        char_height = font_height * y_scale
 
         # Horizontal centering
         total_width = len(text) * char_width
@@ -315,26 +528,17 @@ class SSD1306(framebuf.FrameBuffer):
 
         # Draw each character
         for text_index, char in enumerate(text):
-            for col in range(font_width):
-                font_byte = self.font[(ord(char) - 32) * font_width + col]
-                x_pos = x_start + text_index * char_width + col * x_scale
-                for dx in range(x_scale):
-                    x = x_pos + dx
-                    if x >= self.width:
-                        continue
-                    for row in range(font_height):
-                        pixel_on = (font_byte >> row) & 1
-                        y_pos = y_start + row * y_scale
-                        for dy in range(y_scale):
-                            y = y_pos + dy
-                            if y >= self.height:
-                                continue
-                            # Banner mode: text pixels off, background pixels on
-                            if banner:
-                                self.pixel(x, y, 0 if pixel_on else c)
-                            else:
-                                if pixel_on:
-                                    self.pixel(x, y, c)
+            x = x_start + text_index * char_width
+            if banner:
+                # Banner mode: text pixels off, background pixels on
+                buf, width, height = self.scaled_glyph(char, x_scale, y_scale, inverted=True)
+                if c:
+                    self.blit((buf, width, height, framebuf.MONO_VLSB), x, y_start)
+                else:
+                    self.fill_rect(x, y_start, width, height, 0)
+            else:
+                buf, width, height = self.scaled_glyph(char, x_scale, y_scale)
+                self.draw_bitmap(buf, width, height, x, y_start, c)
 
 
     def date_text(self, text, y_start=0, c=1):
@@ -356,119 +560,258 @@ class SSD1306(framebuf.FrameBuffer):
 
         # Draw each character
         for text_index, char in enumerate(text):
-            for col in range(font_width):
-                font_byte = self.font[(ord(char) - 32) * font_width + col]
-                x_pos = x_start + text_index * char_width + col * scale_x
-                for dx in range(scale_x):                                   # horizontal scaling
-                    x = x_pos + dx
-                    if x >= self.width:
-                        continue
-                    for row in range(font_height):
-                        pixel_on = (font_byte >> row) & 1
-                        if pixel_on:
-                            y_pos = y_start + row * scale_y
-                            for dy in range(scale_y):                       # vertical scaling
-                                y = y_pos + dy
-                                if y < self.height:
-                                    self.pixel(x, y, c)
+            buf, width, height = self.scaled_glyph(char, scale_x, scale_y)
+            self.draw_bitmap(buf, width, height, x_start + text_index * char_width, y_start, c)
     
-    def display_pbm(self, name, x_offset=0, y_offset=0, c=1):
-        pbm_path = f"graphics/{name}.pbm"
+    def load_icon(self, name):
+        # returns (buffer, width, height): compiled icons are zero-copy views of the asset bytes,
+        # anything else is decoded from its PBM once and shared through a small LRU cache
+        icon = SSD1306._icons.get(name)
+        if icon is None:
+            if assets is not None and name in assets.ICONS:
+                offset, width, height = assets.ICONS[name]
+                size = ((height + 7) // 8) * width
+                icon = (memoryview(assets.ICON_DATA)[offset:offset + size], width, height)
+                SSD1306._icons.put(name, icon)
+            else:
+                icon = load_pbm(f"graphics/{name}.pbm")
+                SSD1306._icons.put(name, icon, len(icon[0]))
+        return icon
+
+    def draw_bitmap(self, buf, width, height, x, y, c=1):
+        # draws the set bits of a MONO_VLSB bitmap in colour c, leaving the rest untouched
+        if c:
+            self.blit((buf, width, height, framebuf.MONO_VLSB), x, y, 0)
+        else:
+            self.blit((buf, width, height, framebuf.MONO_VLSB), x, y, 1, _INVERT_PALETTE)
 
+    def display_pbm(self, name, x_offset=0, y_offset=0, c=1):
         try:
-            with open(pbm_path, "r") as f:
-                lines = f.readlines()
+            buf, width, height = self.load_icon(name)
         except OSError:
-            print("PBM file not found:", pbm_path)
+            print("PBM file not found:", f"graphics/{name}.pbm")
             return
+        self.draw_bitmap(buf, width, height, x_offset, y_offset, c)
 
-        # Strip whitespace and skip empty lines
-        lines = [l.strip() for l in lines if l.strip()]
-
-        # Check header
-        if lines[0] != 'P1':
-            raise ValueError("Only ASCII PBM (P1) supported")
-
-        # Find first line with width and height (skip comments or extra text)
-        for i, line in enumerate(lines[1:], start=1):
-            if all(c.isdigit() or c.isspace() for c in line):
-                width, height = map(int, line.split())
-                pixel_lines = lines[i+1:]  # all lines after dimensions
-                break
-        else:
-            raise ValueError("Could not find PBM dimensions")
-
-        # Keep only lines containing 0 and 1
-        pixel_lines = [l for l in pixel_lines if set(l.strip()).issubset({'0','1'})]
-
-        # Combine into a single list of pixels
-        pixels = ''.join(pixel_lines)
-        if len(pixels) != width * height:
-            raise ValueError(f"PBM pixel data does not match width*height ({len(pixels)} != {width*height})")
-
-        # Draw pixels
-        for y in range(height):
-            for x in range(width):
-                if pixels[y*width + x] == '1':
-                    self.pixel(x + x_offset, y + y_offset, c)
-
-    def show(self):
-        # x0 = 0
-        # x1 = self.width - 1
-        # if self.width == 64:
-        #     # displays with width of 64 pixels are shifted by 32
-        #     x0 += 32
-        #     x1 += 32
-        # self.write_cmd(SET_COL_ADDR)
-        # self.write_cmd(x0)
-        # self.write_cmd(x1)
-        # self.write_cmd(SET_PAGE_ADDR)
-        # self.write_cmd(0)
-        # self.write_cmd(self.pages - 1)
-        # self.write_data(self.buffer)
-
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
+    def write_cmds(self, cmds):
+        # drivers that can stream several command bytes in one transfer override this
+        for cmd in cmds:
+            self.write_cmd(cmd)
 
+    def _set_window(self, x0, x1, page0, page1):
+        x_shift = 32 if self.width == 64 else 0     # displays with width of 64 pixels are shifted by 32
+        win = self._window
+        win[0] = SET_COL_ADDR
+        win[1] = x0 + x_shift
+        win[2] = x1 + x_shift
+        win[3] = SET_PAGE_ADDR
+        win[4] = page0
+        win[5] = page1
+        self.write_cmds(win)
+
+    def set_diff_mode(self, enabled=True):
+        # keep a shadow of the frame last sent so show() only transmits the bytes that changed
+        if enabled and self._sent is None:
+            self._sent = bytearray(len(self.buffer))
+            self._resync = True     # the panel's contents are unknown until one full frame goes out
+        elif not enabled:
+            self._sent = None
+
+    def _changed_runs(self):
+        # XOR-compare the dirty spans with the shadow frame; runs closer than a window's
+        # overhead are merged, since resending the gap is cheaper than opening a new window
+        buf = self.buffer
+        sent = self._sent
+        lo = self._dirty_lo
+        hi = self._dirty_hi
+        windows = []
         for page in range(self.pages):
-            # set column address range
-            self.write_cmd(SET_COL_ADDR)
-            self.write_cmd(x0)
-            self.write_cmd(x1)
-
-            # set current page
-            self.write_cmd(SET_PAGE_ADDR)
-            self.write_cmd(page)
-            self.write_cmd(page)
-
-            # send one page of buffer (width bytes)
-            start = page * self.width
-            end = start + self.width
-            self.write_data(self.buffer[start:end])
+            if lo[page] > hi[page]:
+                continue
+            base = page * self.width
+            start = end = -1
+            for x in range(lo[page], hi[page] + 1):
+                if buf[base + x] ^ sent[base + x]:
+                    if start < 0:
+                        start = x
+                    elif x - end > WINDOW_COST:
+                        windows.append((start, end, page, page))
+                        start = x
+                    end = x
+                    self.diff_changed += 1
+            self.diff_checked += hi[page] - lo[page] + 1
+            if start >= 0:
+                windows.append((start, end, page, page))
+        return windows
+
+    def _windows(self, full=False):
+        # plan the flush as (x0, x1, page0, page1) windows and clear the dirty state
+        if full or self._resync:
+            windows = ((0, self.width - 1, 0, self.pages - 1),)
+            self._resync = False
+        elif self._sent is not None:
+            windows = self._changed_runs()
+            self.diff_windows += len(windows)
+        else:
+            windows = [(self._dirty_lo[page], self._dirty_hi[page], page, page)
+                       for page in range(self.pages) if self._dirty_lo[page] <= self._dirty_hi[page]]
+        self.mark_clean()
+        if len(windows) > 1:
+            # one full-width burst over the pages unless separate windows are cheaper on the bus
+            first = windows[0][2]
+            last = windows[-1][3]
+            cost = 0
+            for x0, x1, page0, page1 in windows:
+                cost += (x1 - x0 + 1) * (page1 - page0 + 1) + WINDOW_COST
+            if (last - first + 1) * self.width + WINDOW_COST <= cost:
+                windows = ((0, self.width - 1, first, last),)
+        return windows
+
+    def _flush(self, full=False, chunk=0):
+        # sends the planned windows, yielding after every data transfer of at most chunk bytes
+        # (0 sends each window whole); the panel's address pointer carries on across transfers
+        width = self.width
+        if full or self._resync:
+            frame = self._frame_hash()
+        elif self.is_dirty():
+            frame = self._frame_hash()
+            if frame is not None and frame == self._hash:
+                # drawn over, but back to exactly the frame the panel already shows
+                self.mark_clean()
+                self.flush_skipped += 1
+                self.bytes_full += self.pages * width
+                return
+        else:
+            frame = self._hash
+        for x0, x1, page0, page1 in self._windows(full):
+            self._set_window(x0, x1, page0, page1)
+            if x0 == 0 and x1 == width - 1:
+                # full-width windows map to one contiguous run of the buffer
+                start = page0 * width
+                end = (page1 + 1) * width
+            else:
+                start = page0 * width + x0
+                end = start + x1 - x0 + 1
+            step = chunk or end - start
+            for pos in range(start, end, step):
+                stop = min(pos + step, end)
+                self.write_data(self._mv[pos:stop])
+                self.bytes_sent += stop - pos
+                if self._sent is not None:
+                    self._sent[pos:stop] = self._mv[pos:stop]
+                yield
+        self.bytes_full += self.pages * width
+        # drawing between the chunks of an async flush leaves the panel's frame unknown
+        self._hash = None if self.is_dirty() else frame
+
+    def _frame_hash(self):
+        return crc32(self.buffer) if crc32 is not None else None
+
+    def show(self, full=False):
+        # only what changed since the last show() is sent: dirty column spans, or with
+        # diff mode on, the runs that differ from the frame already on the panel; nothing at
+        # all when the frame hashes the same as the one last sent
+        self.span.start()
+        for _ in self._flush(full):
+            pass
+        self.span.stop()
+
+    async def show_async(self, full=False, chunk=None):
+        # as show(), but hands control back to the event loop after every chunk (a page by default);
+        # the profiled time leaves out whatever ran in between
+        if not Profiler.enabled():
+            for _ in self._flush(full, self.width if chunk is None else chunk):
+                await asyncio.sleep(0)
+            return
+        us = 0
+        t0 = ticks_us()
+        for _ in self._flush(full, self.width if chunk is None else chunk):
+            us += ticks_diff(ticks_us(), t0)
+            await asyncio.sleep(0)
+            t0 = ticks_us()
+        self.span.add(us + ticks_diff(ticks_us(), t0))
+
+    def frame_sent(self, frame):
+        # another path (a broadcast) has put frame on this panel's top len(frame) // width pages,
+        # which hold the same bytes in this buffer: they count as sent, and diff mode compares
+        # against them from now on
+        size = len(frame)
+        whole = size == len(self.buffer)
+        if self._sent is not None:
+            self._sent[:size] = frame
+            if whole:
+                self._resync = False
+        for page in range(size // self.width):
+            self._dirty_lo[page] = 0xFF
+            self._dirty_hi[page] = 0
+        if crc32 is None or self._resync:
+            self._hash = None
+        elif whole:
+            self._hash = crc32(frame)
+        else:
+            # the rest of the panel only matches the buffer if nothing else is waiting to go out
+            self._hash = None if self.is_dirty() else crc32(self.buffer)
+
+    def stats(self):
+        return {
+            "bytes_sent": self.bytes_sent,
+            "bytes_full": self.bytes_full,
+            "diff_checked": self.diff_checked,
+            "diff_changed": self.diff_changed,
+            "diff_windows": self.diff_windows,
+            "flush_skipped": self.flush_skipped,
+        }
+
+
+def broadcast_show(group, panels, full=True):
+    # group is an SSD1306 on a bus reaching every panel at once (e.g. I2CMultiplex.broadcast());
+    # its frame goes out in one set of transactions and becomes what each panel is known to show.
+    # A group shorter than the panels covers just their top pages, e.g. a shared banner band
+    group.show(full)
+    for panel in panels:
+        panel.frame_sent(group.buffer)
+
+
+def broadcast_shared(group, panels):
+    # sends the group's top pages (a band drawn the same on every panel) once through group,
+    # if every panel has just redrawn them and they match; True if it did
+    size = len(group.buffer)
+    last = size // group.width - 1
+    first = panels[0].buffer[:size]
+    for panel in panels:
+        if not panel.is_dirty(0, last) or (panel is not panels[0] and panel.buffer[:size] != first):
+            return False
+    group.buffer[:] = first
+    broadcast_show(group, panels)
+    return True
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, font=DEFAULT_FONT, init=True):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
-        super().__init__(width, height, external_vcc)
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
+        super().__init__(width, height, external_vcc, font, init)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        # a command stream: one transaction for the whole sequence
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
-        self.i2c.writeto(self.addr, b'\x40' + buf)
+        # the control byte and the buffer go out as one transfer, without concatenating them
+        self.write_list[1] = buf
+        self.i2c.writevto(self.addr, self.write_list)
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, font=DEFAULT_FONT, init=True):
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -484,7 +827,7 @@ class SSD1306_SPI(SSD1306):
         self.res(0)
         time.sleep_ms(10)
         self.res(1)
-        super().__init__(width, height, external_vcc)
+        super().__init__(width, height, external_vcc, font, init)
 
     def write_cmd(self, cmd):
         self.spi.init(baudrate=self.rate, polarity=0, phase=0)
@@ -494,6 +837,14 @@ class SSD1306_SPI(SSD1306):
         self.spi.write(bytearray([cmd]))
         self.cs(1)
 
+    def write_cmds(self, cmds):
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(cmds)
+        self.cs(1)
+
     def write_data(self, buf):
         self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
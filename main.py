@@ -2,23 +2,25 @@ import time
 import asyncio
 import machine
 from machine import I2C, Pin, UART, RTC
-from collections import deque
 
 from hardware.LED8_HT16K33 import HT16K33LED
 from hardware.GPS_PARSER import GPSReader
 from hardware.LED4_TM1650 import LED4digdisp
 from hardware.MUX_TCA9548A import I2CMultiplex
-from hardware.OLED_SSD1306 import SSD1306_I2C
+from hardware.OLED_SSD1306 import SSD1306_I2C, BANNER_HEIGHT, broadcast_shared
 from hardware.WLAN import WLAN
+import hardware.I2C_TRACER as I2CTracer
 
 import functions.timezones as AusTimeZones
 import functions.geohash as Geohash
 import functions.forecast as BoMData
 import functions.time_cruncher as TimeCruncher
 import functions.weather_icons as IconGrabber
+import functions.profiler as Profiler
 
-from functions.string_writer import ezFBfont as ezFBfont
-from fonts import spleen8, spleen12, spleen16, spleen23, helvetica15bold
+from functions.widgets import Panel, Band, Text, WrappedText, Icon, Value, Router
+from functions.event_bus import EventBus
+from fonts import spleen12, spleen16, spleen23, helvetica15bold
 
 ## PINS
 PIN_UART_TX = 0
@@ -41,6 +43,10 @@ OLED_ID_TR = 3
 OLED_ID_BL = 0
 OLED_ID_BR = 1
 ## CONSTANTS
+I2C_TRACE = False               # wrap both I2C buses in a tracer and print bus usage every TRACE_REPORT_S
+TRACE_REPORT_S = 300
+PROFILE = False                 # time the OLED render path and print the span table every PROFILE_REPORT_S
+PROFILE_REPORT_S = 300
 DAYS_OF_WEEK = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 MONTHS_OF_YEAR = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 ## GLOBALS
@@ -56,7 +62,6 @@ VALID_GPS_FIX = False
 VALID_GPS_DATA = False
 VALID_LOCATION_DATA = False
 VALID_FORECAST_DATA = False
-REQUIRE_REFRESH = False
 C_Y = None
 C_M = None
 C_D = None
@@ -80,8 +85,6 @@ TM_MIN = None
 TM_RAIN = None
 TM_ICON = None
 TM_TEXT = None
-## EVENT QUEUE
-OLED_EVENT_QUEUE = deque((), 10)
 ## EVENTS
 EV_STARTUP = 1
 EV_TIME_TICK = 2
@@ -89,6 +92,17 @@ EV_DATE_CHANGE = 3
 EV_LOCATION_UPD = 4
 EV_FORECAST_UPD = 5
 EV_FORECAST_FAIL = 6
+EV_OLED_FAIL = 7
+EVENT_NAMES = {EV_STARTUP: "startup", EV_TIME_TICK: "time tick", EV_DATE_CHANGE: "date change",
+               EV_LOCATION_UPD: "location", EV_FORECAST_UPD: "forecast", EV_FORECAST_FAIL: "forecast fail",
+               EV_OLED_FAIL: "oled fail"}
+## EVENT BUS
+OLED_MIN_REFRESH_MS = 30000         # batches of events render at most this often...
+OLED_MAX_REFRESH_MS = 300000        # ...and every panel is refreshed after this long without a full pass
+OLED_SCROLL_S = 0.25                # marquee step interval for forecast text that doesn't fit its box
+EV_URGENT = 2
+EVENT_PRIORITIES = {EV_STARTUP: 2, EV_DATE_CHANGE: 2, EV_LOCATION_UPD: 1, EV_FORECAST_UPD: 1}  # urgent ones skip the wait
+OLED_EVENTS = EventBus(EVENT_PRIORITIES, OLED_MIN_REFRESH_MS, EV_URGENT)       # OLED_EVENTS.stats() at the REPL
 
 ## HARDWARE
 wlan = WLAN()                                                                               # create WLAN object
@@ -96,6 +110,9 @@ pico_rtc = machine.RTC()
 uart = UART(0, baudrate=9600, tx=Pin(PIN_UART_TX), rx=Pin(PIN_UART_RX))                     # Set up UART connection to GPS module
 i2c = I2C(0, scl=Pin(PIN_LED8_SCL), sda=Pin(PIN_LED8_SDA))                                  # Set up I2C connection
 mux = I2CMultiplex(ADDR_MUX, I2Cbus=1, scl_pin=PIN_MUX_SCL, sda_pin=PIN_MUX_SDA)            # Set up I2C multiplexer
+if I2C_TRACE:
+    i2c = I2CTracer.TracedI2C(i2c, "I2C0")
+    mux.i2c = I2CTracer.TracedI2C(mux.i2c, "I2C1")                                         # mux channels all go through mux.i2c
 GPS_obj = GPSReader(uart)                                                                   # Create a GPS reader object   
 disp8 = HT16K33LED(i2c)                                                                     # Create 8digit LED object
 disp4H = LED4digdisp(1, PIN_LED4H_SCL, PIN_LED4H_SDA)                                       # Create 4digit LED object (HIGH)         
@@ -104,34 +121,89 @@ BoMLocInfo = BoMData.BoMLocation()
 BoMForecastInfo = BoMData.BoMForecast()                                                     # Create the BoM Forecast data structure
 TimezoneInfo = AusTimeZones.LocalTimezone()                                                 # Create the Timezone data structure
 
-mux.select_port(OLED_ID_TL)                                                                 # select the correct mux port
-oledTL = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.i2c)                                       # and create the OLED object
-oledTL8 = ezFBfont(oledTL, spleen8)
-oledTL12 = ezFBfont(oledTL, spleen12)
-oledTL16 = ezFBfont(oledTL, spleen16)
-oledTL23 = ezFBfont(oledTL, spleen23)
-oledTLhead = ezFBfont(oledTL, helvetica15bold, hgap=2)
-mux.select_port(OLED_ID_TR)
-oledTR = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.i2c)
-oledTR8 = ezFBfont(oledTR, spleen8)
-oledTR12 = ezFBfont(oledTR, spleen12)
-oledTR16 = ezFBfont(oledTR, spleen16)
-oledTR23 = ezFBfont(oledTR, spleen23)
-oledTRhead = ezFBfont(oledTR, helvetica15bold, hgap=2)
-mux.select_port(OLED_ID_BL)
-oledBL = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.i2c)
-oledBL8 = ezFBfont(oledBL, spleen8)
-oledBL12 = ezFBfont(oledBL, spleen12)
-oledBL16 = ezFBfont(oledBL, spleen16)
-oledBL23 = ezFBfont(oledBL, spleen23)
-oledBLhead = ezFBfont(oledBL, helvetica15bold, hgap=2)
-mux.select_port(OLED_ID_BR)
-oledBR = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.i2c)
-oledBR8 = ezFBfont(oledBR, spleen8)
-oledBR12 = ezFBfont(oledBR, spleen12)
-oledBR16 = ezFBfont(oledBR, spleen16)
-oledBR23 = ezFBfont(oledBR, spleen23)
-oledBRhead = ezFBfont(oledBR, helvetica15bold, hgap=2)
+oledTL = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.channel(OLED_ID_TL), init=False)         # create the OLED object on its mux channel
+oledTR = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.channel(OLED_ID_TR), init=False)
+oledBL = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.channel(OLED_ID_BL), init=False)
+oledBR = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.channel(OLED_ID_BR), init=False)
+for oled in (oledTL, oledTR, oledBL, oledBR):
+    oled.set_diff_mode()        # 1 KB shadow each; a repaint that redraws the same pixels sends only the bytes that changed
+oledBand = SSD1306_I2C(OLED_RES_X, BANNER_HEIGHT, mux.broadcast((OLED_ID_TR, OLED_ID_BR)), font=None, init=False)   # the top pages of TR and BR at once
+
+def init_oleds():
+    # init and clear all four panels in one broadcast; the panels then know they show a blank frame,
+    # so their first refresh sends only what's drawn. oledAll's 1 KB buffer goes when this returns
+    oledAll = SSD1306_I2C(OLED_RES_X, OLED_RES_Y, mux.broadcast((OLED_ID_TL, OLED_ID_TR, OLED_ID_BL, OLED_ID_BR)), font=None)
+    for oled in (oledTL, oledTR, oledBL, oledBR):
+        oled.frame_sent(oledAll.buffer)
+    del oledAll
+
+init_oleds()
+
+# OLED SCENE: each widget reads its value from the globals through a source at refresh time
+def td_header():
+    return f"{TD_D:02} {MONTHS_OF_YEAR[TD_M - 1]} {TD_Y:04}"
+
+def tm_header():
+    return f"{TM_D:02} {MONTHS_OF_YEAR[TM_M - 1]} {TM_Y:04}"
+
+def td_min():
+    # overnight, today's minimum has been and gone
+    _, _, _, hh, _, _, _, _ = TimeCruncher.now_local(TIMEZONE_OFFSET)
+    if hh < 4 or hh > 18:
+        return ("Overnight Low:", None)
+    return ("Min:", TD_MIN)
+
+panelTL = Panel(oledTL, [
+    Band(oledTL, td_header, helvetica15bold),
+    Text(oledTL, 0, 17, 128, 23, lambda: DAYS_OF_WEEK[C_WD % 7], spleen23, halign="center", cache=True),
+    Value(oledTL, 4, 41, 119, 23, lambda: TD_RAIN, spleen23, unit="%", label="Rain: ", label_font=spleen16, label_dy=5),
+])
+panelBL = Panel(oledBL, [
+    Band(oledBL, tm_header, helvetica15bold),
+    Text(oledBL, 0, 17, 128, 23, lambda: DAYS_OF_WEEK[(C_WD + 1) % 7], spleen23, halign="center", cache=True),
+    Value(oledBL, 4, 42, 119, 22, lambda: TM_RAIN, spleen23, unit="%", label="Rain: ", label_font=spleen16, label_dy=5),
+])
+# forecast text too long for its box scrolls through it, stepped by scroll_oleds()
+forecastTR = WrappedText(oledTR, 54, 16, 72, 36, lambda: TD_TEXT, spleen12, overflow="scroll")    # right of the icon, above Min:
+forecastBR = WrappedText(oledBR, 54, 16, 72, 36, lambda: TM_TEXT, spleen12, overflow="scroll")
+panelTR = Panel(oledTR, [
+    Band(oledTR, lambda: C_LN, helvetica15bold),
+    Icon(oledTR, 5, 16, 45, 37, lambda: IconGrabber.get_icon(TD_ICON, 37, TIMEZONE_OFFSET, day=0)),     # rows 16..52, above the full-width Min: row
+    forecastTR,
+    Value(oledTR, 4, 53, 119, 11, td_min, spleen16, unit="°C", label_font=spleen12, label_dy=1),
+])
+panelBR = Panel(oledBR, [
+    Band(oledBR, lambda: C_LN, helvetica15bold),
+    Icon(oledBR, 5, 16, 45, 37, lambda: IconGrabber.get_icon(TM_ICON, 37, TIMEZONE_OFFSET, day=1)),
+    forecastBR,
+    Value(oledBR, 4, 53, 119, 11, lambda: TM_MIN, spleen16, unit="°C", label="Min:", label_font=spleen12, label_dy=1),
+])
+OLED_PANELS = (panelTL, panelBL, panelTR, panelBR)
+OLED_RESYNC = False                     # set after a failed flush: the next render resends every panel whole
+OLED_LOCK = asyncio.Lock()              # held while render_oleds() flushes, so scrolling keeps out of its way
+RENDER_SPAN = Profiler.span("render")
+if PROFILE:
+    Profiler.enable()
+    for name, oled in (("TL", oledTL), ("BL", oledBL), ("TR", oledTR), ("BR", oledBR)):
+        oled.span = Profiler.span("show " + name)
+
+# OLED ROUTES: the panels showing each piece of state, and the state each event changes
+OLED_FIELDS = {
+    "date": (panelTL, panelBL),         # TD_/TM_ Y, M, D in the headers
+    "weekday": (panelTL, panelBL),      # C_WD
+    "rain": (panelTL, panelBL),
+    "location": (panelTR, panelBR),     # C_LN in the banners
+    "outlook": (panelTR, panelBR),      # icon, text and minimum
+}
+OLED_ROUTES = {
+    EV_STARTUP: None,                   # everything
+    EV_DATE_CHANGE: ("weekday",),       # the forecast for the new day follows as EV_FORECAST_UPD
+    EV_LOCATION_UPD: ("location",),
+    EV_FORECAST_UPD: ("date", "rain", "outlook"),
+    EV_FORECAST_FAIL: (),               # nothing on the panels changes
+    EV_OLED_FAIL: None,                 # a flush failed: resend everything
+}
+oledRouter = Router(OLED_PANELS, OLED_FIELDS, OLED_ROUTES)        # oledRouter.summary(EVENT_NAMES) at the REPL
 
 disp8.set_brightness(15)                                        # TURN ON THE 8 DIGIT DISPLAY WITH MAX BRIGHTNESS
 disp4H.display_on(0)                                            # TURN ON THE UPPER 4 DIGIT DISPLAY WITH MAX BRIGHTNESS
@@ -140,7 +212,7 @@ disp4L.display_on(0)
 disp4L.show_string("__*C")
 
 def oled_event(event):
-    OLED_EVENT_QUEUE.append((event, time.time()))
+    OLED_EVENTS.post(event)
 
 
 async def check_Wifi():
@@ -471,181 +543,70 @@ async def update_temperature_display():
         await asyncio.sleep(300)
 
 async def oled_refresh_scheduler():
-    last_render = 0
-    MIN_REFRESH = 30
-    MAX_REFRESH = 300
+    global OLED_RESYNC
+    last_full = time.ticks_ms()
     while True:
-        now = time.time()
-        if now - last_render > MAX_REFRESH:
-            while OLED_EVENT_QUEUE:
-                OLED_EVENT_QUEUE.popleft()
-            await render_oleds()
-            last_render = now
-            continue
-        if OLED_EVENT_QUEUE:
-            if now - last_render < MIN_REFRESH:
-                await asyncio.sleep(MIN_REFRESH)
-                continue
-            while OLED_EVENT_QUEUE:
-                OLED_EVENT_QUEUE.popleft()
-            await render_oleds()
-            last_render = now
+        # the next batch of events, or nothing once a full pass is due
+        due = OLED_MAX_REFRESH_MS - time.ticks_diff(time.ticks_ms(), last_full)
+        events = await OLED_EVENTS.get(max(due, 0))
+        full = OLED_RESYNC
+        try:
+            if events and not full:
+                await render_oleds(oledRouter.route(events))
+            else:
+                await render_oleds(full=full)
+                last_full = time.ticks_ms()
+            OLED_RESYNC = False
+        except OSError as e:
+            # a NAK (mux select or panel) leaves what the panels show unknown: redraw and resend
+            # all of them on the next pass, once the bus's minimum interval has passed
+            print("oled_refresh_scheduler() failed to update the OLEDs:", e)
+            OLED_RESYNC = True
+            oled_event(EV_OLED_FAIL)
+        if events:
+            OLED_EVENTS.done()
+
+async def render_oleds(panels=OLED_PANELS, full=False):
+    # full: redraw every widget and send whole frames, whatever the panels are thought to show
+    async with OLED_LOCK:
+        # repaint only the widgets whose values changed, a panel at a time so the clock keeps ticking
+        for panel in panels:
+            RENDER_SPAN.start()
+            panel.refresh(full)
+            RENDER_SPAN.stop()
+            await asyncio.sleep(0)
+        # then send just the repainted regions, a page at a time
+        if not full and panelTR in panels and panelBR in panels:
+            broadcast_shared(oledBand, (oledTR, oledBR))       # the location band, once for both
+        for panel in panels:
+            await panel.device.show_async(full)
+
+async def scroll_oleds():
+    global OLED_RESYNC
+    # each step re-blits a window of the prerendered strip and sends just the text box
+    while True:
+        await asyncio.sleep(OLED_SCROLL_S)
+        if OLED_LOCK.locked() or OLED_RESYNC:
             continue
-        await asyncio.sleep(15)
-
-async def render_oleds():
-    # get the days of the week
-    str_td_dow = DAYS_OF_WEEK[C_WD % 7]
-    str_tm_dow = DAYS_OF_WEEK[(C_WD + 1) % 7]
-
-    # get the months of the year
-    str_td_moy = MONTHS_OF_YEAR[TD_M - 1]
-    str_tm_moy = MONTHS_OF_YEAR[TM_M - 1]
-
-    # get the hour of the day
-    _, _, _, hh, _, _, _, _ = TimeCruncher.now_local(TIMEZONE_OFFSET)
-
-    # clear the screens and fill in the banners
-    mux.select_port(OLED_ID_TL)
-    oledTL.fill(0)
-    oledTL.fill_rect(0, 0, 128, 16, 1)
-    oledBL.fill(0)
-    oledBL.fill_rect(0, 0, 128, 16, 1)
-    oledTR.fill(0)
-    oledTR.fill_rect(0, 0, 128, 16, 1)
-    oledBR.fill(0)
-    oledBR.fill_rect(0, 0, 128, 16, 1)
-
-    # top left
-    date_header = f"{TD_D:02} {str_td_moy} {TD_Y:04}"
-    oledTLhead.write(date_header, x=64, halign="center", y=1, fg=0, bg=1)
-    oledTL23.write(str_td_dow, halign="center", y=17, x=64)
-    oledTL16.write("Rain: ", halign="left", y=46, x=4)
-    str_rain_percent = f"{TD_RAIN:0}%"
-    oledTL23.write(str_rain_percent, halign="right", y=41, x=123)
-
-    # bottom left
-    date_header = f"{TM_D:02} {str_tm_moy} {TM_Y:04}"
-    oledBLhead.write(date_header, x=64, halign="center", y=1, fg=0, bg=1)
-    oledBL23.write(str_tm_dow, halign="center", y=17, x=64)
-    oledBL16.write("Rain: ", halign="left", y=47, x=4)
-    str_rain_percent = f"{TM_RAIN:0}%"
-    oledBL23.write(str_rain_percent, halign="right", y=42, x=123)
-
-    # top right
-    oledTRhead.write(C_LN, x=64, halign="center", y=1, fg=0, bg=1)
-    icon = IconGrabber.get_icon(TD_ICON, 37, TIMEZONE_OFFSET, day=0)
-    oledTR.display_pbm(icon, x_offset=5, y_offset=17)           
-    test_text = ezFBfont.split_text(TD_TEXT)
-    oledTR12.write(test_text, halign="center", valign="center", y=34, x=90)
-    if hh < 4 or hh > 18:
-        oledTR12.write("Overnight Low:", halign="left", y=54, x=46)
-    else:
-        oledTR12.write("Min:", halign="left", y=54, x=55)
-        str_min = f"{TD_MIN:0}°C"
-        oledTR16.write(str_min, halign="right", y=53, x=122)
-
-    # bottom right
-    oledBRhead.write(C_LN, x=64, halign="center", y=1, fg=0, bg=1)
-    icon = IconGrabber.get_icon(TM_ICON, 37, TIMEZONE_OFFSET, day=1)
-    oledBR.display_pbm(icon, x_offset=5, y_offset=17)
-    test_text = ezFBfont.split_text(TM_TEXT)
-    oledBR12.write(test_text, halign="center", valign="center", y=34, x=90)
-    oledBR12.write("Min:", halign="left", y=54, x=55)
-    str_min = f"{TM_MIN:0}°C"
-    oledBR16.write(str_min, halign="right", y=53, x=122)
-
-    # print("writing data to OLEDs")
-    mux.select_port(OLED_ID_TL)
-    oledTL.show()
-    mux.select_port(OLED_ID_BL)
-    oledBL.show()
-    mux.select_port(OLED_ID_TR)
-    oledTR.show()
-    mux.select_port(OLED_ID_BR)
-    oledBR.show()
-
-async def refresh_oleds():
-    global REQUIRE_REFRESH
+        for panel, widget in ((panelTR, forecastTR), (panelBR, forecastBR)):
+            try:
+                if widget.scroll():
+                    panel.device.show()
+            except OSError as e:
+                print("scroll_oleds() failed to update an OLED:", e)
+                OLED_RESYNC = True
+                oled_event(EV_OLED_FAIL)
+                break
+
+async def trace_report():
     while True:
-        while not REQUIRE_REFRESH:
-            # print("refresh_oleds() doesn't think the OLEDs need a refresh")
-            await asyncio.sleep(60)
-        
-        # get the days of the week
-        str_td_dow = DAYS_OF_WEEK[C_WD % 7]
-        str_tm_dow = DAYS_OF_WEEK[(C_WD + 1) % 7]
-
-        # get the months of the year
-        str_td_moy = MONTHS_OF_YEAR[TD_M - 1]
-        str_tm_moy = MONTHS_OF_YEAR[TM_M - 1]
+        await asyncio.sleep(TRACE_REPORT_S)
+        I2CTracer.dump()
 
-        # get the hour of the day
-        _, _, _, hh, _, _, _, _ = TimeCruncher.now_local(TIMEZONE_OFFSET)
-
-        # clear the screens and fill in the banners
-        mux.select_port(OLED_ID_TL)
-        oledTL.fill(0)
-        oledTL.fill_rect(0, 0, 128, 16, 1)
-        oledBL.fill(0)
-        oledBL.fill_rect(0, 0, 128, 16, 1)
-        oledTR.fill(0)
-        oledTR.fill_rect(0, 0, 128, 16, 1)
-        oledBR.fill(0)
-        oledBR.fill_rect(0, 0, 128, 16, 1)
-
-        # top left
-        date_header = f"{TD_D:02} {str_td_moy} {TD_Y:04}"
-        oledTLhead.write(date_header, x=64, halign="center", y=1, fg=0, bg=1)
-        oledTL23.write(str_td_dow, halign="center", y=17, x=64)
-        oledTL16.write("Rain: ", halign="left", y=46, x=4)
-        str_rain_percent = f"{TD_RAIN:0}%"
-        oledTL23.write(str_rain_percent, halign="right", y=41, x=123)
-
-        # bottom left
-        date_header = f"{TM_D:02} {str_tm_moy} {TM_Y:04}"
-        oledBLhead.write(date_header, x=64, halign="center", y=1, fg=0, bg=1)
-        oledBL23.write(str_tm_dow, halign="center", y=17, x=64)
-        oledBL16.write("Rain: ", halign="left", y=47, x=4)
-        str_rain_percent = f"{TM_RAIN:0}%"
-        oledBL23.write(str_rain_percent, halign="right", y=42, x=123)
-
-        # top right
-        oledTRhead.write(C_LN, x=64, halign="center", y=1, fg=0, bg=1)
-        icon = IconGrabber.get_icon(TD_ICON, 37, TIMEZONE_OFFSET, day=0)
-        oledTR.display_pbm(icon, x_offset=5, y_offset=17)           
-        test_text = ezFBfont.split_text(TD_TEXT)
-        oledTR12.write(test_text, halign="center", valign="center", y=34, x=90)
-        if hh < 4 or hh > 18:
-            oledTR12.write("Overnight Low:", halign="left", y=54, x=46)
-        else:
-            oledTR12.write("Min:", halign="left", y=54, x=55)
-            str_min = f"{TD_MIN:0}°C"
-            oledTR16.write(str_min, halign="right", y=53, x=122)
-
-        # bottom right
-        oledBRhead.write(C_LN, x=64, halign="center", y=1, fg=0, bg=1)
-        icon = IconGrabber.get_icon(TM_ICON, 37, TIMEZONE_OFFSET, day=1)
-        oledBR.display_pbm(icon, x_offset=5, y_offset=17)
-        test_text = ezFBfont.split_text(TM_TEXT)
-        oledBR12.write(test_text, halign="center", valign="center", y=34, x=90)
-        oledBR12.write("Min:", halign="left", y=54, x=55)
-        str_min = f"{TM_MIN:0}°C"
-        oledBR16.write(str_min, halign="right", y=53, x=122)
-
-        # print("writing data to OLEDs")
-        mux.select_port(OLED_ID_TL)
-        oledTL.show()
-        mux.select_port(OLED_ID_BL)
-        oledBL.show()
-        mux.select_port(OLED_ID_TR)
-        oledTR.show()
-        mux.select_port(OLED_ID_BR)
-        oledBR.show()
-
-        REQUIRE_REFRESH = False
-
-        await asyncio.sleep(120)
+async def profile_report():
+    while True:
+        await asyncio.sleep(PROFILE_REPORT_S)
+        Profiler.dump()
 
 async def main():
     tasks = []
@@ -668,11 +629,14 @@ async def main():
     await asyncio.sleep(2)
 
     tasks.append(asyncio.create_task(update_new_forecast_data()))
+    if I2C_TRACE:
+        tasks.append(asyncio.create_task(trace_report()))
+    if PROFILE:
+        tasks.append(asyncio.create_task(profile_report()))
     
     await asyncio.sleep(7)
-    # tasks.append(asyncio.create_task(refresh_oleds()))
     tasks.append(asyncio.create_task(oled_refresh_scheduler()))
-    # tasks.append(asyncio.create_task(render_oleds()))
+    tasks.append(asyncio.create_task(scroll_oleds()))
     await asyncio.sleep(2)
 
     print("ALL ONGOING TASKS STARTED!")
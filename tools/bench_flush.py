@@ -0,0 +1,80 @@
+# Counts I2C transactions and bytes for SSD1306_I2C init and refreshes on a fake bus,
+# comparing the old per-command / per-page writes with batched commands and burst flushes,
+# and with frame-diff mode on top. Both new columns hash the frame, so a redraw that changes
+# nothing sends nothing.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_flush.py
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+from hardware.OLED_SSD1306 import SSD1306_I2C
+
+class CountingI2C:
+    def __init__(self):
+        self.transactions = 0
+        self.bytes = 0
+
+    def writeto(self, addr, buf):
+        self.transactions += 1
+        self.bytes += 1 + len(buf)      # address byte + payload
+
+    def writevto(self, addr, bufs):
+        self.transactions += 1
+        self.bytes += 1 + sum(len(b) for b in bufs)
+
+    def reset(self):
+        self.transactions = 0
+        self.bytes = 0
+
+class LegacySSD1306(SSD1306_I2C):
+    # one transaction per command byte, a concatenated copy per page, every page every time
+    def write_cmds(self, cmds):
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
+    def write_data(self, buf):
+        self.i2c.writeto(self.addr, b'\x40' + buf)
+
+    def show(self, full=False):
+        for page in range(self.pages):
+            for cmd in (0x21, 0, self.width - 1, 0x22, page, page):
+                self.write_cmd(cmd)
+            start = page * self.width
+            self.write_data(self.buffer[start:start + self.width])
+        self.mark_clean()
+
+def draw_frame(oled):
+    oled.fill(0)
+    oled.fill_rect(0, 0, 128, 16, 1)
+    oled.fill_rect(20, 20, 88, 10, 1)
+
+def run(cls, diff=False):
+    bus = CountingI2C()
+    oled = cls(128, 64, bus)
+    if diff:
+        oled.set_diff_mode()
+    results = [('init', bus.transactions, bus.bytes)]
+    bus.reset()
+    draw_frame(oled)
+    oled.show()
+    results.append(('full refresh', bus.transactions, bus.bytes))
+    bus.reset()
+    oled.fill_rect(80, 41, 44, 23, 0)       # the "Rain: NN%" value
+    oled.fill_rect(84, 44, 30, 16, 1)
+    oled.show()
+    results.append(('rain value only', bus.transactions, bus.bytes))
+    bus.reset()
+    draw_frame(oled)                        # periodic repaint of the same content
+    oled.show()
+    draw_frame(oled)
+    bus.reset()
+    oled.show()
+    results.append(('identical redraw', bus.transactions, bus.bytes))
+    return results
+
+print('{:<17}{:>14}{:>14}{:>14}'.format('trans / bytes', 'old', 'new', 'new + diff'))
+for old, new, diff in zip(run(LegacySSD1306), run(SSD1306_I2C), run(SSD1306_I2C, diff=True)):
+    print('{:<17}{:>14}{:>14}{:>14}'.format(old[0], *['{} / {}'.format(r[1], r[2]) for r in (old, new, diff)]))
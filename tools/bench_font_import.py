@@ -0,0 +1,80 @@
+# Import time and heap held per font module, for one or more copies of the fonts side by side.
+# To compare against the dict-of-bytes modules the fonts used before tools/compact_fonts.py,
+# taken from the first commit:
+#   mkdir /tmp/oldfonts
+#   for f in spleen8 spleen12 spleen16 spleen23 helvetica15bold; do
+#       git show $(git rev-list --max-parents=0 HEAD):fonts/$f.py > /tmp/oldfonts/$f.py; done
+#   micropython tools/bench_font_import.py /tmp/oldfonts fonts
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_font_import.py [DIR ...]     (default: fonts/)
+# Each module is imported in a fresh state, so the time includes compiling the .py source
+# unless a .mpy/.pyc is present. Every folder gets an untimed warm-up import first, so the
+# importer's own one-off setup isn't charged to the first font measured.
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import gc
+import os
+import time
+
+FONTS = ("spleen8", "spleen12", "spleen16", "spleen23", "helvetica15bold")
+
+try:
+    mem_free = gc.mem_free
+except AttributeError:
+    # CPython: count traced allocations instead
+    import tracemalloc
+    tracemalloc.start()
+    mem_free = lambda: -tracemalloc.get_traced_memory()[0]
+
+def load(name):
+    # (import us, heap bytes held) for a fresh import of name
+    sys.modules.pop(name, None)
+    gc.collect()
+    before = mem_free()
+    t0 = time.ticks_us()
+    module = __import__(name)
+    us = time.ticks_diff(time.ticks_us(), t0)
+    gc.collect()
+    held = before - mem_free()
+    del module
+    sys.modules.pop(name, None)
+    return us, held
+
+def measure(folder):
+    # font name -> (import us, heap bytes) for the fonts present in folder
+    present = [name for name in FONTS if name + ".py" in os.listdir(folder)]
+    results = {}
+    sys.path.insert(0, folder)
+    try:
+        if present:
+            load(present[0])        # warm-up, not counted
+        for name in present:
+            results[name] = load(name)
+    finally:
+        sys.path.remove(folder)
+    return results
+
+folders = sys.argv[1:] or [(__file__.rpartition('/')[0] or '.') + '/../fonts']
+runs = [measure(folder) for folder in folders]
+for i, folder in enumerate(folders):
+    print("[%d] %s" % (i, folder))
+print("%-16s" % "font" + "".join("%12s %10s" % ("[%d] us" % i, "bytes") for i in range(len(runs))))
+totals = [[0, 0] for _ in runs]
+for name in FONTS:
+    if not any(name in run for run in runs):
+        continue
+    row = "%-16s" % name
+    for run, total in zip(runs, totals):
+        if name in run:
+            us, held = run[name]
+            total[0] += us
+            total[1] += held
+            row += "%12d %10d" % (us, held)
+        else:
+            row += "%12s %10s" % ("-", "-")
+    print(row)
+print("%-16s" % "total" + "".join("%12d %10d" % (us, held) for us, held in totals))
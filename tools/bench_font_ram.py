@@ -0,0 +1,53 @@
+# Heap used by four SSD1306 panels at boot: each loading its own copy of the 8x8 font
+# (the old behaviour) vs. the lazy shared font, before and after the first text() call.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_font_ram.py
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import gc
+from hardware.OLED_SSD1306 import SSD1306_I2C, DEFAULT_FONT
+
+PANELS = 4
+
+try:
+    mem_free = gc.mem_free
+except AttributeError:
+    # CPython: count traced allocations instead
+    import tracemalloc
+    tracemalloc.start()
+    mem_free = lambda: -tracemalloc.get_traced_memory()[0]
+
+class NullI2C:
+    def writeto(self, addr, buf):
+        pass
+
+    def writevto(self, addr, bufs):
+        pass
+
+class EagerFontSSD1306(SSD1306_I2C):
+    # the old constructor: every panel reads the .dat file into its own bytearray
+    def __init__(self, *args):
+        super().__init__(*args)
+        with open(DEFAULT_FONT, "rb") as f:
+            self.font_copy = bytearray(f.read())
+
+def used_by(make):
+    gc.collect()
+    before = mem_free()
+    panels = make()
+    gc.collect()
+    return before - mem_free(), panels
+
+eager, keep = used_by(lambda: [EagerFontSSD1306(128, 64, NullI2C()) for _ in range(PANELS)])
+del keep
+lazy, panels = used_by(lambda: [SSD1306_I2C(128, 64, NullI2C()) for _ in range(PANELS)])
+shared, _ = used_by(lambda: [p.text("Hi", 0, 0) for p in panels])
+
+print('{} panels, per-panel font copies: {} bytes'.format(PANELS, eager))
+print('{} panels, lazy shared font:      {} bytes'.format(PANELS, lazy))
+print('first text() on every panel:      {} bytes'.format(shared))
+print('saved at boot:                    {} bytes'.format(eager - lazy))
@@ -0,0 +1,64 @@
+# Times one weather icon draw: the old parse-the-PBM-every-render path vs. the cached blit,
+# plus the one-off PBM decode and first load that fill the cache.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_icons.py
+# (under CPython blit() is the pure-Python shim, so only the MicroPython numbers mean much)
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import time
+from hardware.OLED_SSD1306 import SSD1306_I2C, load_pbm, assets
+
+ticks_us, ticks_diff = time.ticks_us, time.ticks_diff
+
+RUNS = 10
+ICONS = ("clear-day-37", "partly-cloudy-day-37", "rain-37", "storm-37")
+
+class NullI2C:
+    def writeto(self, addr, buf):
+        pass
+
+    def writevto(self, addr, bufs):
+        pass
+
+def legacy_display_pbm(oled, name, x_offset=0, y_offset=0, c=1):
+    # the previous SSD1306.display_pbm(): read, strip and parse the file, then pixel() each bit
+    with open(f"graphics/{name}.pbm", "r") as f:
+        lines = f.readlines()
+    lines = [l.strip() for l in lines if l.strip()]
+    for i, line in enumerate(lines[1:], start=1):
+        if all(c.isdigit() or c.isspace() for c in line):
+            width, height = map(int, line.split())
+            pixel_lines = lines[i+1:]
+            break
+    pixel_lines = [l for l in pixel_lines if set(l.strip()).issubset({'0','1'})]
+    pixels = ''.join(pixel_lines)
+    for y in range(height):
+        for x in range(width):
+            if pixels[y*width + x] == '1':
+                oled.pixel(x + x_offset, y + y_offset, c)
+
+def timed(fn):
+    t0 = ticks_us()
+    for _ in range(RUNS):
+        for name in ICONS:
+            fn(name)
+    return ticks_diff(ticks_us(), t0) / (RUNS * len(ICONS))
+
+oled = SSD1306_I2C(128, 64, NullI2C())
+t_old = timed(lambda name: legacy_display_pbm(oled, name, 5, 17))
+t_decode = timed(lambda name: load_pbm(f"graphics/{name}.pbm"))
+t_cold = ticks_us()
+for name in ICONS:
+    oled.load_icon(name)
+t_cold = ticks_diff(ticks_us(), t_cold) / len(ICONS)
+t_new = timed(lambda name: oled.display_pbm(name, 5, 17))
+# with graphics/assets.py compiled, load_icon() only slices the frozen bitmap; without it, it decodes the PBM
+first = 'first load (asset lookup):' if assets is not None else 'first load (PBM decode into cache):'
+print('{:<36}{:.1f} us'.format('per icon draw, old parse + pixel():', t_old))
+print('{:<36}{:.1f} us'.format('PBM decode (load_pbm):', t_decode))
+print('{:<36}{:.1f} us'.format(first, t_cold))
+print('{:<36}{:.1f} us'.format('per icon draw, cached blit:', t_new))
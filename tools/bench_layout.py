@@ -0,0 +1,91 @@
+# Per-string layout and write times for ezFBfont: measuring every char with font.get_ch()
+# on each call (the old _line_size) vs. the per-font width table with single-pass layout.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_layout.py
+# On CPython the write column is dominated by the framebuf shim's per-pixel loops.
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import time
+from hardware.OLED_SSD1306 import SSD1306_I2C
+from functions.string_writer import ezFBfont
+from fonts import spleen12, spleen16, spleen23, helvetica15bold
+
+RUNS = 50
+
+class NullI2C:
+    def writeto(self, addr, buf):
+        pass
+
+    def writevto(self, addr, bufs):
+        pass
+
+class LegacyLayout(ezFBfont):
+    def _line_size(self, string):
+        x = 0
+        for char in string:
+            _, _, char_width = self._font.get_ch(char)
+            x += char_width + self.hgap if char_width > 0 else 0
+        x = x - self.hgap if x != 0 else x
+        return x, self._font.height()
+
+    def size(self, string):
+        lines = string.split(self.split)
+        w = 0
+        for line in lines:
+            x, _ = self._line_size(line)
+            w = max(w, x)
+        return w, (len(lines) * (self._font.height() + self.vgap)) - self.vgap
+
+    def write(self, string, x, y, fg=None, bg=None, tkey=None, halign=None, valign=None):
+        fg = self.fg if fg is None else fg
+        bg = self.bg if bg is None else bg
+        tkey = self.tkey if tkey is None else tkey
+        halign = self.halign if halign is None else halign
+        palette = self._palette(fg, bg)
+        lines = string.split(self.split)
+        high = (len(lines) * (self._font.height() + self.vgap)) - self.vgap
+        ypos = int(y - (high / 2)) if valign == 'center' else y
+        for line in lines:
+            wide, high = self._line_size(line)
+            if halign == 'left':
+                xpos = x
+            elif halign == 'right':
+                xpos = x - wide
+            else:
+                xpos = int(x - (wide / 2))
+            for char in line:
+                cx, _ = self._put_char(char, xpos, ypos, palette, tkey)
+                if cx is not None:
+                    xpos += cx + self.hgap
+            ypos += high + self.vgap
+        return True
+
+CASES = (
+    (helvetica15bold, 2, "18 Oct 2026", "center", "top"),
+    (spleen23, 0, "Wednesday", "center", "top"),
+    (spleen16, 0, "Rain: ", "left", "top"),
+    (spleen12, 0, "  Partly  \n  cloudy.", "center", "center"),
+    (spleen12, 0, "Overnight Low:", "left", "top"),
+)
+
+def per_call(fn):
+    t0 = time.ticks_us()
+    for _ in range(RUNS):
+        fn()
+    return time.ticks_diff(time.ticks_us(), t0) / RUNS
+
+oled = SSD1306_I2C(128, 64, NullI2C(), font=None)
+print("%-22s %-18s %9s %9s %9s %9s" % ("font", "string", "size old", "size new", "write old", "write new"))
+for font, hgap, text, halign, valign in CASES:
+    old = LegacyLayout(oled, font, hgap=hgap)
+    new = ezFBfont(oled, font, hgap=hgap)
+    row = []
+    for writer in (old, new):
+        row.append(per_call(lambda: writer.size(text)))
+    for writer in (old, new):
+        row.append(per_call(lambda: writer.write(text, 64, 30, halign=halign, valign=valign)))
+    print("%-22s %-18s %7.1fus %7.1fus %7.1fus %7.1fus" % ((font.__name__, repr(text)[:18]) + tuple(row)))
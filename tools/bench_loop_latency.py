@@ -0,0 +1,72 @@
+# Worst-case lateness of a clock-like task while four SSD1306 panels are redrawn and flushed,
+# with blocking show() vs. show_async() that yields between pages. The fake bus blocks for
+# the time each transfer would take on a 400 kHz I2C bus.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_loop_latency.py
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import asyncio
+import time
+from hardware.OLED_SSD1306 import SSD1306_I2C
+
+ticks_us, ticks_diff, sleep_us = time.ticks_us, time.ticks_diff, time.sleep_us
+
+US_PER_BYTE = 23        # 9 clocks per byte at 400 kHz
+TICK_MS = 10
+RENDERS = 5
+
+class SlowI2C:
+    def writeto(self, addr, buf):
+        sleep_us((1 + len(buf)) * US_PER_BYTE)
+
+    def writevto(self, addr, bufs):
+        sleep_us((1 + sum(len(b) for b in bufs)) * US_PER_BYTE)
+
+def draw(oled, n):
+    oled.fill(0)
+    oled.fill_rect(0, 0, 128, 16, 1)
+    oled.fill_rect(n, 20, 60, 30, 1)
+
+async def render_blocking(panels, n):
+    for oled in panels:
+        draw(oled, n)
+    for oled in panels:
+        oled.show()
+
+async def render_cooperative(panels, n):
+    for oled in panels:
+        draw(oled, n)
+        await asyncio.sleep(0)
+    for oled in panels:
+        await oled.show_async()
+
+async def measure(render):
+    panels = [SSD1306_I2C(128, 64, SlowI2C()) for _ in range(4)]
+    state = {'worst': 0, 'running': True}
+
+    async def ticker():
+        while state['running']:
+            t0 = ticks_us()
+            await asyncio.sleep(TICK_MS / 1000)
+            late = ticks_diff(ticks_us(), t0) - TICK_MS * 1000
+            state['worst'] = max(state['worst'], late)
+
+    task = asyncio.create_task(ticker())
+    for n in range(RENDERS):
+        await asyncio.sleep(0.05)
+        await render(panels, n)
+    state['running'] = False
+    await task
+    return state['worst']
+
+async def main():
+    blocking = await measure(render_blocking)
+    cooperative = await measure(render_cooperative)
+    print('worst clock tick delay, blocking show():  {:>8} us'.format(blocking))
+    print('worst clock tick delay, show_async():     {:>8} us'.format(cooperative))
+
+asyncio.run(main())
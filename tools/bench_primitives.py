@@ -0,0 +1,87 @@
+# Compares the old per-pixel SSD1306 fill primitives with the page/byte versions.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_primitives.py
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import time
+from hardware.OLED_SSD1306 import SSD1306_I2C
+
+ticks_us, ticks_diff = time.ticks_us, time.ticks_diff
+
+RUNS = 20
+
+class NullI2C:
+    def writeto(self, addr, buf):
+        pass
+
+    def writevto(self, addr, bufs):
+        pass
+
+class LegacySSD1306(SSD1306_I2C):
+    # the pre-primitives drawing methods: everything is a Bresenham line of pixel() calls
+    def line(self, x1, y1, x2, y2, c):
+        steep = abs(y2 - y1) > abs(x2 - x1)
+        if steep:
+            x1, y1 = y1, x1
+            x2, y2 = y2, x2
+        if x1 > x2:
+            x1, x2 = x2, x1
+            y1, y2 = y2, y1
+        dx = x2 - x1
+        dy = abs(y2 - y1)
+        err = dx / 2
+        ystep = 1 if y1 < y2 else -1
+        while x1 <= x2:
+            if steep:
+                self.pixel(y1, x1, c)
+            else:
+                self.pixel(x1, y1, c)
+            err -= dy
+            if err < 0:
+                y1 += ystep
+                err += dx
+            x1 += 1
+
+    def hline(self, x, y, l, c):
+        self.line(x, y, x + l, y, c)
+
+    def vline(self, x, y, h, c):
+        self.line(x, y, x, y + h, c)
+
+    def rect(self, x, y, w, h, c):
+        self.hline(x, y, w, c)
+        self.hline(x, y + h, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w, y, h, c)
+
+    def fill(self, c):
+        for i in range(0, self.height):
+            self.hline(0, i, self.width, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        for i in range(y, y + h):
+            self.hline(x, i, w, c)
+
+def timed(fn):
+    t0 = ticks_us()
+    for _ in range(RUNS):
+        fn()
+    return ticks_diff(ticks_us(), t0) / RUNS
+
+def bench(oled):
+    return (
+        ('fill(0)', timed(lambda: oled.fill(0))),
+        ('fill_rect banner', timed(lambda: oled.fill_rect(0, 0, 128, 16, 1))),
+        ('fill_rect odd', timed(lambda: oled.fill_rect(5, 17, 37, 37, 1))),
+        ('rect', timed(lambda: oled.rect(5, 17, 100, 40, 1))),
+    )
+
+old = bench(LegacySSD1306(128, 64, NullI2C()))
+new = bench(SSD1306_I2C(128, 64, NullI2C()))
+print('{:<18}{:>12}{:>12}{:>9}'.format('primitive', 'old us', 'new us', 'speedup'))
+for (name, t_old), (_, t_new) in zip(old, new):
+    print('{:<18}{:>12.1f}{:>12.1f}{:>8.1f}x'.format(name, t_old, t_new, t_old / max(t_new, 1)))
@@ -0,0 +1,83 @@
+# Heap allocated and time taken by the text of one four-panel render, with the old
+# ezFBfont._put_char (new palette, glyph copy and two FrameBuffers per character)
+# vs. cached palettes and cached zero-copy glyph tuples, and with the fixed labels
+# drawn from the rendered-string cache as render_oleds() does.
+#
+# Run from the repository root under MicroPython (unix port or on the Pico), or CPython:
+#   micropython tools/bench_text_alloc.py
+# Allocation figures need gc.mem_alloc(), so CPython prints timings only, and those are
+# dominated by the framebuf shim's per-pixel Python loops; compare timings on MicroPython.
+
+import sys
+sys.path.insert(0, (__file__.rpartition('/')[0] or '.') + '/..')
+import tools.host   # CPython: framebuf/micropython/time shims
+
+import gc
+import time
+import framebuf
+from hardware.OLED_SSD1306 import SSD1306_I2C
+from functions.string_writer import ezFBfont
+from fonts import spleen12, spleen16, spleen23, helvetica15bold
+
+RUNS = 20
+
+class NullI2C:
+    def writeto(self, addr, buf):
+        pass
+
+    def writevto(self, addr, bufs):
+        pass
+
+class LegacyFont(ezFBfont):
+    def _put_char(self, char, x, y, palette, tkey):
+        glyph, char_height, char_width = self._font.get_ch(char)
+        if glyph is None:
+            return None, None
+        palette_buf = bytearray(self._font_colors * 2)
+        buf = bytearray(glyph)
+        pal = framebuf.FrameBuffer(palette_buf, self._font_colors, 1, self._palette_format)
+        pal.pixel(0, 0, palette.pixel(0, 0))
+        pal.pixel(self._font_colors - 1, 0, palette.pixel(self._font_colors - 1, 0))
+        charbuf = framebuf.FrameBuffer(buf, char_width, char_height, self._font_format)
+        self._device.blit(charbuf, x, y, tkey, pal)
+        return char_width, char_height
+
+def writers(cls, oled):
+    return (cls(oled, helvetica15bold, hgap=2), cls(oled, spleen12), cls(oled, spleen16), cls(oled, spleen23))
+
+def frame_text(head, f12, f16, f23, cache):
+    # the strings render_oleds() puts on the four panels
+    for _ in range(2):
+        head.write("18 Oct 2026", x=64, halign="center", y=1, fg=0, bg=1)
+        f23.write("Saturday", halign="center", y=17, x=64, cache=cache)
+        f16.write("Rain: ", halign="left", y=46, x=4, cache=cache)
+        f23.write("20%", halign="right", y=41, x=123)
+    for _ in range(2):
+        head.write("Brisbane", x=64, halign="center", y=1, fg=0, bg=1, cache=cache)
+        f12.write(" Partly  \n cloudy.", halign="center", valign="center", y=34, x=90)
+        f12.write("Min:", halign="left", y=54, x=55, cache=cache)
+        f16.write("12°C", halign="right", y=53, x=122)
+
+def measure(cls, cache=False):
+    oled = SSD1306_I2C(128, 64, NullI2C(), font=None)
+    fonts = writers(cls, oled) + (cache,)
+    frame_text(*fonts)                  # warm the caches
+    alloc = getattr(gc, "mem_alloc", None)
+    gc.collect()
+    gc.disable()
+    before = alloc() if alloc else 0
+    t0 = time.ticks_us()
+    for _ in range(RUNS):
+        frame_text(*fonts)
+    us = time.ticks_diff(time.ticks_us(), t0) // RUNS
+    used = (alloc() - before) // RUNS if alloc else None
+    gc.enable()
+    return us, used
+
+print("text of one frame, %d runs" % RUNS)
+for label, cls, cache in (("old _put_char", LegacyFont, False), ("cached glyphs", ezFBfont, False),
+                          ("cached labels", ezFBfont, True)):
+    us, used = measure(cls, cache)
+    print("  %-14s %6d us  %s" % (label, us, "%d bytes allocated" % used if used is not None else "(no gc.mem_alloc)"))
+stats = ezFBfont.string_cache_stats()
+print("string cache: %d entries, %d/%d bytes, hit rate %.2f" % (stats["entries"], stats["bytes"], stats["max_bytes"], stats["hit_rate"]))
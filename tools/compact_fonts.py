@@ -0,0 +1,129 @@
+# Host-side font converter: rewrites the fonts/*.py modules from a dict of one bytes object
+# per glyph into one contiguous bytes blob plus an array('H') offset index, with a get_ch()
+# that hands out zero-copy memoryview slices. The header (docstrings, metrics functions) is
+# kept as it is. Reads either format, so it can be re-run after editing a font.
+#
+# Run from the repository root under CPython:
+#   python3 tools/compact_fonts.py [fonts/spleen12.py ...]     (default: every font in fonts/)
+# It checks every glyph of the written module against the source before moving on.
+
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+FONTS = os.path.join(ROOT, 'fonts')
+MARKER = '# Glyph table generated by tools/compact_fonts.py'
+IMPORT = 'from array import array\n'
+PER_LINE = 16
+
+def load(path):
+    spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def glyphs(font, keep=None):
+    # code -> (MONO_HLSB rows, width); trailing extras (helvetica's width byte) dropped and
+    # short glyphs zero-padded to the full height, so every slice covers width x height.
+    # keep: only these chars (a subset, see subset_fonts.py)
+    height = font.height()
+    out = {}
+    for code in range(font.min_ch(), font.max_ch() + 1):
+        if keep is not None and chr(code) not in keep:
+            continue
+        buf, _, width = font.get_ch(chr(code))
+        if buf is None:
+            continue
+        size = (width + 7) // 8 * height
+        rows = bytes(buf[:size])
+        out[code] = (rows + bytes(size - len(rows)), width)
+    return out
+
+def header(path):
+    with open(path) as f:
+        text = f.read()
+    for start in (MARKER, '_g = {'):
+        if start in text:
+            text = text[:text.index(start)]
+            break
+    else:
+        raise ValueError(f'{path}: no glyph table found')
+    text = text.replace(IMPORT, '')
+    if 'def fallback():' in text:      # re-subsetting a subset: drop the old one
+        text = text[:text.index('def fallback():')]
+    # the array import goes just ahead of the first line of code, after the docstrings
+    at = text.index('version = ')
+    return text[:at] + IMPORT + text[at:]
+
+def render(path, keep=None, fallback=None):
+    # the module text for the font at path; a subset when keep is given, answering chars it
+    # doesn't have with the fallback char's glyph (declared through a fallback() function)
+    font = load(path)
+    table = glyphs(font, keep)
+    if fallback is not None and ord(fallback) not in table:
+        raise ValueError(f'{path}: fallback {fallback!r} is not in the subset')
+    lo = font.min_ch()
+    count = font.max_ch() - lo + 1
+    widths = {w for _, w in table.values()}
+    fixed = widths.pop() if len(widths) == 1 else None
+
+    out = [header(path).rstrip('\n') + '\n\n']
+    if fallback is not None:
+        out.append(f'def fallback():\n    return {fallback!r}\n\n')
+    out.append(f'{MARKER}: the MONO_HLSB rows of every\n'
+               f'# glyph back to back in _data; glyph c spans _data[_index[c - {lo}]:_index[c - {lo - 1}]],\n'
+               f'# an empty span means no glyph.\n')
+    out.append('_data = (\n')
+    offsets = [0]
+    for code in range(lo, lo + count):
+        if code in table:
+            rows = table[code][0]
+            char = chr(code) if 32 < code < 127 else ''
+            out.append(f'  {rows!r}  # {code} {char}'.rstrip() + '\n')
+            offsets.append(offsets[-1] + len(rows))
+        else:
+            offsets.append(offsets[-1])
+    out.append(')\n')
+    out.append("_index = array('H', (\n")
+    for i in range(0, len(offsets), PER_LINE):
+        out.append('  ' + ', '.join(str(o) for o in offsets[i:i + PER_LINE]) + ',\n')
+    out.append('))\n')
+    if fixed is None:
+        out.append(f'_widths = {bytes(table[c][1] if c in table else 0 for c in range(lo, lo + count))!r}\n')
+    out.append('_mv = memoryview(_data)\n\n')
+    out.append('def get_ch(ch):\n'
+               f'    i = ord(ch) - {lo}\n'
+               f'    if 0 <= i < {count}:\n'
+               '        start = _index[i]\n'
+               '        end = _index[i + 1]\n'
+               '        if end > start:\n')
+    width = str(fixed) if fixed is not None else '_widths[i]'
+    out.append(f'            return _mv[start:end], {font.height()}, {width}\n'
+               '    return None, 0, 0\n')
+    return font, table, ''.join(out)
+
+def check(path, font, table):
+    new = load(path)
+    for name in ('height', 'baseline', 'max_width', 'hmap', 'reverse', 'monospaced', 'min_ch', 'max_ch'):
+        if getattr(new, name)() != getattr(font, name)():
+            raise AssertionError(f'{path}: {name}() changed')
+    for code in range(font.min_ch() - 1, font.max_ch() + 2):
+        buf, height, width = new.get_ch(chr(code))
+        if code not in table:
+            if buf is not None:
+                raise AssertionError(f'{path}: unexpected glyph {code}')
+        elif (bytes(buf), width, height) != (table[code][0], table[code][1], font.height()):
+            raise AssertionError(f'{path}: glyph {code} differs')
+
+def main(paths):
+    for path in paths or sorted(os.path.join(FONTS, n) for n in os.listdir(FONTS) if n.endswith('.py')):
+        font, table, text = render(path)
+        with open(path, 'w') as f:
+            f.write(text)
+        check(path, font, table)
+        print(f'{os.path.relpath(path, ROOT)}: {len(table)} glyphs, '
+              f'{sum(len(rows) for rows, _ in table.values())} bytes')
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,80 @@
+# Host-side asset compiler: turns graphics/*.pbm and graphics/font-pet-me-128.dat into
+# graphics/assets.py, a module of bytes constants already in the SSD1306 framebuffer's
+# native MONO_VLSB layout, plus an index table. Freeze it into the firmware (or mpy-cross it)
+# and the drivers read the bitmaps zero-copy through memoryview instead of doing file I/O.
+#
+# Run from the repository root under CPython after changing anything in graphics/:
+#   python3 tools/compile_assets.py
+
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+GRAPHICS = os.path.join(ROOT, 'graphics')
+FONT_FILE = 'font-pet-me-128.dat'
+OUTPUT = os.path.join(GRAPHICS, 'assets.py')
+CHUNK = 32
+
+def pbm_to_vlsb(path):
+    # ASCII (P1) PBM -> (MONO_VLSB bytes, width, height)
+    with open(path) as f:
+        tokens = []
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                tokens.append(line)
+    if tokens[0] != 'P1':
+        raise ValueError(f'{path}: only ASCII PBM (P1) supported')
+    width, height = map(int, tokens[1].split())
+    bits = ''.join(ch for ch in ''.join(tokens[2:]) if ch in '01')
+    if len(bits) != width * height:
+        raise ValueError(f'{path}: pixel data does not match width*height ({len(bits)} != {width * height})')
+    buf = bytearray(((height + 7) // 8) * width)
+    for y in range(height):
+        for x in range(width):
+            if bits[y * width + x] == '1':
+                buf[(y >> 3) * width + x] |= 1 << (y & 7)
+    return bytes(buf), width, height
+
+def bytes_literal(name, data):
+    lines = [f'{name} = (']
+    for i in range(0, len(data), CHUNK):
+        lines.append(f'    {data[i:i + CHUNK]!r}')
+    lines.append(')')
+    return '\n'.join(lines)
+
+def main():
+    with open(os.path.join(GRAPHICS, FONT_FILE), 'rb') as f:
+        font = f.read()
+
+    blob = bytearray()
+    index = []
+    for filename in sorted(os.listdir(GRAPHICS)):
+        if not filename.endswith('.pbm'):
+            continue
+        data, width, height = pbm_to_vlsb(os.path.join(GRAPHICS, filename))
+        index.append((filename[:-4], len(blob), width, height))
+        blob += data
+
+    out = [
+        '# Code generated by tools/compile_assets.py from the graphics/ folder - do not edit.',
+        '# Bitmaps are MONO_VLSB: one byte per column per 8-pixel page, pages top to bottom.',
+        '',
+        f'# {FONT_FILE}: 8 column bytes per glyph, from chr(32)',
+        bytes_literal('FONT_PET_ME', font),
+        '',
+        '# all icons back to back; ICONS maps name -> (offset, width, height) into ICON_DATA',
+        bytes_literal('ICON_DATA', bytes(blob)),
+        '',
+        'ICONS = {',
+    ]
+    for name, offset, width, height in index:
+        out.append(f'    {name!r}: ({offset}, {width}, {height}),')
+    out.append('}')
+    out.append('')
+    with open(OUTPUT, 'w') as f:
+        f.write('\n'.join(out))
+    print(f'{os.path.relpath(OUTPUT, ROOT)}: {len(index)} icons, {len(blob)} icon bytes, {len(font)} font bytes')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,20 @@
+# Host-side (CPython) backend: importing this package makes the MicroPython-only modules
+# (framebuf, micropython, machine) resolvable from the shims in this folder, and adds
+# the MicroPython time.ticks_*/sleep_* functions. On MicroPython it changes nothing,
+# so scripts can import it unconditionally.
+
+import sys
+import time
+
+try:
+    import framebuf
+except ImportError:
+    sys.path.insert(0, __file__.rpartition('/')[0])
+
+if not hasattr(time, "ticks_us"):
+    time.ticks_us = lambda: time.perf_counter_ns() // 1000
+    time.ticks_ms = lambda: time.perf_counter_ns() // 1000000
+    time.ticks_diff = lambda a, b: a - b
+    time.ticks_add = lambda a, b: a + b
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
@@ -0,0 +1,164 @@
+# Pure-Python stand-in for MicroPython's framebuf module, so the display drivers and
+# ezFBfont run unchanged under CPython. Slow, but pixel-exact for the formats used here.
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+MONO_VMSB = MONO_VLSB
+
+_BPP = {MONO_VLSB: 1, RGB565: 16, GS4_HMSB: 4, MONO_HLSB: 1, MONO_HMSB: 1, GS2_HMSB: 2, GS8: 8}
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in _BPP:
+            raise ValueError("invalid format")
+        self._buf = buffer
+        self._w = width
+        self._h = height
+        self._fmt = format
+        stride = width if stride is None else stride
+        # as in framebuf.c, sub-byte horizontal formats round the stride up to whole bytes
+        if format in (MONO_HLSB, MONO_HMSB):
+            stride = (stride + 7) & ~7
+        elif format == GS2_HMSB:
+            stride = (stride + 3) & ~3
+        elif format == GS4_HMSB:
+            stride = (stride + 1) & ~1
+        self._stride = stride
+
+    def _index(self, x, y):
+        # (byte index, bit shift, bit mask) of a pixel
+        s = self._stride
+        fmt = self._fmt
+        if fmt == MONO_VLSB:
+            return (y >> 3) * s + x, y & 7, 0x01
+        if fmt == MONO_HLSB:
+            return (y * s + x) >> 3, 7 - (x & 7), 0x01
+        if fmt == MONO_HMSB:
+            return (y * s + x) >> 3, x & 7, 0x01
+        if fmt == GS2_HMSB:
+            return (y * s + x) >> 2, (x & 3) << 1, 0x03
+        if fmt == GS4_HMSB:
+            return (y * s + x) >> 1, 0 if x & 1 else 4, 0x0F
+        return None, 0, 0
+
+    def _get(self, x, y):
+        fmt = self._fmt
+        if fmt == RGB565:
+            i = (y * self._stride + x) * 2
+            return self._buf[i] | (self._buf[i + 1] << 8)
+        if fmt == GS8:
+            return self._buf[y * self._stride + x]
+        i, shift, mask = self._index(x, y)
+        return (self._buf[i] >> shift) & mask
+
+    def _set(self, x, y, c):
+        fmt = self._fmt
+        buf = self._buf
+        if fmt == RGB565:
+            i = (y * self._stride + x) * 2
+            buf[i] = c & 0xFF
+            buf[i + 1] = (c >> 8) & 0xFF
+        elif fmt == GS8:
+            buf[y * self._stride + x] = c & 0xFF
+        else:
+            i, shift, mask = self._index(x, y)
+            buf[i] = (buf[i] & ~(mask << shift) & 0xFF) | ((c & mask) << shift)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self._w)
+        y1 = min(y + h, self._h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self._w, self._h, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def scroll(self, xstep, ystep):
+        src = FrameBuffer(bytearray(self._buf), self._w, self._h, self._fmt, self._stride)
+        for y in range(self._h):
+            for x in range(self._w):
+                sx = x - xstep
+                sy = y - ystep
+                if 0 <= sx < self._w and 0 <= sy < self._h:
+                    self._set(x, y, src._get(sx, sy))
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        # fbuf is a FrameBuffer or a (buffer, width, height, format[, stride]) tuple
+        if isinstance(fbuf, (tuple, list)):
+            # framebuf.c takes a tuple's stride as given (default: the width), without rounding
+            buf, w, h, fmt = fbuf[:4]
+            stride = fbuf[4] if len(fbuf) > 4 else w
+            fbuf = FrameBuffer(buf, w, h, fmt)
+            fbuf._stride = stride
+        for sy in range(max(0, -y), min(fbuf._h, self._h - y)):
+            for sx in range(max(0, -x), min(fbuf._w, self._w - x)):
+                c = fbuf._get(sx, sy)
+                if palette is not None:
+                    c = palette._get(c, 0)
+                if c != key:
+                    self._set(x + sx, y + sy, c)
+
+    def text(self, s, x, y, c=1):
+        # framebuf's built-in font is the 8x8 petme128 that graphics/assets.py holds as FONT_PET_ME:
+        # 8 MONO_VLSB column bytes per char from chr(32); anything outside 32..127 draws as 127
+        from graphics.assets import FONT_PET_ME
+        for ch in str(s):
+            code = ord(ch)
+            if code < 32 or code > 127:
+                code = 127
+            base = (code - 32) * 8
+            for col in range(8):
+                bits = FONT_PET_ME[base + col]
+                if 0 <= x + col < self._w:
+                    for row in range(8):
+                        if bits >> row & 1 and 0 <= y + row < self._h:
+                            self._set(x + col, y + row, c)
+            x += 8
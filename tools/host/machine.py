@@ -0,0 +1,34 @@
+# CPython stand-in for the parts of MicroPython's machine module the drivers touch.
+# I2C(id, ...) hands back one shared FakeI2C per bus id, so host scripts can attach
+# virtual devices to BUSES[id] before constructing the real drivers.
+
+from virtual_bus import FakeI2C
+
+BUSES = {}
+
+def I2C(id=0, scl=None, sda=None, freq=400000, timeout=50000):
+    bus = BUSES.get(id)
+    if bus is None:
+        bus = BUSES[id] = FakeI2C(freq)
+    return bus
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+
+    def __init__(self, id, mode=-1, pull=None, value=None):
+        self.id = id
+        self._value = 0 if value is None else value
+
+    def init(self, mode=-1, pull=None, value=None):
+        if value is not None:
+            self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = v
+
+    def __call__(self, v=None):
+        return self.value(v)
@@ -0,0 +1,9 @@
+# CPython stand-in for the micropython module.
+
+def const(value):
+    return value
+
+def native(fn):
+    return fn
+
+viper = native
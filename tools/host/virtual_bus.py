@@ -0,0 +1,94 @@
+# A fake I2C bus for host-side runs: devices attach by address (or behind a virtual
+# TCA9548A multiplexer), and every transaction is captured for counting and replay.
+
+class FakeI2C:
+    def __init__(self, freq=400000):
+        self.freq = freq
+        self.devices = {}
+        self.muxes = []
+        self.log = []           # (addr, bytes) of every write, in order
+        self.keep_log = True
+        self.transactions = 0
+        self.bytes = 0          # on the wire: address byte + payload
+
+    def attach(self, addr, device):
+        self.devices[addr] = device
+        if isinstance(device, VirtualTCA9548A):
+            self.muxes.append(device)
+        return device
+
+    def _targets(self, addr):
+        if addr in self.devices:
+            return (self.devices[addr],)
+        targets = []
+        for mux in self.muxes:
+            targets.extend(mux.targets(addr))
+        if not targets:
+            raise OSError(19)   # ENODEV, as machine.I2C raises for a missing device
+        return targets
+
+    def writeto(self, addr, buf, stop=True):
+        data = bytes(buf)
+        self.transactions += 1
+        self.bytes += 1 + len(data)
+        if self.keep_log:
+            self.log.append((addr, data))
+        for device in self._targets(addr):
+            device.write(data)
+        return len(data)
+
+    def writevto(self, addr, vector, stop=True):
+        return self.writeto(addr, b"".join(bytes(b) for b in vector), stop)
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        return self.writeto(addr, bytes((memaddr,)) + bytes(buf))
+
+    def readfrom(self, addr, nbytes, stop=True):
+        self.transactions += 1
+        self.bytes += 1 + nbytes
+        return self._targets(addr)[0].read(nbytes)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        self.writeto(addr, bytes((memaddr,)))
+        return self.readfrom(addr, nbytes)
+
+    def scan(self):
+        found = set(self.devices)
+        for mux in self.muxes:
+            found.update(mux.visible())
+        return sorted(found)
+
+    def bus_time_us(self):
+        # 9 clocks per byte, ignoring start/stop conditions and clock stretching
+        return self.bytes * 9 * 1000000 // self.freq
+
+    def reset_counts(self):
+        self.log.clear()
+        self.transactions = 0
+        self.bytes = 0
+
+class VirtualTCA9548A:
+    # 8-channel mux: one control byte, bit n enables channel n; several may be on at once
+    def __init__(self):
+        self.mask = 0
+        self.channels = [dict() for _ in range(8)]
+        self.selects = 0
+
+    def attach(self, channel, addr, device):
+        self.channels[channel][addr] = device
+        return device
+
+    def targets(self, addr):
+        return [devices[addr] for n, devices in enumerate(self.channels)
+                if self.mask & (1 << n) and addr in devices]
+
+    def visible(self):
+        return [addr for n, devices in enumerate(self.channels) if self.mask & (1 << n) for addr in devices]
+
+    def write(self, data):
+        if data:
+            self.mask = data[-1]
+            self.selects += 1
+
+    def read(self, nbytes):
+        return bytes((self.mask,)) * nbytes
@@ -0,0 +1,151 @@
+# A virtual SSD1306 panel: decodes the I2C byte stream the way the controller does and
+# keeps its own display RAM, so what ends up on screen can be saved as PBM or PNG
+# and compared against golden frames.
+
+import struct
+import zlib
+
+# argument bytes taken by the multi-byte commands
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5, 0x81: 1, 0x8D: 1,
+    0xA3: 2, 0xA8: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1,
+}
+
+class VirtualSSD1306:
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.ram = bytearray(width * self.pages)
+        self.on = False
+        self.inverted = False
+        self.contrast = 0x7F
+        self.scrolling = False
+        self.mode = 2                       # page addressing after reset
+        self.col_start, self.col_end = 0, width - 1
+        self.page_start, self.page_end = 0, self.pages - 1
+        self.col = 0
+        self.page = 0
+        self._cmd = []
+        self.commands = 0
+        self.data_bytes = 0
+
+    # --- I2C side ---
+
+    def write(self, data):
+        i = 0
+        while i < len(data):
+            control = data[i]
+            i += 1
+            if control & 0x80:
+                # Co=1: a single byte, then another control byte
+                if i < len(data):
+                    self._byte(data[i], control & 0x40)
+                    i += 1
+            else:
+                # Co=0: the rest of the transfer is all commands or all data
+                is_data = control & 0x40
+                for b in data[i:]:
+                    self._byte(b, is_data)
+                return
+
+    def read(self, nbytes):
+        return bytes((0x43 if self.on else 0x03,)) * nbytes    # status register
+
+    def _byte(self, b, is_data):
+        if is_data:
+            self._data(b)
+        else:
+            self._command(b)
+
+    def _data(self, b):
+        self.data_bytes += 1
+        self.ram[self.page * self.width + self.col] = b
+        if self.mode == 2:
+            self.col = min(self.col + 1, self.width - 1)
+            return
+        self.col += 1
+        if self.col > self.col_end:
+            self.col = self.col_start
+            self.page += 1
+            if self.page > self.page_end:
+                self.page = self.page_start
+
+    def _command(self, b):
+        cmd = self._cmd
+        cmd.append(b)
+        if len(cmd) <= _ARGS.get(cmd[0], 0):
+            return
+        self._cmd = []
+        self.commands += 1
+        op = cmd[0]
+        if op == 0x20:
+            self.mode = cmd[1] & 0x03
+        elif op == 0x21:
+            self.col_start, self.col_end = cmd[1], cmd[2]
+            self.col = self.col_start
+        elif op == 0x22:
+            self.page_start, self.page_end = cmd[1] & 0x07, cmd[2] & 0x07
+            self.page = self.page_start
+        elif op == 0x81:
+            self.contrast = cmd[1]
+        elif op in (0xAE, 0xAF):
+            self.on = op == 0xAF
+        elif op in (0xA6, 0xA7):
+            self.inverted = op == 0xA7
+        elif op == 0x2E:
+            self.scrolling = False
+        elif op == 0x2F:
+            self.scrolling = True
+        elif 0xB0 <= op <= 0xB7:
+            self.page = op & 0x07
+        elif op <= 0x0F:
+            self.col = (self.col & 0xF0) | op
+        elif op <= 0x1F:
+            self.col = (self.col & 0x0F) | ((op & 0x0F) << 4)
+
+    # --- frames ---
+
+    def pixel(self, x, y):
+        value = (self.ram[(y >> 3) * self.width + x] >> (y & 7)) & 1
+        return value ^ 1 if self.inverted else value
+
+    def rows(self):
+        # the frame as rows of 0/1, top to bottom
+        return [[self.pixel(x, y) for x in range(self.width)] for y in range(self.height)]
+
+    def to_pbm(self):
+        # binary (P4) PBM; in PBM 1 is black, so lit pixels are written as 0
+        out = bytearray(b"P4\n%d %d\n" % (self.width, self.height))
+        for row in self.rows():
+            for x in range(0, self.width, 8):
+                byte = 0
+                for bit in range(8):
+                    if x + bit < self.width and not row[x + bit]:
+                        byte |= 0x80 >> bit
+                out.append(byte)
+        return bytes(out)
+
+    def to_png(self, scale=4):
+        # greyscale PNG with lit pixels white, each pixel scale x scale
+        raw = bytearray()
+        for row in self.rows():
+            line = bytearray()
+            for value in row:
+                line += (b"\xff" if value else b"\x00") * scale
+            for _ in range(scale):
+                raw += b"\x00" + line
+        def chunk(kind, body):
+            return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+        header = struct.pack(">IIBBBBB", self.width * scale, self.height * scale, 8, 0, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) +
+                chunk(b"IDAT", zlib.compress(bytes(raw))) + chunk(b"IEND", b""))
+
+    def save(self, path, scale=4):
+        with open(path, "wb") as f:
+            f.write(self.to_png(scale) if path.endswith(".png") else self.to_pbm())
+
+    def matches(self, path):
+        # compare against a golden PBM written by save()
+        with open(path, "rb") as f:
+            return f.read() == self.to_pbm()
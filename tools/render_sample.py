@@ -0,0 +1,161 @@
+# Headless render of the four OLED panels under CPython: the real I2CMultiplex, SSD1306_I2C
+# and widget code drive virtual TCA9548A/SSD1306 devices on a fake bus. Prints the render
+# time and bus traffic, saves each panel's frame, and diffs the frames against golden PBMs.
+# Then steps the scrolling forecast text a few times and checks the scrolled frames too.
+#
+# Run from anywhere:
+#   python3 tools/render_sample.py [--out DIR] [--update-golden] [--trace] [--profile]
+
+import argparse
+import os
+import sys
+import time
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TOOLS))
+import tools.host  # noqa: F401  (framebuf/machine/micropython shims)
+
+from machine import I2C
+from virtual_bus import VirtualTCA9548A
+from virtual_ssd1306 import VirtualSSD1306
+
+from hardware.MUX_TCA9548A import I2CMultiplex
+from hardware.I2C_TRACER import TracedI2C
+import functions.profiler as Profiler
+from hardware.OLED_SSD1306 import SSD1306_I2C, BANNER_HEIGHT, broadcast_shared
+from functions.widgets import Panel, Band, Text, WrappedText, Icon, Value
+from fonts import spleen12, spleen16, spleen23, helvetica15bold
+
+GOLDEN = os.path.join(TOOLS, 'golden')
+SCROLL_STEPS = 3
+PANELS = {'TL': 2, 'TR': 3, 'BL': 0, 'BR': 1}      # mux channel of each panel, as in main.py
+
+# a fixed forecast, standing in for main.py's globals
+SAMPLE = {
+    'TD': ('Saturday', '18 Oct 2026', 20, 'partly-cloudy-day-37', 'Partly cloudy.', 12),
+    'TM': ('Sunday', '19 Oct 2026', 60, 'rain-37', 'Showers increasing. Possible storm later in the afternoon.', 14),  # too long: scrolls
+    'location': 'Brisbane',
+}
+
+def build_bus():
+    # bus 1 carries the mux, with one virtual panel per channel
+    bus = I2C(1)
+    mux_dev = bus.attach(0x70, VirtualTCA9548A())
+    screens = {name: mux_dev.attach(channel, 0x3C, VirtualSSD1306()) for name, channel in PANELS.items()}
+    return bus, screens
+
+def scene(oleds):
+    # mirrors the OLED SCENE in main.py, with SAMPLE in place of the globals
+    panels = []
+    for name, day in (('TL', 'TD'), ('BL', 'TM')):
+        dow, header, rain, _, _, _ = SAMPLE[day]
+        oled = oleds[name]
+        y = 41 if name == 'TL' else 42
+        panels.append(Panel(oled, [
+            Band(oled, lambda header=header: header, helvetica15bold),
+            Text(oled, 0, 17, 128, 23, lambda dow=dow: dow, spleen23, halign="center", cache=True),
+            Value(oled, 4, y, 119, 64 - y, lambda rain=rain: rain, spleen23, unit="%", label="Rain: ",
+                  label_font=spleen16, label_dy=5),
+        ]))
+    for name, day in (('TR', 'TD'), ('BR', 'TM')):
+        _, _, _, icon, text, low = SAMPLE[day]
+        oled = oleds[name]
+        panels.append(Panel(oled, [
+            Band(oled, lambda: SAMPLE['location'], helvetica15bold),
+            Icon(oled, 5, 16, 45, 37, lambda icon=icon: icon),
+            WrappedText(oled, 54, 16, 72, 36, lambda text=text: text, spleen12, overflow="scroll"),
+            Value(oled, 4, 53, 119, 11, lambda low=low: low, spleen16, unit="°C", label="Min:",
+                  label_font=spleen12, label_dy=1),
+        ]))
+    return panels
+
+def render(panels, band, shared):
+    # mirrors render_oleds() in main.py; shared: the panels band broadcasts to
+    for panel in panels:
+        panel.refresh()
+    broadcast_shared(band, shared)
+    for panel in panels:
+        panel.device.show()
+
+def scroll(panels, steps):
+    # mirrors scroll_oleds() in main.py: the panels whose text moved on every step
+    moved = set()
+    for _ in range(steps):
+        for panel in panels:
+            if any(w.scroll() for w in panel.widgets if isinstance(w, WrappedText)):
+                panel.device.show()
+                moved.add(panel)
+    return moved
+
+def check(screens, names, suffix, args):
+    # save the frames and diff them against golden/<name><suffix>.pbm; returns the names that differ
+    failed = []
+    for name in names:
+        screen = screens[name]
+        screen.save(os.path.join(args.out, name + suffix + '.png'))
+        screen.save(os.path.join(args.out, name + suffix + '.pbm'))
+        golden = os.path.join(GOLDEN, name + suffix + '.pbm')
+        if args.update_golden:
+            screen.save(golden)
+        elif os.path.exists(golden) and not screen.matches(golden):
+            failed.append(name + suffix)
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--out', default='host_frames', help='where to write <panel>.png/.pbm')
+    parser.add_argument('--update-golden', action='store_true', help='overwrite the golden frames')
+    parser.add_argument('--trace', action='store_true', help='print per-address bus stats for the render pass')
+    parser.add_argument('--profile', action='store_true', help='print the render profiler spans for the render pass')
+    args = parser.parse_args()
+
+    bus, screens = build_bus()
+    mux = I2CMultiplex(0x70, I2Cbus=1)
+    if args.trace:
+        mux.i2c = TracedI2C(mux.i2c, 'I2C1', bus.freq)
+    oleds = {name: SSD1306_I2C(128, 64, mux.channel(channel), init=False) for name, channel in PANELS.items()}
+    for oled in oleds.values():
+        oled.set_diff_mode()        # as in main.py
+    band = SSD1306_I2C(128, BANNER_HEIGHT, mux.broadcast((PANELS['TR'], PANELS['BR'])), font=None, init=False)
+    boot = SSD1306_I2C(128, 64, mux.broadcast(PANELS.values()), font=None)    # boot: one init and clear for all panels
+    for oled in oleds.values():
+        oled.frame_sent(boot.buffer)
+    del boot
+    panels = scene(oleds)
+    if args.profile:
+        Profiler.enable()
+        for name, oled in oleds.items():
+            oled.span = Profiler.span('show ' + name)
+
+    bus.reset_counts()
+    if args.trace:
+        mux.i2c.reset()
+    t0 = time.perf_counter()
+    render(panels, band, (oleds['TR'], oleds['BR']))
+    elapsed = time.perf_counter() - t0
+    print(f'render pass: {elapsed * 1000:.1f} ms host time, {bus.transactions} transactions, '
+          f'{bus.bytes} bytes, ~{bus.bus_time_us() / 1000:.1f} ms at {bus.freq // 1000} kHz')
+    if args.trace:
+        print('\n'.join(mux.i2c.summary()))
+    if args.profile:
+        print('\n'.join(Profiler.summary()))
+
+    os.makedirs(args.out, exist_ok=True)
+    if args.update_golden:
+        os.makedirs(GOLDEN, exist_ok=True)
+    failed = check(screens, screens, '', args)
+
+    bus.reset_counts()
+    moved = scroll(panels, SCROLL_STEPS)
+    names = [name for name, oled in oleds.items() if any(p.device is oled for p in moved)]
+    print(f'{SCROLL_STEPS} scroll steps on {", ".join(names) or "no panel"}: {bus.transactions} transactions, '
+          f'{bus.bytes} bytes')
+    failed += check(screens, names, '_scroll', args)
+    print(f'frames written to {args.out}/')
+    if failed:
+        print('differs from golden:', ', '.join(failed))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
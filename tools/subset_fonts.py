@@ -0,0 +1,59 @@
+# Host-side font subsetter: writes trimmed copies of the fonts holding only the chars each
+# font's role on the clock can show, plus a fallback glyph that ezFBfont draws in place of
+# anything else. The role charsets are built from main.py's DAYS_OF_WEEK / MONTHS_OF_YEAR,
+# digits and the alphabet of BoM location names; fonts without a role are copied whole.
+#
+# Run from the repository root under CPython:
+#   python3 tools/subset_fonts.py [--out DIR]        (default: build/fonts)
+# then copy DIR/*.py over fonts/ on the Pico. fonts/ in the repository stays complete.
+
+import argparse
+import ast
+import os
+import string
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from compact_fonts import FONTS, ROOT, check, render
+
+def main_constant(name):
+    # a literal assigned in main.py, read without importing it (main.py starts the hardware)
+    with open(os.path.join(ROOT, 'main.py')) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise KeyError(name)
+
+DIGITS = string.digits + '-'
+LOCATION = string.ascii_letters + " '-.,()/"
+FALLBACK = '?'
+
+# font -> (what it draws, chars it keeps); the fallback is added to every set
+ROLES = {
+    'spleen23': ('day names, rain %', ''.join(main_constant('DAYS_OF_WEEK')) + DIGITS + '%'),
+    'spleen16': ('"Rain: ", min temperature', 'Rain: ' + DIGITS + '°C'),
+    'helvetica15bold': ('date header, location name',
+                        ''.join(main_constant('MONTHS_OF_YEAR')) + DIGITS + ' ' + LOCATION),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--out', default=os.path.join(ROOT, 'build', 'fonts'), help='where to write the fonts')
+    args = parser.parse_args()
+    os.makedirs(args.out, exist_ok=True)
+    for name in sorted(n[:-3] for n in os.listdir(FONTS) if n.endswith('.py')):
+        source = os.path.join(FONTS, name + '.py')
+        target = os.path.join(args.out, name + '.py')
+        role, keep = ROLES.get(name, ('everything', None))
+        if keep is None:
+            font, table, text = render(source)
+        else:
+            font, table, text = render(source, set(keep + FALLBACK), FALLBACK)
+        with open(target, 'w') as f:
+            f.write(text)
+        check(target, font, table)
+        print(f'{name:16} {len(table):3} glyphs {sum(len(rows) for rows, _ in table.values()):5} bytes  ({role})')
+
+if __name__ == '__main__':
+    main()